@@ -10,6 +10,7 @@ from ogl.sd.OglSDInstance import OglSDInstance
 from untanglepyut.Types import GraphicInformation
 
 from untanglepyut.UnTangleIO import UnTangleIO
+from untanglepyut.XmlSchema import XmlSchema
 from untanglepyut.XmlVersion import XmlVersion
 
 
@@ -19,7 +20,8 @@ class BaseUnTangle(UnTangleIO):
         super().__init__()
         self.baseLogger: Logger = getLogger(__name__)
 
-        self._xmlVersion = xmlVersion
+        self._xmlVersion: XmlVersion = xmlVersion
+        self._schema:     XmlSchema  = XmlSchema.forVersion(xmlVersion)
 
     def _updateModel(self, oglObject: OglObject | OglSDInstance, graphicInformation: GraphicInformation) -> ShapeModel:
         """
@@ -0,0 +1,182 @@
+
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from codecs import IncrementalDecoder
+from codecs import getincrementaldecoder
+
+from collections import deque
+
+from xml.etree.ElementTree import XMLPullParser
+
+from xml.parsers.expat import ParserCreate
+from xml.parsers.expat import XMLParserType
+
+from defusedxml.common import EntitiesForbidden
+from defusedxml.common import ExternalReferenceForbidden
+
+from untanglepyut import XmlConstants
+
+from untanglepyut.ElementTreeElement import ElementTreeElement
+
+from untanglepyut.IndexedDocument import IndexedDocument
+from untanglepyut.IndexedDocument import TagIndex
+from untanglepyut.IndexedDocument import createTagIndex
+from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from untanglepyut.XmlBackend import XmlChunk
+
+
+class _PrologEnded(Exception):
+    pass
+
+
+class ElementTreeDocumentStream:
+    """
+    The ElementTree backend for the PyutDocumentStream contract.  XMLPullParser builds the
+    elements in C;  Each PyutDocument is removed from the project element as soon as it ends,
+    its children are indexed in a single pass and it is handed out as an IndexedDocument.
+
+    Like `untangle`, entity declarations and external references are forbidden;  A separate expat
+    parser reads only the prolog, since that is the only place a DTD can declare them
+    """
+    def __init__(self, encoding: str = cast(str, None)):
+        """
+
+        Args:
+            encoding:  Overrides the encoding in the XML declaration
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._pullParser:   Any                = self._createPullParser()
+        self._prologParser: XMLParserType      = self._createPrologParser()
+        self._decoder:      IncrementalDecoder = cast(IncrementalDecoder, None)
+        if encoding is not None:
+            self._decoder = getincrementaldecoder(encoding)()
+
+        self._pyutProject:        ElementTreeElement        = cast(ElementTreeElement, None)
+        self._pyutProjectElement: Any                       = None
+        self._depth:              int                       = 0
+        self._documents:          deque[IndexedDocument]    = deque()
+
+    @property
+    def pyutProject(self) -> ElementTreeElement:
+        """
+        Returns: `None` until the PyutProject start tag has been parsed
+        """
+        return self._pyutProject
+
+    def feed(self, xmlChunk: XmlChunk):
+        """
+        Args:
+            xmlChunk:  Any sized chunk of the raw XML
+        """
+        if self._decoder is not None and isinstance(xmlChunk, str) is False:
+            xmlChunk = self._decoder.decode(cast(bytes, xmlChunk))
+
+        parserInput: XmlChunk = self._toParserInput(xmlChunk)
+        if self._prologParser is not None:
+            self._parseProlog(parserInput)
+
+        self._pullParser.feed(parserInput)
+        self._readEvents()
+
+    def close(self):
+        if self._decoder is not None:
+            self._pullParser.feed(self._decoder.decode(b'', True))
+
+        self._pullParser.close()
+        self._readEvents()
+
+    def popDocuments(self) -> List[IndexedDocument]:
+        """
+        Returns:  The PyutDocument elements completed since the last call;  May be empty
+        """
+        documents: List[IndexedDocument] = list(self._documents)
+        self._documents.clear()
+
+        return documents
+
+    def documents(self, xmlChunks: Iterable[XmlChunk]) -> Iterator[IndexedDocument]:
+        """
+        Args:
+            xmlChunks:  The raw XML in one or more pieces
+
+        Returns:  A PyutDocument iterator
+        """
+        for xmlChunk in xmlChunks:
+            self.feed(xmlChunk)
+            yield from self.popDocuments()
+
+        self.close()
+        yield from self.popDocuments()
+
+    def _createPullParser(self) -> Any:
+        return XMLPullParser(events=('start', 'end'))
+
+    def _createPrologParser(self) -> XMLParserType:
+
+        prologParser: XMLParserType = ParserCreate()
+
+        prologParser.StartElementHandler      = self._endProlog
+        prologParser.EntityDeclHandler        = self._forbidEntityDeclaration
+        prologParser.ExternalEntityRefHandler = self._forbidExternalReference
+
+        return prologParser
+
+    def _parseProlog(self, xmlChunk: XmlChunk):
+        """
+        Stops parsing at the PyutProject start tag;  After that the prolog parser is dropped
+
+        Args:
+            xmlChunk:  The chunk the pull parser is about to see
+        """
+        try:
+            self._prologParser.Parse(xmlChunk, False)
+        except _PrologEnded:
+            self._prologParser = cast(XMLParserType, None)
+
+    def _toParserInput(self, xmlChunk: XmlChunk) -> XmlChunk:
+        return xmlChunk
+
+    def _readEvents(self):
+
+        for event, element in self._pullParser.read_events():
+            if event == 'start':
+                if self._depth == 0:
+                    if element.tag != XmlConstants.ELEMENT_PROJECT:
+                        raise UnsupportedFileTypeException(message=f'Not a Pyut project: {element.tag}')
+                    self._pyutProjectElement = element
+                    self._pyutProject        = ElementTreeElement(element)
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 1 and element.tag == XmlConstants.ELEMENT_DOCUMENT:
+                    self._pyutProjectElement.remove(element)
+                    self._documents.append(self._indexDocument(element))
+
+    def _indexDocument(self, element: Any) -> IndexedDocument:
+
+        tagIndex: TagIndex = createTagIndex()
+        for child in element:
+            if isinstance(child.tag, str):
+                tagIndex.setdefault(child.tag, []).append(ElementTreeElement(child))
+
+        return IndexedDocument(pyutDocument=ElementTreeElement(element), tagIndex=tagIndex)
+
+    # noinspection PyUnusedLocal
+    def _endProlog(self, name, attributes):
+        raise _PrologEnded()
+
+    # noinspection PyUnusedLocal
+    def _forbidEntityDeclaration(self, name, isParameterEntity, value, base, sysId, pubId, notationName):
+        raise EntitiesForbidden(name, value, base, sysId, pubId, notationName)
+
+    def _forbidExternalReference(self, context, base, sysId, pubId):
+        raise ExternalReferenceForbidden(context, base, sysId, pubId)
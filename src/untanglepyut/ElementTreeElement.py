@@ -0,0 +1,58 @@
+
+from typing import List
+from typing import cast
+
+from xml.etree.ElementTree import Element
+
+from untanglepyut.XmlBackend import XmlElement
+
+
+class ElementTreeElement:
+    """
+    Adapts an ElementTree (or lxml) element to the XmlElement protocol.  The adapter is
+    a single slot;  Children are wrapped as they are asked for
+    """
+    __slots__ = ('_element', )
+
+    def __init__(self, element: Element):
+        self._element: Element = element
+
+    @property
+    def element(self) -> Element:
+        """
+        Returns:  The wrapped backend element
+        """
+        return self._element
+
+    @property
+    def cdata(self) -> str:
+        """
+        Like `untangle` this is the element text plus the text that follows each child
+
+        Returns:  The character data directly inside the element
+        """
+        cdata: str = self._element.text or ''
+        for child in self._element:
+            cdata += child.tail or ''
+
+        return cdata
+
+    def get_elements(self, name: str = cast(str, None)) -> List[XmlElement]:
+        """
+        Comments and processing instructions (lxml) do not have a string tag and are never children
+
+        Args:
+            name:  A tag name;  When `None` all the children
+
+        Returns:  The wrapped child elements
+        """
+        if name is None:
+            return [ElementTreeElement(child) for child in self._element if isinstance(child.tag, str)]
+        else:
+            return [ElementTreeElement(child) for child in self._element if child.tag == name]
+
+    def __getitem__(self, key: str) -> str:
+        return cast(str, self._element.get(key))
+
+    def __repr__(self) -> str:
+        return f'ElementTreeElement({self._element.tag=} {self._element.attrib=})'
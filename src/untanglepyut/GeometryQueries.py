@@ -0,0 +1,177 @@
+
+from typing import Any
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+from typing import cast
+
+import numpy
+
+from numpy.typing import NDArray
+
+from untanglepyut.GeometryTable import GeometryTable
+from untanglepyut.GeometryTable import ShapeKind
+
+if TYPE_CHECKING:
+    from untanglepyut.ModelTypes import ModelDocument
+    from untanglepyut.Types import Document           # Ogl is only needed without a geometry table
+
+"""
+Whole diagram questions answered with array operations over a GeometryTable;  Needs the optional
+numpy dependency.  A shape covers `x <= px < x + width` by `y <= py < y + height`, so shapes that
+only touch do not overlap
+"""
+
+
+class DiagramBounds(NamedTuple):
+    """
+    The right and bottom edges are exclusive
+    """
+    left:   int
+    top:    int
+    right:  int
+    bottom: int
+
+
+class GeometryQueries:
+    """
+    Build one per document and ask it as many questions as needed;  The edges are computed once.
+    The answers are shape ids, which are the Pyut object ids
+    """
+    def __init__(self, geometryTable: GeometryTable):
+
+        self._geometryTable: GeometryTable = geometryTable
+
+        self._ids:    NDArray[numpy.int64] = geometryTable.ids
+        self._left:   NDArray[numpy.int64] = geometryTable.x
+        self._top:    NDArray[numpy.int64] = geometryTable.y
+        self._right:  NDArray[numpy.int64] = geometryTable.x + geometryTable.width
+        self._bottom: NDArray[numpy.int64] = geometryTable.y + geometryTable.height
+
+    @classmethod
+    def fromDocument(cls, document: Union['Document', 'ModelDocument']) -> 'GeometryQueries':
+        """
+        Uses the document's geometry table when the untangler built one;  Otherwise collects the
+        geometry of the Ogl shapes once, as they are now.  Deferred classes are not built
+
+        Args:
+            document:  A `Document`, or a `ModelDocument` with a geometry table
+
+        Returns:  The queries over the document's shapes
+        """
+        if document.geometryTable is not None:
+            return GeometryQueries(geometryTable=document.geometryTable)
+
+        from untanglepyut.OglClassProxy import OglClassProxy
+
+        oglDocument: 'Document' = cast('Document', document)     # A ModelDocument always has its table
+
+        ids:        List[int]                       = []
+        kinds:      List[int]                       = []
+        rectangles: List[Tuple[int, int, int, int]] = []
+
+        shapeLists: List[Tuple[ShapeKind, Any]] = [
+            (ShapeKind.CLASS,       oglDocument.oglClasses),
+            (ShapeKind.NOTE,        oglDocument.oglNotes),
+            (ShapeKind.TEXT,        oglDocument.oglTexts),
+            (ShapeKind.ACTOR,       oglDocument.oglActors),
+            (ShapeKind.USE_CASE,    oglDocument.oglUseCases),
+            (ShapeKind.SD_INSTANCE, oglDocument.oglSDInstances.values()),
+        ]
+        for shapeKind, oglObjects in shapeLists:
+            for oglObject in oglObjects:
+                if isinstance(oglObject, OglClassProxy) and oglObject.isMaterialized() is False:
+                    ids.append(oglObject.pyutId)
+                    rectangles.append((oglObject.graphicInformation.x,     oglObject.graphicInformation.y,
+                                       oglObject.graphicInformation.width, oglObject.graphicInformation.height))
+                else:
+                    x, y          = oglObject.GetPosition()
+                    width, height = oglObject.GetSize()
+                    ids.append(oglObject.pyutObject.id)
+                    rectangles.append((x, y, width, height))
+                kinds.append(shapeKind)
+
+        return GeometryQueries(geometryTable=GeometryTable.fromColumns(ids=ids, kinds=kinds, rectangles=rectangles))
+
+    @property
+    def geometryTable(self) -> GeometryTable:
+        return self._geometryTable
+
+    def bounds(self) -> DiagramBounds | None:
+        """
+        Returns:  The smallest rectangle that holds every shape;  `None` for an empty diagram
+        """
+        if len(self._ids) == 0:
+            return None
+
+        return DiagramBounds(left=int(self._left.min()), top=int(self._top.min()), right=int(self._right.max()), bottom=int(self._bottom.max()))
+
+    def shapesInRectangle(self, left: int, top: int, right: int, bottom: int, contained: bool = False) -> NDArray[numpy.int64]:
+        """
+        Viewport culling;  The rectangle's right and bottom edges are exclusive
+
+        Args:
+            left:       The rectangle's left edge
+            top:        The rectangle's top edge
+            right:      The rectangle's right edge
+            bottom:     The rectangle's bottom edge
+            contained:  When `True` only the shapes completely inside;  Otherwise every shape that overlaps the rectangle
+
+        Returns:  The ids of the shapes in document order
+        """
+        if contained is True:
+            mask: NDArray[numpy.bool_] = (self._left >= left) & (self._top >= top) & (self._right <= right) & (self._bottom <= bottom)
+        else:
+            mask = (self._left < right) & (self._right > left) & (self._top < bottom) & (self._bottom > top)
+
+        return self._ids[mask]
+
+    def overlappingShapes(self) -> NDArray[numpy.int64]:
+        """
+        A sweep over the shapes sorted by left edge;  Only the shapes that start before another
+        ends are compared, so this stays well short of all pairs for a laid out diagram
+
+        Returns:  An (n, 2) array of the id pairs that overlap;  The first shape of a pair starts no further right
+        """
+        order: NDArray[numpy.int64] = numpy.argsort(self._left, kind='stable')
+        left:  NDArray[numpy.int64] = self._left[order]
+        right: NDArray[numpy.int64] = self._right[order]
+
+        shapeCount: int = len(order)
+        #
+        # Shape i can only overlap the shapes after it that start before it ends
+        #
+        ends:   NDArray[numpy.int64] = numpy.searchsorted(left, right, side='left')
+        counts: NDArray[numpy.int64] = numpy.maximum(ends - numpy.arange(1, shapeCount + 1), 0)
+
+        firsts:  NDArray[numpy.int64] = numpy.repeat(numpy.arange(shapeCount), counts)
+        starts:  NDArray[numpy.int64] = numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        seconds: NDArray[numpy.int64] = firsts + 1 + numpy.arange(len(firsts)) - starts
+
+        first:  NDArray[numpy.int64] = order[firsts]
+        second: NDArray[numpy.int64] = order[seconds]
+
+        mask: NDArray[numpy.bool_] = ((self._left[first] < self._right[second]) & (self._left[second] < self._right[first]) &
+                                      (self._top[first] < self._bottom[second]) & (self._top[second] < self._bottom[first]))
+
+        return numpy.column_stack((self._ids[first[mask]], self._ids[second[mask]]))
+
+    def nearestShape(self, x: int, y: int) -> int | None:
+        """
+        The distance to a shape is the distance to its nearest edge;  Zero when the point is inside it
+
+        Args:
+            x:  Diagram x
+            y:  Diagram y
+
+        Returns:  The id of the closest shape, the first in document order on a tie;  `None` for an empty diagram
+        """
+        if len(self._ids) == 0:
+            return None
+
+        dx: NDArray[numpy.int64] = numpy.maximum(numpy.maximum(self._left - x, x - self._right), 0)
+        dy: NDArray[numpy.int64] = numpy.maximum(numpy.maximum(self._top - y, y - self._bottom), 0)
+
+        return int(self._ids[numpy.argmin(dx * dx + dy * dy)])
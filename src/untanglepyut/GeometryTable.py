@@ -0,0 +1,137 @@
+
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from dataclasses import dataclass
+
+import numpy
+
+from numpy.typing import NDArray
+
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.GeometryTableBuilder import ShapeKind
+
+from untanglepyut.GraphicRecords import GraphicInformation
+from untanglepyut.GraphicRecords import LinkRecord
+
+from untanglepyut.XmlSchema import XmlSchema
+
+from untanglepyut.XmlBackend import XmlElement
+
+"""
+A document's geometry as columns;  Needs the optional numpy dependency.  Bounding box, hit test, layout
+and export code can work on whole columns at once instead of asking each Ogl shape for its position
+and size
+"""
+
+GEOMETRY_DTYPE = numpy.int64
+
+
+@dataclass(slots=True)
+class GeometryTable:
+    """
+    Row `i` of `ids`, `kinds`, `x`, `y`, `width` and `height` is one shape;  The id is its Pyut
+    object's id.  Lollipop interfaces are not shapes and are not in the table.
+
+    Link `j` runs from the shape with id `linkSourceIds[j]` to the one with id `linkDestinationIds[j]`.
+    Its path, the source anchor then the control points then the destination anchor, is
+    `linkPoints[linkPointOffsets[j]:linkPointOffsets[j + 1]]`
+    """
+    ids:    NDArray[numpy.int64]
+    kinds:  NDArray[numpy.int8]
+    x:      NDArray[numpy.int64]
+    y:      NDArray[numpy.int64]
+    width:  NDArray[numpy.int64]
+    height: NDArray[numpy.int64]
+
+    linkSourceIds:      NDArray[numpy.int64]
+    linkDestinationIds: NDArray[numpy.int64]
+    linkPointOffsets:   NDArray[numpy.int64]
+    linkPoints:         NDArray[numpy.int64]
+
+    @property
+    def shapeCount(self) -> int:
+        return len(self.ids)
+
+    @property
+    def linkCount(self) -> int:
+        return len(self.linkSourceIds)
+
+    def linkPath(self, linkIndex: int) -> NDArray[numpy.int64]:
+        """
+        Args:
+            linkIndex:  The link's row
+
+        Returns:  A view of the link's points as an (n, 2) array;  Never fewer than the two anchors
+        """
+        return self.linkPoints[self.linkPointOffsets[linkIndex]:self.linkPointOffsets[linkIndex + 1]]
+
+    @classmethod
+    def fromPyutDocument(cls, schema: XmlSchema, pyutDocument: XmlElement) -> 'GeometryTable':
+        """
+        Reads only the geometry attributes;  No Pyut or Ogl objects are built.  The UnTangler does not
+        need this walk, its untanglers fill a GeometryTableBuilder as they go
+
+        Args:
+            schema:        The schema of the document's XML version
+            pyutDocument:  A complete PyutDocument element
+
+        Returns:  The document's shape and link geometry
+        """
+        geometryTableBuilder: GeometryTableBuilder = GeometryTableBuilder()
+
+        shapeTags: List[Tuple[ShapeKind, str, str]] = [
+            (ShapeKind.CLASS,       schema.elementOglClass, schema.elementPyutClass),
+            (ShapeKind.NOTE,        schema.elementOglNote,  schema.elementPyutNote),
+            (ShapeKind.TEXT,        schema.elementOglText,  schema.elementPyutText),
+            (ShapeKind.ACTOR,       schema.elementActor,    schema.elementPyutActor),
+            (ShapeKind.USE_CASE,    schema.elementUseCase,  schema.elementPyutUseCase),
+            (ShapeKind.SD_INSTANCE, schema.elementInstance, schema.elementPyutSDInstance),
+        ]
+        for shapeKind, graphicTag, pyutTag in shapeTags:
+            for graphicElement in pyutDocument.get_elements(graphicTag):
+                pyutElements: List[XmlElement] = graphicElement.get_elements(pyutTag)
+                assert len(pyutElements) == 1, f'{pyutTag} missing from {graphicElement}'
+
+                geometryTableBuilder.addShape(pyutId=int(pyutElements[0][schema.attrId]), shapeKind=shapeKind,
+                                              graphicInformation=GraphicInformation.toGraphicInfo(graphicElement=graphicElement))
+
+        for graphicLink in pyutDocument.get_elements(schema.elementOglLink):
+            geometryTableBuilder.addLink(linkRecord=LinkRecord.fromGraphicLink(schema=schema, graphicLink=graphicLink))
+
+        return geometryTableBuilder.build()
+
+    @classmethod
+    def fromColumns(cls, ids: Sequence[int], kinds: Sequence[int], rectangles: Sequence[Sequence[int | str]],
+                    linkSourceIds: Sequence[int] = (), linkDestinationIds: Sequence[int] = (),
+                    linkPointOffsets: Sequence[int] = (0,), linkPoints: Sequence[Tuple[int, int]] = ()) -> 'GeometryTable':
+        """
+        Converts Python sequences in one go
+
+        Args:
+            ids:                 The shape ids
+            kinds:               The shape kinds
+            rectangles:          Each shape's x, y, width and height;  Numeric strings are fine
+            linkSourceIds:       The link source ids
+            linkDestinationIds:  The link destination ids
+            linkPointOffsets:    Where each link's path starts in `linkPoints` plus where the last ends
+            linkPoints:          Every link's path, one after the other
+
+        Returns:  The table
+        """
+        #
+        # One contiguous row per column
+        #
+        columns: NDArray[numpy.int64] = numpy.array(rectangles, dtype=GEOMETRY_DTYPE).reshape(-1, 4).T.copy()
+
+        return GeometryTable(ids=numpy.array(ids, dtype=GEOMETRY_DTYPE),
+                             kinds=numpy.array(kinds, dtype=numpy.int8),
+                             x=columns[0],
+                             y=columns[1],
+                             width=columns[2],
+                             height=columns[3],
+                             linkSourceIds=numpy.array(linkSourceIds, dtype=GEOMETRY_DTYPE),
+                             linkDestinationIds=numpy.array(linkDestinationIds, dtype=GEOMETRY_DTYPE),
+                             linkPointOffsets=numpy.array(linkPointOffsets, dtype=GEOMETRY_DTYPE),
+                             linkPoints=numpy.array(linkPoints, dtype=GEOMETRY_DTYPE).reshape(-1, 2))
@@ -0,0 +1,78 @@
+
+from typing import List
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from enum import IntEnum
+
+from untanglepyut.GraphicRecords import GraphicInformation
+from untanglepyut.GraphicRecords import LinkRecord
+
+if TYPE_CHECKING:
+    from untanglepyut.GeometryTable import GeometryTable     # numpy is optional
+
+
+class ShapeKind(IntEnum):
+    """
+    The values of the `kinds` column
+    """
+    CLASS       = 0
+    NOTE        = 1
+    TEXT        = 2
+    ACTOR       = 3
+    USE_CASE    = 4
+    SD_INSTANCE = 5
+
+
+class GeometryTableBuilder:
+    """
+    Collects a document's geometry from the records the shape and link untanglers already build, so
+    the GeometryTable needs no second walk over the XML.  The rows are plain lists until `build`;  Only
+    that needs numpy
+    """
+    __slots__ = ('_ids', '_kinds', '_rectangles', '_linkSourceIds', '_linkDestinationIds', '_linkPointOffsets', '_linkPoints')
+
+    def __init__(self):
+
+        self._ids:        List[int]                       = []
+        self._kinds:      List[int]                       = []
+        self._rectangles: List[Tuple[int, int, int, int]] = []
+
+        self._linkSourceIds:      List[int]             = []
+        self._linkDestinationIds: List[int]             = []
+        self._linkPointOffsets:   List[int]             = [0]
+        self._linkPoints:         List[Tuple[int, int]] = []
+
+    def addShape(self, pyutId: int, shapeKind: ShapeKind, graphicInformation: GraphicInformation):
+        """
+        Args:
+            pyutId:              The id of the shape's Pyut object
+            shapeKind:           What kind of shape it is
+            graphicInformation:  Its position and size
+        """
+        self._ids.append(pyutId)
+        self._kinds.append(shapeKind)
+        self._rectangles.append((graphicInformation.x, graphicInformation.y, graphicInformation.width, graphicInformation.height))
+
+    def addLink(self, linkRecord: LinkRecord):
+        """
+        Args:
+            linkRecord:  The link's ends, anchors and control points
+        """
+        self._linkSourceIds.append(linkRecord.pyutLinkRecord.sourceId)
+        self._linkDestinationIds.append(linkRecord.pyutLinkRecord.destinationId)
+
+        self._linkPoints.append((linkRecord.srcX, linkRecord.srcY))
+        self._linkPoints.extend(linkRecord.controlPoints)
+        self._linkPoints.append((linkRecord.dstX, linkRecord.dstY))
+        self._linkPointOffsets.append(len(self._linkPoints))
+
+    def build(self) -> 'GeometryTable':
+        """
+        Returns:  The rows added so far, in the order they were added, as columns
+        """
+        from untanglepyut.GeometryTable import GeometryTable
+
+        return GeometryTable.fromColumns(ids=self._ids, kinds=self._kinds, rectangles=self._rectangles,
+                                         linkSourceIds=self._linkSourceIds, linkDestinationIds=self._linkDestinationIds,
+                                         linkPointOffsets=self._linkPointOffsets, linkPoints=self._linkPoints)
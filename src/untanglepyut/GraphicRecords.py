@@ -0,0 +1,228 @@
+
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import cast
+
+from dataclasses import dataclass
+
+from codeallybasic.SecureConversions import SecureConversions
+
+from untanglepyut.XmlSchema import XmlSchema
+from untanglepyut.XmlVersion import XmlVersion
+
+from untanglepyut.XmlBackend import XmlElement
+
+"""
+The intermediate representation between the XML and the Ogl/Pyut builders.  The records are small
+`__slots__` or tuple backed values with no Ogl in them, so they are cheap to build, pickle, cache and
+send to another process.  Each one is filled in by a `from...()` class method that reads a single
+XML element through the schema
+"""
+
+
+@dataclass(slots=True)
+class GraphicInformation:
+    """
+    Internal Class use to move information from a Graphic XML element
+    into Python
+    """
+    x: int = -1
+    y: int = -1
+    width:  int = -1
+    height: int = -1
+
+    @classmethod
+    def toGraphicInfo(cls, graphicElement: XmlElement) -> 'GraphicInformation':
+        graphicInformation: GraphicInformation = GraphicInformation()
+
+        graphicInformation.x = int(graphicElement['x'])
+        graphicInformation.y = int(graphicElement['y'])
+
+        graphicInformation.width  = int(graphicElement['width'])
+        graphicInformation.height = int(graphicElement['height'])
+
+        return graphicInformation
+
+
+@dataclass(slots=True)
+class GraphicLinkAttributes:
+
+    srcX:   int = -1
+    srcY:   int = -1
+    dstX:   int = -1
+    dstY:   int = -1
+    spline: bool = False
+
+    @classmethod
+    def fromGraphicLink(cls, schema: XmlSchema = cast(XmlSchema, None), graphicLink: XmlElement = cast(XmlElement, None),
+                        xmlVersion: XmlVersion = cast(XmlVersion, None)) -> 'GraphicLinkAttributes':
+        """
+
+        Args:
+            schema:       The schema of the element's XML version
+            graphicLink:  A `GraphicLink` or `OglLink` element
+            xmlVersion:   Deprecated;  Use `schema`.  Kept for callers written before the schemas;  Ignored when `schema` is given
+
+        Returns:  The link's anchors and spline flag
+        """
+        if schema is None:
+            assert xmlVersion is not None, 'Need either a schema or an XML version'
+            schema = XmlSchema.forVersion(xmlVersion)
+
+        srcX, srcY, dstX, dstY = schema.linkAnchors(graphicLink)
+
+        gla: GraphicLinkAttributes = GraphicLinkAttributes()
+        gla.srcX = int(srcX)
+        gla.srcY = int(srcY)
+        gla.dstX = int(dstX)
+        gla.dstY = int(dstY)
+
+        gla.spline = SecureConversions.secureBoolean(graphicLink['spline'])
+
+        return gla
+
+
+class PointRecord(NamedTuple):
+    """
+    A control point or an association label position
+    """
+    x: int
+    y: int
+
+    @classmethod
+    def fromPointElement(cls, pointElement: XmlElement) -> 'PointRecord':
+        return PointRecord(x=int(pointElement['x']), y=int(pointElement['y']))
+
+
+ControlPointRecords = Tuple[PointRecord, ...]
+
+
+class PyutLinkRecord(NamedTuple):
+    """
+    The model half of a link;  Everything a PyutLink needs except its resolved ends
+    """
+    sourceId:               int
+    destinationId:          int
+    linkType:               str
+    name:                   str
+    cardinalitySource:      str
+    cardinalityDestination: str
+    bidirectional:          bool
+
+    @classmethod
+    def fromLinkElement(cls, schema: XmlSchema, linkElement: XmlElement) -> 'PyutLinkRecord':
+        """
+
+        Args:
+            schema:       The schema of the element's XML version
+            linkElement:  A single `Link` or `PyutLink` element
+
+        Returns:  The link attributes
+        """
+        return PyutLinkRecord(sourceId=int(linkElement[schema.attrSourceId]),
+                              destinationId=int(linkElement[schema.attrDestinationId]),
+                              linkType=linkElement['type'],
+                              name=linkElement['name'],
+                              cardinalitySource=linkElement[schema.attrCardinalitySource],
+                              cardinalityDestination=linkElement[schema.attrCardinalityDestination],
+                              bidirectional=SecureConversions.secureBoolean(linkElement[schema.attrBidirectional]))
+
+
+class LinkRecord(NamedTuple):
+    """
+    A graphic link;  The label positions are `None` when the XML has no such label
+    """
+    pyutLinkRecord:   PyutLinkRecord
+    srcX:             int
+    srcY:             int
+    dstX:             int
+    dstY:             int
+    spline:           bool
+    controlPoints:    ControlPointRecords
+    centerLabel:      PointRecord | None
+    sourceLabel:      PointRecord | None
+    destinationLabel: PointRecord | None
+
+    @classmethod
+    def fromGraphicLink(cls, schema: XmlSchema, graphicLink: XmlElement) -> 'LinkRecord':
+        """
+
+        Args:
+            schema:       The schema of the element's XML version
+            graphicLink:  A `GraphicLink` or `OglLink` element
+
+        Returns:  The link, its control points and its label positions
+        """
+        links: List[XmlElement] = graphicLink.get_elements(schema.elementLink)
+        assert len(links) == 1, 'Should only ever be one'
+
+        gla: GraphicLinkAttributes = GraphicLinkAttributes.fromGraphicLink(schema=schema, graphicLink=graphicLink)
+
+        return LinkRecord(pyutLinkRecord=PyutLinkRecord.fromLinkElement(schema=schema, linkElement=links[0]),
+                          srcX=gla.srcX,
+                          srcY=gla.srcY,
+                          dstX=gla.dstX,
+                          dstY=gla.dstY,
+                          spline=gla.spline,
+                          controlPoints=tuple(PointRecord.fromPointElement(pointElement) for pointElement in graphicLink.get_elements('ControlPoint')),
+                          centerLabel=LinkRecord._labelRecord(graphicLink, schema.elementLabelCenter),
+                          sourceLabel=LinkRecord._labelRecord(graphicLink, schema.elementLabelSource),
+                          destinationLabel=LinkRecord._labelRecord(graphicLink, schema.elementLabelDestination))
+
+    @classmethod
+    def _labelRecord(cls, graphicLink: XmlElement, tagName: str) -> PointRecord | None:
+
+        labels: List[XmlElement] = graphicLink.get_elements(tagName)
+        assert len(labels) <= 1, 'There can be only one'
+
+        if len(labels) == 0:
+            return None
+        return PointRecord.fromPointElement(labels[0])
+
+
+class LollipopRecord(NamedTuple):
+    """
+    Where a lollipop interface sits;  The interface itself is a Pyut model object
+    """
+    x:               int
+    y:               int
+    attachmentPoint: str
+
+    @classmethod
+    def fromGraphicLollipop(cls, graphicLollipop: XmlElement) -> 'LollipopRecord':
+        return LollipopRecord(x=int(graphicLollipop['x']), y=int(graphicLollipop['y']), attachmentPoint=graphicLollipop['attachmentPoint'])
+
+
+class SDMessageRecord(NamedTuple):
+    """
+    A sequence diagram message with its instances still unresolved ids
+    """
+    id:              int
+    message:         str
+    sourceId:        int
+    destinationId:   int
+    sourceTime:      int
+    destinationTime: int
+
+    @classmethod
+    def fromSDMessage(cls, schema: XmlSchema, sdMessageElement: XmlElement) -> 'SDMessageRecord':
+        """
+
+        Args:
+            schema:            The schema of the element's XML version
+            sdMessageElement:  A `GraphicSDMessage` or `OglSDMessage` element
+
+        Returns:  The message attributes
+        """
+        messageElements: List[XmlElement] = sdMessageElement.get_elements(schema.elementPyutSDMessage)
+        assert len(messageElements) == 1, f'{schema.elementPyutSDMessage} missing from {sdMessageElement}'
+
+        messageElement: XmlElement = messageElements[0]
+
+        return SDMessageRecord(id=int(messageElement['id']),
+                               message=messageElement['message'],
+                               sourceId=int(messageElement[schema.attrSDMessageSourceId]),
+                               destinationId=int(messageElement[schema.attrSDMessageDestinationId]),
+                               sourceTime=int(messageElement[schema.attrSourceTime]),
+                               destinationTime=int(messageElement[schema.attrDestinationTime]))
@@ -0,0 +1,69 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import cast
+
+from untanglepyut.XmlBackend import XmlElement
+
+TagIndex = NewType('TagIndex', Dict[str, List[XmlElement]])
+
+
+def createTagIndex() -> TagIndex:
+    return TagIndex({})
+
+
+class IndexedDocument:
+    """
+    A PyutDocument element plus an index of its children by tag name.  The document streams build
+    the index while they parse, so classifying a document with N children costs O(N) once instead of
+    a walk of all the children for every kind of element the untanglers look for.
+
+    Only the direct children are indexed;  Deeper elements are searched by the wrapped element
+    """
+    __slots__ = ('_pyutDocument', '_tagIndex')
+
+    def __init__(self, pyutDocument: XmlElement, tagIndex: TagIndex):
+        """
+
+        Args:
+            pyutDocument:  The PyutDocument element from any backend
+            tagIndex:      Its children by tag name, in document order
+        """
+        self._pyutDocument: XmlElement = pyutDocument
+        self._tagIndex:     TagIndex   = tagIndex
+
+    @property
+    def pyutDocument(self) -> XmlElement:
+        """
+        Returns:  The wrapped PyutDocument element
+        """
+        return self._pyutDocument
+
+    @property
+    def tagIndex(self) -> TagIndex:
+        return self._tagIndex
+
+    @property
+    def cdata(self) -> str:
+        return self._pyutDocument.cdata
+
+    def get_elements(self, name: str = cast(str, None)) -> List[XmlElement]:
+        """
+        The returned list is shared by every caller;  Do not modify it
+
+        Args:
+            name:  A tag name;  When `None` all the children
+
+        Returns:  The child elements with the given tag name, in document order
+        """
+        if name is None:
+            return self._pyutDocument.get_elements()
+
+        return self._tagIndex.get(name, [])
+
+    def __getitem__(self, key: str) -> str:
+        return self._pyutDocument[key]
+
+    def __repr__(self) -> str:
+        return f'IndexedDocument({self._pyutDocument!r} tags={list(self._tagIndex.keys())})'
@@ -0,0 +1,106 @@
+
+from typing import Callable
+from typing import Dict
+from typing import TypeVar
+from typing import cast
+
+from sys import intern
+
+from pyutmodelv2.PyutModifier import PyutModifier
+from pyutmodelv2.PyutType import PyutType
+
+from pyutmodelv2.enumerations.PyutDisplayMethods import PyutDisplayMethods
+from pyutmodelv2.enumerations.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
+from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+V = TypeVar('V')
+
+
+class InternTable:
+    """
+    The values a project repeats thousands of times, a few dozen type names and a handful of enumeration
+    strings, converted once per load.  `PyutType` and `PyutModifier` are frozen, so every field, parameter
+    and method with the same type or modifier shares one object;  Names, file names and type names are
+    `sys.intern`-ed so they outlive the parse tree as a single string each.
+
+    Nothing mutable is shared;  Fields, parameters, methods and links are still new objects
+    """
+    __slots__ = ('_pyutTypes', '_pyutModifiers', '_visibilities', '_stereotypes', '_linkTypes', '_displayParameters', '_displayMethods')
+
+    def __init__(self):
+
+        self._pyutTypes:         Dict[str, PyutType]              = {}
+        self._pyutModifiers:     Dict[str, PyutModifier]          = {}
+        self._visibilities:      Dict[str, PyutVisibility]        = {}
+        self._stereotypes:       Dict[str, PyutStereotype]        = {}
+        self._linkTypes:         Dict[str, PyutLinkType]          = {}
+        self._displayParameters: Dict[str, PyutDisplayParameters] = {}
+        self._displayMethods:    Dict[str, PyutDisplayMethods]    = {}
+
+    def __len__(self) -> int:
+        """
+        Returns:  The number of shared types and modifiers
+        """
+        return len(self._pyutTypes) + len(self._pyutModifiers)
+
+    def string(self, value: str) -> str:
+        """
+        Args:
+            value:  An attribute value;  May be `None`
+
+        Returns:  The interned string or `None`
+        """
+        if value is None:
+            return cast(str, None)
+        return intern(value)
+
+    def pyutType(self, typeName: str) -> PyutType:
+        return self._convert(self._pyutTypes, typeName, lambda name: PyutType(self.string(name)))
+
+    def pyutModifier(self, modifierName: str) -> PyutModifier:
+        return self._convert(self._pyutModifiers, modifierName, lambda name: PyutModifier(name=self.string(name)))
+
+    def visibility(self, visibilityStr: str) -> PyutVisibility:
+        return self._convert(self._visibilities, visibilityStr, PyutVisibility.toEnum)
+
+    def stereotype(self, stereotypeStr: str) -> PyutStereotype:
+        return self._convert(self._stereotypes, stereotypeStr, PyutStereotype.toEnum)
+
+    def linkType(self, linkTypeStr: str) -> PyutLinkType:
+        return self._convert(self._linkTypes, linkTypeStr, PyutLinkType.toEnum)
+
+    def displayParameters(self, displayStr: str) -> PyutDisplayParameters:
+        return self._convert(self._displayParameters, displayStr, PyutDisplayParameters)
+
+    def displayMethods(self, displayStr: str) -> PyutDisplayMethods:
+        """
+        Args:
+            displayStr:  The serialized value;  `None` in files written before the attribute existed
+
+        Returns:  The enumeration;  `UNSPECIFIED` for `None`
+        """
+        if displayStr is None:
+            return PyutDisplayMethods.UNSPECIFIED
+        return self._convert(self._displayMethods, displayStr, PyutDisplayMethods)
+
+    def clear(self):
+        self._pyutTypes.clear()
+        self._pyutModifiers.clear()
+        self._visibilities.clear()
+        self._stereotypes.clear()
+        self._linkTypes.clear()
+        self._displayParameters.clear()
+        self._displayMethods.clear()
+
+    def _convert(self, cache: Dict[str, V], value: str, converter: Callable[[str], V]) -> V:
+        """
+        A value the converter rejects is not cached, so it raises or asserts again the next time
+        """
+        try:
+            return cache[value]
+        except KeyError:
+            converted: V = converter(value)
+            cache[value] = converted
+            return converted
@@ -0,0 +1,181 @@
+
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Union
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from mmap import mmap
+
+from hashlib import blake2b
+
+from untanglepyut.IndexedDocument import IndexedDocument
+from untanglepyut.PyutDocumentStream import PyutDocumentStream
+
+from untanglepyut.Types import Document
+from untanglepyut.Types import DocumentTitle
+from untanglepyut.Types import Documents
+
+from untanglepyut.XmlBackend import DocumentStream
+from untanglepyut.XmlBackend import XmlBackendType
+from untanglepyut.XmlBackend import XmlElement
+
+RawXml = Union[bytes, mmap]
+
+DocumentInformation = Callable[[XmlElement], Document]
+DocumentUnTangler   = Callable[[XmlElement], Document]
+
+
+class LazyDocuments(Mapping[DocumentTitle, Document]):
+    """
+    A read-only Documents mapping whose documents are untangled the first time
+    their title is looked up.
+
+    The initial pass only catalogues the PyutDocument attributes and where each
+    document starts in the raw XML.  A lookup parses the project header plus that single
+    document and hands it to the document untangler.  The catalogue pass always uses the expat
+    stream since it is the only one that reports document offsets;  The backend only parses the documents
+    """
+    CHUNK_SIZE: int = 64 * 1024
+
+    def __init__(self, rawXml: RawXml, documentInformation: DocumentInformation, documentUnTangler: DocumentUnTangler, encoding: str = cast(str, None),
+                 backendType: XmlBackendType = XmlBackendType.UNTANGLE):
+        """
+
+        Args:
+            rawXml:              The raw project XML;  It must live as long as this mapping
+            documentInformation: Creates a document with only the PyutDocument attributes
+            documentUnTangler:   Fully untangles a PyutDocument element
+            encoding:            Overrides the encoding in the XML declaration
+            backendType:         The XML parser for the documents that are looked up
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._rawXml:              memoryview          = memoryview(rawXml)
+        self._documentInformation: DocumentInformation = documentInformation
+        self._documentUnTangler:   DocumentUnTangler   = documentUnTangler
+        self._encoding:            str                 = encoding
+        self._backendType:         XmlBackendType      = backendType
+
+        self._catalogue: Dict[DocumentTitle, Document] = {}
+        self._offsets:   Dict[DocumentTitle, int]      = {}
+        self._ends:      Dict[DocumentTitle, int]      = {}
+        self._untangled: Documents                     = Documents({})
+
+        self._pyutProject:  XmlElement = cast(XmlElement, None)
+        self._headerLength: int        = -1
+
+        self._catalogueDocuments()
+
+    @property
+    def pyutProject(self) -> XmlElement:
+        """
+        Returns:  The attributes only PyutProject element from the catalogue pass
+        """
+        return self._pyutProject
+
+    @property
+    def documentUnTangler(self) -> DocumentUnTangler:
+        return self._documentUnTangler
+
+    @documentUnTangler.setter
+    def documentUnTangler(self, documentUnTangler: DocumentUnTangler):
+        """
+        The documents that were already untangled are kept
+
+        Args:
+            documentUnTangler:  Untangles the documents that are looked up from now on
+        """
+        self._documentUnTangler = documentUnTangler
+
+    def documentInformation(self, documentTitle: DocumentTitle) -> Document:
+        """
+        Peek at a document without untangling it
+
+        Args:
+            documentTitle:  The document title
+
+        Returns:  A document with only the type, title, scroll and pixel attributes filled in
+        """
+        return self._catalogue[documentTitle]
+
+    def fingerprint(self, documentTitle: DocumentTitle) -> str:
+        """
+        A hash of the document's raw XML;  Needs no parse.  Equal fingerprints mean the same
+        PyutDocument subtree, byte for byte
+
+        Args:
+            documentTitle:  The document title
+
+        Returns:  The document's fingerprint
+        """
+        return blake2b(self._rawXml[self._offsets[documentTitle]:self._ends[documentTitle]], digest_size=20).hexdigest()
+
+    def isUntangled(self, documentTitle: DocumentTitle) -> bool:
+        return documentTitle in self._untangled
+
+    def __getitem__(self, documentTitle: DocumentTitle) -> Document:
+
+        if documentTitle not in self._untangled:
+            offset:       int        = self._offsets[documentTitle]
+            pyutDocument: XmlElement = self._parseDocument(offset=offset)
+
+            self._untangled[documentTitle] = self._documentUnTangler(pyutDocument)
+
+        return self._untangled[documentTitle]
+
+    def __len__(self) -> int:
+        return len(self._catalogue)
+
+    def __iter__(self) -> Iterator[DocumentTitle]:
+        return iter(self._catalogue)
+
+    def _catalogueDocuments(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream(encoding=self._encoding, skipDocumentContent=True)
+
+        for ordinal, pyutDocument in enumerate(documentStream.documents(xmlChunks=self._chunks(offset=0))):
+            document: Document = self._documentInformation(pyutDocument)
+
+            documentTitle: DocumentTitle = DocumentTitle(document.documentTitle)
+
+            self._catalogue[documentTitle] = document
+            self._offsets[documentTitle]   = documentStream.documentOffsets[ordinal]
+            self._ends[documentTitle]      = documentStream.documentEnds[ordinal]
+
+        self._pyutProject  = documentStream.pyutProject
+        self._headerLength = documentStream.headerLength
+
+        self.logger.debug(f'Catalogued {len(self._catalogue)} documents')
+
+    def _parseDocument(self, offset: int) -> XmlElement:
+        """
+        Parses just the document that starts at offset.  The project header is fed first so that
+        the parser sees a well-formed PyutProject
+
+        Args:
+            offset:  Where the PyutDocument start tag begins
+
+        Returns:  The complete PyutDocument element
+        """
+        documentStream: DocumentStream = self._backendType.createDocumentStream(encoding=self._encoding)
+
+        documentStream.feed(self._rawXml[:self._headerLength])
+        for xmlChunk in self._chunks(offset=offset):
+            documentStream.feed(xmlChunk)
+
+            pyutDocuments: List[IndexedDocument] = documentStream.popDocuments()
+            if len(pyutDocuments) > 0:
+                return pyutDocuments[0]
+
+        assert False, f'Document at {offset=} never closed'
+
+    def _chunks(self, offset: int) -> Iterator[memoryview]:
+
+        for start in range(offset, len(self._rawXml), LazyDocuments.CHUNK_SIZE):
+            yield self._rawXml[start:start + LazyDocuments.CHUNK_SIZE]
@@ -0,0 +1,74 @@
+
+from ogl.OglActor import OglActor
+from ogl.OglClass import OglClass
+from ogl.OglNote import OglNote
+from ogl.OglUseCase import OglUseCase
+
+from ogl.sd.OglSDInstance import OglSDInstance
+
+from untanglepyut.OglClassProxy import OglClassProxy
+
+from untanglepyut.Types import LinkableOglObjects
+from untanglepyut.Types import OglSDInstances
+from untanglepyut.Types import ProjectOglObject
+from untanglepyut.Types import createLinkableOglObjects
+from untanglepyut.Types import createOglSDInstances
+
+
+class LinkableObjectRegistry:
+    """
+    The shapes of one document that links and messages can end on, by Pyut id.  The shape untanglers
+    register each shape as they create it, so the link and message resolvers look them up without
+    another pass over the document's collections.
+
+    Sequence diagram instances are kept apart from the other shapes;  A link or lollipop in a class
+    or use case diagram never ends on one
+    """
+    __slots__ = ('_linkableOglObjects', '_oglSDInstances')
+
+    def __init__(self):
+
+        self._linkableOglObjects: LinkableOglObjects = createLinkableOglObjects()
+        self._oglSDInstances:     OglSDInstances     = createOglSDInstances()
+
+    def __len__(self) -> int:
+        return len(self._linkableOglObjects) + len(self._oglSDInstances)
+
+    def __contains__(self, pyutId: int) -> bool:
+        return pyutId in self._linkableOglObjects or pyutId in self._oglSDInstances
+
+    def __getitem__(self, pyutId: int) -> ProjectOglObject:
+        """
+        Raises:  KeyError for an unknown id, the same as the dictionaries it replaces
+        """
+        if pyutId in self._oglSDInstances:
+            return self._oglSDInstances[pyutId]
+        return self._linkableOglObjects[pyutId]
+
+    @property
+    def linkableOglObjects(self) -> LinkableOglObjects:
+        """
+        Returns:  The classes, notes, actors and use cases;  The registry's own dictionary, not a copy
+        """
+        return self._linkableOglObjects
+
+    @property
+    def oglSDInstances(self) -> OglSDInstances:
+        """
+        Returns:  The sequence diagram instances;  The registry's own dictionary, not a copy
+        """
+        return self._oglSDInstances
+
+    def register(self, pyutId: int, oglObject: ProjectOglObject):
+        """
+        A later shape with the same id replaces the earlier one, as the dictionaries always did
+
+        Args:
+            pyutId:     The id of the shape's Pyut object
+            oglObject:  The shape;  Deferred classes are registered as their `OglClassProxy`
+        """
+        if isinstance(oglObject, OglSDInstance):
+            self._oglSDInstances[pyutId] = oglObject
+        else:
+            assert isinstance(oglObject, (OglClass, OglClassProxy, OglNote, OglActor, OglUseCase)), f'Not a linkable shape: {oglObject}'
+            self._linkableOglObjects[pyutId] = oglObject
@@ -0,0 +1,25 @@
+
+from typing import Any
+
+from lxml.etree import XMLPullParser
+
+from untanglepyut.ElementTreeDocumentStream import ElementTreeDocumentStream
+
+from untanglepyut.XmlBackend import XmlChunk
+
+
+class LxmlDocumentStream(ElementTreeDocumentStream):
+    """
+    The lxml backend;  Only importable when lxml is installed.  Entity declarations are
+    rejected by the inherited prolog parser and nothing is fetched from the network
+    """
+    def _createPullParser(self) -> Any:
+        return XMLPullParser(events=('start', 'end'), resolve_entities=False, no_network=True)
+
+    def _toParserInput(self, xmlChunk: XmlChunk) -> XmlChunk:
+        """
+        lxml does not accept memory views
+        """
+        if isinstance(xmlChunk, memoryview):
+            return xmlChunk.tobytes()
+        return xmlChunk
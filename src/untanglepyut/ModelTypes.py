@@ -0,0 +1,148 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import TYPE_CHECKING
+from typing import Union
+from typing import cast
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pyutmodelv2.PyutActor import PyutActor
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutInterface import PyutInterface
+from pyutmodelv2.PyutLink import PyutLink
+from pyutmodelv2.PyutNote import PyutNote
+from pyutmodelv2.PyutSDInstance import PyutSDInstance
+from pyutmodelv2.PyutSDMessage import PyutSDMessage
+from pyutmodelv2.PyutText import PyutText
+from pyutmodelv2.PyutUseCase import PyutUseCase
+
+if TYPE_CHECKING:
+    from untanglepyut.GeometryTable import GeometryTable     # numpy is optional
+
+"""
+The types that do not need Ogl;  Importing this module never imports the wx backed ogl or miniogl packages
+"""
+
+DocumentTitle = NewType('DocumentTitle', str)
+
+
+@dataclass
+class ProjectInformation:
+    fileName: str = cast(str, None)
+    version:  str = cast(str, None)
+    codePath: str = cast(str, None)
+
+
+DocumentTitles = NewType('DocumentTitles', List[DocumentTitle])
+
+
+def createDocumentTitles() -> DocumentTitles:
+    return DocumentTitles([])
+
+
+@dataclass
+class DocumentChanges:
+    """
+    What an incremental untangle did to each title, in document order;  `removed` is in the
+    order of the previous load
+    """
+    added:     DocumentTitles = field(default_factory=createDocumentTitles)
+    removed:   DocumentTitles = field(default_factory=createDocumentTitles)
+    rebuilt:   DocumentTitles = field(default_factory=createDocumentTitles)
+    unchanged: DocumentTitles = field(default_factory=createDocumentTitles)
+
+
+UntangledPyutClasses    = NewType('UntangledPyutClasses',    List[PyutClass])
+UntangledPyutLinks      = NewType('UntangledPyutLinks',      List[PyutLink])
+UntangledPyutInterfaces = NewType('UntangledPyutInterfaces', List[PyutInterface])
+UntangledPyutNotes      = NewType('UntangledPyutNotes',      List[PyutNote])
+UntangledPyutTexts      = NewType('UntangledPyutTexts',      List[PyutText])
+UntangledPyutActors     = NewType('UntangledPyutActors',     List[PyutActor])
+UntangledPyutUseCases   = NewType('UntangledPyutUseCases',   List[PyutUseCase])
+
+PyutSDInstances = NewType('PyutSDInstances', Dict[int, PyutSDInstance])
+PyutSDMessages  = NewType('PyutSDMessages',  Dict[int, PyutSDMessage])
+
+PyutClassesByName = NewType('PyutClassesByName', Dict[str, List[PyutClass]])
+
+
+def createUntangledPyutClasses() -> UntangledPyutClasses:
+    return UntangledPyutClasses([])
+
+
+def createUntangledPyutLinks() -> UntangledPyutLinks:
+    return UntangledPyutLinks([])
+
+
+def createUntangledPyutInterfaces() -> UntangledPyutInterfaces:
+    return UntangledPyutInterfaces([])
+
+
+def createUntangledPyutNotes() -> UntangledPyutNotes:
+    return UntangledPyutNotes([])
+
+
+def createUntangledPyutTexts() -> UntangledPyutTexts:
+    return UntangledPyutTexts([])
+
+
+def createUntangledPyutActors() -> UntangledPyutActors:
+    return UntangledPyutActors([])
+
+
+def createUntangledPyutUseCases() -> UntangledPyutUseCases:
+    return UntangledPyutUseCases([])
+
+
+def createPyutClassesByName() -> PyutClassesByName:
+    return PyutClassesByName({})
+
+
+def createPyutSDInstances() -> PyutSDInstances:
+    return PyutSDInstances({})
+
+
+def createPyutSDMessages() -> PyutSDMessages:
+    return PyutSDMessages({})
+
+
+@dataclass
+class ModelDocument:
+    """
+    A document of Pyut model objects only.  The links are resolved;  A class's parents and links
+    are set the same way the Ogl untangler sets them.  `geometryTable` is `None` unless the
+    untangler was asked to build it.
+
+    `pyutClassesByName` maps each class name to its classes in document order;  The first one is the one to use
+    """
+    documentType:    str           = ''
+    documentTitle:   DocumentTitle = DocumentTitle('')
+    scrollPositionX: int = -1
+    scrollPositionY: int = -1
+    pixelsPerUnitX:  int = -1
+    pixelsPerUnitY:  int = -1
+    pyutClasses:     UntangledPyutClasses    = field(default_factory=createUntangledPyutClasses)
+    pyutLinks:       UntangledPyutLinks      = field(default_factory=createUntangledPyutLinks)
+    pyutInterfaces:  UntangledPyutInterfaces = field(default_factory=createUntangledPyutInterfaces)
+    pyutNotes:       UntangledPyutNotes      = field(default_factory=createUntangledPyutNotes)
+    pyutTexts:       UntangledPyutTexts      = field(default_factory=createUntangledPyutTexts)
+    pyutActors:      UntangledPyutActors     = field(default_factory=createUntangledPyutActors)
+    pyutUseCases:    UntangledPyutUseCases   = field(default_factory=createUntangledPyutUseCases)
+    pyutSDInstances: PyutSDInstances = field(default_factory=createPyutSDInstances)
+    pyutSDMessages:  PyutSDMessages  = field(default_factory=createPyutSDMessages)
+    geometryTable:   'GeometryTable' = cast('GeometryTable', None)
+
+    pyutClassesByName: PyutClassesByName = field(default_factory=createPyutClassesByName)
+
+
+ModelDocuments = NewType('ModelDocuments', Dict[DocumentTitle, ModelDocument])
+
+LinkablePyutObject  = Union[PyutClass, PyutNote, PyutActor, PyutUseCase, PyutSDInstance]
+LinkablePyutObjects = NewType('LinkablePyutObjects', Dict[int, LinkablePyutObject])
+
+
+def createLinkablePyutObjects() -> LinkablePyutObjects:
+    return LinkablePyutObjects({})
@@ -0,0 +1,325 @@
+
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutLink import PyutLink
+from pyutmodelv2.PyutSDInstance import PyutSDInstance
+from pyutmodelv2.PyutSDMessage import PyutSDMessage
+
+from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
+
+from untanglepyut.GraphicRecords import PyutLinkRecord
+
+from untanglepyut.ModelTypes import DocumentTitle
+from untanglepyut.ModelTypes import LinkablePyutObject
+from untanglepyut.ModelTypes import LinkablePyutObjects
+from untanglepyut.ModelTypes import ModelDocument
+from untanglepyut.ModelTypes import ModelDocuments
+from untanglepyut.ModelTypes import ProjectInformation
+from untanglepyut.ModelTypes import UntangledPyutLinks
+from untanglepyut.ModelTypes import createLinkablePyutObjects
+from untanglepyut.ModelTypes import createUntangledPyutLinks
+
+from untanglepyut.SymbolTable import SymbolTable
+from untanglepyut.UnTangleIO import UnTangleIO
+from untanglepyut.UnTangleProjectInformation import UnTangleProjectInformation
+from untanglepyut.UnTanglePyut import ConvolutedPyutSDMessageInformation
+from untanglepyut.UnTanglePyut import UnTanglePyut
+from untanglepyut.XmlSchema import XmlSchema
+from untanglepyut.XmlVersion import XmlVersion
+
+from untanglepyut.XmlBackend import DocumentStream
+from untanglepyut.XmlBackend import XmlBackendType
+from untanglepyut.XmlBackend import XmlChunk
+from untanglepyut.XmlBackend import XmlElement
+
+
+class ModelUnTangler(UnTangleIO):
+    """
+    Untangles Pyut XML to the pyutmodelv2 objects only.  Nothing here imports or builds Ogl, so
+    code generators, linters and metrics that never draw do not load the wx backed ogl stack.
+
+    The links are resolved by id.  Sequence diagram messages and actor links reference their
+    PyutSDInstance
+    """
+    def __init__(self, xmlVersion: XmlVersion = cast(XmlVersion, None), backendType: XmlBackendType = XmlBackendType.UNTANGLE, geometryTable: bool = False):
+        """
+
+        Args:
+            xmlVersion:  The XML version of the files to untangle;  When `None` the version is read from
+                         each file's PyutProject header during the same pass that untangles it
+            backendType: The XML parser that feeds the untangler
+            geometryTable: When `True` each document also gets a columnar `GeometryTable`;  Needs numpy
+        """
+        super().__init__()
+        self.logger: Logger = getLogger(__name__)
+
+        self._detectXmlVersion: bool           = xmlVersion is None
+        self._backendType:      XmlBackendType = backendType
+        self._geometryTable:    bool           = geometryTable
+
+        self._xmlVersion:   XmlVersion   = cast(XmlVersion, None)
+        self._schema:       XmlSchema    = cast(XmlSchema, None)
+        self._untanglePyut: UnTanglePyut = cast(UnTanglePyut, None)
+
+        self._projectInformation: ProjectInformation              = cast(ProjectInformation, None)
+        self._documents:          ModelDocuments                  = ModelDocuments({})
+        self._symbolTable:        SymbolTable[LinkablePyutObject] = SymbolTable()
+
+        if self._detectXmlVersion is False:
+            self._bindXmlVersion(xmlVersion=xmlVersion)
+
+    @property
+    def xmlVersion(self) -> XmlVersion:
+        """
+        When detecting, the version of the last untangled file
+
+        Returns:  The XML version the untangler is bound to
+        """
+        return self._xmlVersion
+
+    @property
+    def projectInformation(self) -> ProjectInformation:
+        """
+        This property return nothing valid until you untangle the file
+
+        Returns:  The project information of the untangled pyut file
+        """
+        return self._projectInformation
+
+    @property
+    def documents(self) -> ModelDocuments:
+        return self._documents
+
+    @property
+    def symbolTable(self) -> SymbolTable[LinkablePyutObject]:
+        """
+        Kept in step with `documents`
+
+        Returns:  The classes, notes, actors, use cases and sequence diagram instances of every document
+        """
+        return self._symbolTable
+
+    def untangleFile(self, fqFileName: str):
+        """
+        Read input file and untangle to Pyut model objects
+
+        Args:
+            fqFileName:  The .xml or .put file name
+        """
+        for modelDocument in self.iterDocuments(fqFileName=fqFileName):
+            self._documents[modelDocument.documentTitle] = modelDocument
+            self._addSymbols(modelDocument=modelDocument)
+
+    def untangleXml(self, xmlString: str, fqFileName: str):
+        """
+        Untangle the input Xml string to Pyut model objects
+
+        Args:
+            xmlString:   The string with the raw XML
+            fqFileName:  The file name from which the XML came from
+        """
+        for modelDocument in self._iterXmlChunks(xmlChunks=[xmlString], fqFileName=fqFileName):
+            self._documents[modelDocument.documentTitle] = modelDocument
+            self._addSymbols(modelDocument=modelDocument)
+
+    def iterDocuments(self, fqFileName: str) -> Iterator[ModelDocument]:
+        """
+        Yields each document as soon as its PyutDocument closes;  The documents are not kept in `documents`
+
+        Args:
+            fqFileName:  The .xml or .put file name
+
+        Returns:  The untangled documents in file order
+        """
+        if fqFileName.endswith('.put'):
+            xmlChunks: Iterable[XmlChunk] = self.decompressedChunks(fqFileName=fqFileName)
+        else:
+            xmlChunks = self.mappedXmlChunks(fqFileName=fqFileName)
+
+        yield from self._iterXmlChunks(xmlChunks=xmlChunks, fqFileName=fqFileName)
+
+    def _iterXmlChunks(self, xmlChunks: Iterable[XmlChunk], fqFileName: str) -> Iterator[ModelDocument]:
+
+        documentStream: DocumentStream = self._backendType.createDocumentStream()
+
+        projectStarted: bool = False
+        for pyutDocument in documentStream.documents(xmlChunks=xmlChunks):
+            if projectStarted is False:
+                self._startProject(pyutProject=documentStream.pyutProject, fqFileName=fqFileName)
+                projectStarted = True
+
+            yield self._untangleDocument(pyutDocument=pyutDocument)
+
+        if projectStarted is False:
+            self._startProject(pyutProject=documentStream.pyutProject, fqFileName=fqFileName)
+
+    def _startProject(self, pyutProject: XmlElement, fqFileName: str):
+
+        if self._detectXmlVersion is True:
+            self._bindXmlVersion(xmlVersion=XmlVersion.fromProjectVersion(pyutProject['version']))
+        self._untanglePyut.internTable.clear()
+
+        self._projectInformation = UnTangleProjectInformation.toProjectInformation(pyutProject=pyutProject, fqFileName=fqFileName)
+
+    def _bindXmlVersion(self, xmlVersion: XmlVersion):
+
+        if xmlVersion == self._xmlVersion:
+            return
+
+        self._xmlVersion   = xmlVersion
+        self._schema       = XmlSchema.forVersion(xmlVersion)
+        self._untanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
+
+    def _untangleDocument(self, pyutDocument: XmlElement) -> ModelDocument:
+
+        modelDocument: ModelDocument = ModelDocument()
+
+        modelDocument.documentType    = pyutDocument['type']
+        modelDocument.documentTitle   = DocumentTitle(pyutDocument['title'])
+        modelDocument.scrollPositionX = int(pyutDocument['scrollPositionX'])
+        modelDocument.scrollPositionY = int(pyutDocument['scrollPositionY'])
+        modelDocument.pixelsPerUnitX  = int(pyutDocument['pixelsPerUnitX'])
+        modelDocument.pixelsPerUnitY  = int(pyutDocument['pixelsPerUnitY'])
+
+        untanglePyut: UnTanglePyut = self._untanglePyut
+        schema:       XmlSchema    = self._schema
+
+        if modelDocument.documentType == 'CLASS_DIAGRAM':
+            for graphicClass in pyutDocument.get_elements(schema.elementOglClass):
+                pyutClass: PyutClass = untanglePyut.classToPyutClass(graphicClass=graphicClass)
+
+                modelDocument.pyutClasses.append(pyutClass)
+                modelDocument.pyutClassesByName.setdefault(pyutClass.name, []).append(pyutClass)
+            self._untangleNotesAndTexts(pyutDocument=pyutDocument, modelDocument=modelDocument)
+
+            modelDocument.pyutLinks = self._untangleLinks(pyutDocument=pyutDocument, modelDocument=modelDocument, addToSource=True)
+            for graphicLollipop in pyutDocument.get_elements(schema.elementOglInterface2):
+                modelDocument.pyutInterfaces.append(untanglePyut.interfaceToPyutInterface(oglInterface2=graphicLollipop))
+
+        elif modelDocument.documentType == 'SEQUENCE_DIAGRAM':
+            for graphicSDInstance in pyutDocument.get_elements(schema.elementInstance):
+                pyutSDInstance: PyutSDInstance = untanglePyut.sdInstanceToPyutSDInstance(oglSDInstanceElement=graphicSDInstance)
+                modelDocument.pyutSDInstances[pyutSDInstance.id] = pyutSDInstance
+
+            for graphicSDMessage in pyutDocument.get_elements(schema.elementMessage):
+                bogus:         ConvolutedPyutSDMessageInformation = untanglePyut.sdMessageToPyutSDMessage(oglSDMessageElement=graphicSDMessage)
+                pyutSDMessage: PyutSDMessage                      = bogus.pyutSDMessage
+
+                pyutSDMessage.source      = modelDocument.pyutSDInstances[bogus.sourceId]
+                pyutSDMessage.destination = modelDocument.pyutSDInstances[bogus.destinationId]
+
+                modelDocument.pyutSDMessages[pyutSDMessage.id] = pyutSDMessage
+
+            for graphicActor in pyutDocument.get_elements(schema.elementActor):
+                modelDocument.pyutActors.append(untanglePyut.actorToPyutActor(graphicActor=graphicActor))
+
+            modelDocument.pyutLinks = self._untangleLinks(pyutDocument=pyutDocument, modelDocument=modelDocument, addToSource=False)
+
+        elif modelDocument.documentType == 'USECASE_DIAGRAM':
+            for graphicActor in pyutDocument.get_elements(schema.elementActor):
+                modelDocument.pyutActors.append(untanglePyut.actorToPyutActor(graphicActor=graphicActor))
+            for graphicUseCase in pyutDocument.get_elements(schema.elementUseCase):
+                modelDocument.pyutUseCases.append(untanglePyut.useCaseToPyutUseCase(graphicUseCase=graphicUseCase))
+            self._untangleNotesAndTexts(pyutDocument=pyutDocument, modelDocument=modelDocument)
+
+            modelDocument.pyutLinks = self._untangleLinks(pyutDocument=pyutDocument, modelDocument=modelDocument, addToSource=True)
+        else:
+            assert False, f'Unknown document type: {modelDocument.documentType}'
+
+        if self._geometryTable is True:
+            from untanglepyut.GeometryTable import GeometryTable
+            modelDocument.geometryTable = GeometryTable.fromPyutDocument(schema=schema, pyutDocument=pyutDocument)
+
+        return modelDocument
+
+    def _addSymbols(self, modelDocument: ModelDocument):
+        """
+        Replaces what was filed for an earlier document with the same title
+
+        Args:
+            modelDocument:  A fully untangled document
+        """
+        documentTitle: DocumentTitle                   = modelDocument.documentTitle
+        symbolTable:   SymbolTable[LinkablePyutObject] = self._symbolTable
+
+        symbolTable.removeDocument(documentTitle)
+
+        for name, pyutClasses in modelDocument.pyutClassesByName.items():
+            for pyutClass in pyutClasses:
+                symbolTable.add(documentTitle, pyutId=pyutClass.id, symbol=pyutClass, name=name)
+
+        for pyutNote in modelDocument.pyutNotes:
+            symbolTable.add(documentTitle, pyutId=pyutNote.id, symbol=pyutNote)
+        for pyutActor in modelDocument.pyutActors:
+            symbolTable.add(documentTitle, pyutId=pyutActor.id, symbol=pyutActor, name=pyutActor.name)
+        for pyutUseCase in modelDocument.pyutUseCases:
+            symbolTable.add(documentTitle, pyutId=pyutUseCase.id, symbol=pyutUseCase, name=pyutUseCase.name)
+        for pyutId, pyutSDInstance in modelDocument.pyutSDInstances.items():
+            symbolTable.add(documentTitle, pyutId=pyutId, symbol=pyutSDInstance, name=pyutSDInstance.instanceName)
+
+    def _untangleNotesAndTexts(self, pyutDocument: XmlElement, modelDocument: ModelDocument):
+
+        for graphicNote in pyutDocument.get_elements(self._schema.elementOglNote):
+            modelDocument.pyutNotes.append(self._untanglePyut.noteToPyutNote(graphicNote=graphicNote))
+        for graphicText in pyutDocument.get_elements(self._schema.elementOglText):
+            modelDocument.pyutTexts.append(self._untanglePyut.textToPyutText(graphicText=graphicText))
+
+    def _untangleLinks(self, pyutDocument: XmlElement, modelDocument: ModelDocument, addToSource: bool) -> UntangledPyutLinks:
+        """
+
+        Args:
+            pyutDocument:   The PyutDocument element
+            modelDocument:  The document with its linkable objects already untangled
+            addToSource:    When `True` update the source's parents or links like the Ogl untangler does
+
+        Returns:  The links with their source and destination resolved
+        """
+        pyutLinks:           UntangledPyutLinks  = createUntangledPyutLinks()
+        linkablePyutObjects: LinkablePyutObjects = self._buildLinkablePyutObjects(modelDocument=modelDocument)
+
+        for graphicLink in pyutDocument.get_elements(self._schema.elementOglLink):
+            links: List[XmlElement] = graphicLink.get_elements(self._schema.elementLink)
+            assert len(links) == 1, 'Should only ever be one'
+
+            pyutLinkRecord: PyutLinkRecord = PyutLinkRecord.fromLinkElement(schema=self._schema, linkElement=links[0])
+            try:
+                source      = linkablePyutObjects[pyutLinkRecord.sourceId]
+                destination = linkablePyutObjects[pyutLinkRecord.destinationId]
+            except KeyError as ke:
+                self.logger.error(f'Developer Error -- {pyutLinkRecord=}  KeyError index: {ke}')
+                continue
+
+            pyutLink: PyutLink = self._untanglePyut.linkRecordToPyutLink(pyutLinkRecord, source=source, destination=destination)   # type: ignore
+            if addToSource is True:
+                if pyutLink.linkType == PyutLinkType.INHERITANCE:
+                    source.addParent(destination)       # type: ignore
+                else:
+                    source.addLink(pyutLink)            # type: ignore
+
+            pyutLinks.append(pyutLink)
+
+        return pyutLinks
+
+    def _buildLinkablePyutObjects(self, modelDocument: ModelDocument) -> LinkablePyutObjects:
+
+        linkablePyutObjects: LinkablePyutObjects = createLinkablePyutObjects()
+
+        for pyutClass in modelDocument.pyutClasses:
+            linkablePyutObjects[pyutClass.id] = pyutClass
+        for pyutNote in modelDocument.pyutNotes:
+            linkablePyutObjects[pyutNote.id] = pyutNote
+        for pyutUseCase in modelDocument.pyutUseCases:
+            linkablePyutObjects[pyutUseCase.id] = pyutUseCase
+        for pyutActor in modelDocument.pyutActors:
+            linkablePyutObjects[pyutActor.id] = pyutActor
+        for pyutSDInstance in modelDocument.pyutSDInstances.values():
+            linkablePyutObjects[pyutSDInstance.id] = pyutSDInstance
+
+        return linkablePyutObjects
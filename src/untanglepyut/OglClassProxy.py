@@ -0,0 +1,107 @@
+
+from typing import Any
+from typing import Callable
+from typing import cast
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from ogl.OglClass import OglClass
+
+from untanglepyut.GraphicRecords import GraphicInformation
+
+from untanglepyut.XmlBackend import XmlElement
+
+PyutClassFactory = Callable[[XmlElement], PyutClass]
+OglClassFactory  = Callable[[GraphicInformation, PyutClass], OglClass]
+
+
+class OglClassProxy:
+    """
+    Stands in for an OglClass until something needs it.  The id, name and geometry are read up
+    front;  The PyutClass with its methods, parameters and source code is only untangled when
+    `pyutClass` is first read, and the OglClass with its shape model only when `oglClass` is
+    first read or an attribute that only the OglClass has is used.
+
+    Code that checks `isinstance(shape, OglClass)` or keeps shapes by identity must use `oglClass`
+    """
+    __slots__ = ('_pyutId', '_name', '_graphicInformation', '_graphicClass', '_pyutClassFactory', '_oglClassFactory', '_pyutClass', '_oglClass')
+
+    def __init__(self, graphicClass: XmlElement, classElement: XmlElement, pyutClassFactory: PyutClassFactory, oglClassFactory: OglClassFactory):
+        """
+
+        Args:
+            graphicClass:       The `GraphicClass` or `OglClass` element;  Kept until the OglClass is built
+            classElement:       Its `Class` or `PyutClass` child
+            pyutClassFactory:   Untangles the PyutClass from the graphic class element
+            oglClassFactory:    Builds the OglClass for the PyutClass
+        """
+        self._pyutId:             int                = int(classElement['id'])
+        self._name:               str                = classElement['name']
+        self._graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=graphicClass)
+
+        self._graphicClass:     XmlElement       = graphicClass
+        self._pyutClassFactory: PyutClassFactory = pyutClassFactory
+        self._oglClassFactory:  OglClassFactory  = oglClassFactory
+
+        self._pyutClass: PyutClass = cast(PyutClass, None)
+        self._oglClass:  OglClass  = cast(OglClass, None)
+
+    @property
+    def pyutId(self) -> int:
+        """
+        Not `id`;  That is the OglClass shape id
+
+        Returns:  The PyutClass id
+        """
+        return self._pyutId
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def graphicInformation(self) -> GraphicInformation:
+        return self._graphicInformation
+
+    @property
+    def pyutClass(self) -> PyutClass:
+        if self._pyutClass is None:
+            self._pyutClass = self._pyutClassFactory(self._graphicClass)
+        return self._pyutClass
+
+    @property
+    def oglClass(self) -> OglClass:
+        if self._oglClass is None:
+            self._oglClass     = self._oglClassFactory(self._graphicInformation, self.pyutClass)
+            self._graphicClass = cast(XmlElement, None)
+        return self._oglClass
+
+    def inside(self, x: int, y: int) -> bool:
+        """
+        The same test as the shape's `Inside`, done on the geometry so nothing is built
+
+        Args:
+            x:  Diagram x
+            y:  Diagram y
+
+        Returns:  `True` if the point is within the class's bounds
+        """
+        gi: GraphicInformation = self._graphicInformation
+        return gi.x <= x <= gi.x + gi.width and gi.y <= y <= gi.y + gi.height
+
+    def isMaterialized(self) -> bool:
+        """
+        Returns:  `True` if the OglClass has been built
+        """
+        return self._oglClass is not None
+
+    def __getattr__(self, attributeName: str) -> Any:
+        """
+        Only called for attributes the proxy does not have;  Builds the OglClass and hands them to it
+        """
+        if attributeName.startswith('_'):
+            raise AttributeError(attributeName)
+        return getattr(self.oglClass, attributeName)
+
+    def __repr__(self) -> str:
+        return f'OglClassProxy(pyutId={self._pyutId} name={self._name} materialized={self.isMaterialized()})'
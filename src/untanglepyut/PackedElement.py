@@ -0,0 +1,110 @@
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from sys import getsizeof
+
+from untanglepyut.IndexedDocument import IndexedDocument
+from untanglepyut.IndexedDocument import TagIndex
+from untanglepyut.IndexedDocument import createTagIndex
+
+from untanglepyut.XmlBackend import XmlElement
+
+#
+# (tag, attributes, cdata, children);  Only built-in types, so `marshal` can store it
+#
+PackedNode = Tuple[str, Dict[str, str], str, Tuple[Any, ...]]
+
+
+class PackedElement:
+    """
+    Adapts a packed node to the XmlElement protocol.  A packed node is the plain tuple form of an
+    element and its subtree that the ParseCache stores.  Like ElementTreeElement the adapter is a
+    single slot and children are wrapped as they are asked for
+    """
+    __slots__ = ('_node', )
+
+    def __init__(self, node: PackedNode):
+        self._node: PackedNode = node
+
+    @classmethod
+    def pack(cls, element: Any) -> PackedNode:
+        """
+        Comments and processing instructions (lxml) are left out, the same as ElementTreeElement does
+
+        Args:
+            element:  An ElementTree (or lxml) element
+
+        Returns:  The element and its subtree as a packed node
+        """
+        cdata: str = element.text or ''
+        for child in element:
+            cdata += child.tail or ''
+
+        children: Tuple[PackedNode, ...] = tuple(cls.pack(child) for child in element if isinstance(child.tag, str))
+
+        return element.tag, dict(element.attrib), cdata, children
+
+    @classmethod
+    def packedSize(cls, node: PackedNode) -> int:
+        """
+        Counts the tuples, attribute dictionaries and strings of the node and its subtree;  A string
+        that several nodes share is counted for each of them
+
+        Args:
+            node:  A packed node
+
+        Returns:  The bytes the packed node takes in memory
+        """
+        tag, attributes, cdata, children = node
+
+        byteSize: int = getsizeof(node) + getsizeof(tag) + getsizeof(attributes) + getsizeof(cdata) + getsizeof(children)
+        for name, value in attributes.items():
+            byteSize += getsizeof(name) + getsizeof(value)
+        for child in children:
+            byteSize += cls.packedSize(child)
+
+        return byteSize
+
+    @classmethod
+    def indexDocument(cls, node: PackedNode) -> IndexedDocument:
+        """
+        Args:
+            node:  A packed PyutDocument
+
+        Returns:  The document with its children indexed by tag name
+        """
+        tagIndex: TagIndex = createTagIndex()
+        for child in node[3]:
+            tagIndex.setdefault(child[0], []).append(PackedElement(child))
+
+        return IndexedDocument(pyutDocument=PackedElement(node), tagIndex=tagIndex)
+
+    @property
+    def node(self) -> PackedNode:
+        return self._node
+
+    @property
+    def cdata(self) -> str:
+        return self._node[2]
+
+    def get_elements(self, name: str = cast(str, None)) -> List[XmlElement]:
+        """
+        Args:
+            name:  A tag name;  When `None` all the children
+
+        Returns:  The wrapped child elements
+        """
+        if name is None:
+            return [PackedElement(child) for child in self._node[3]]
+        else:
+            return [PackedElement(child) for child in self._node[3] if child[0] == name]
+
+    def __getitem__(self, key: str) -> str:
+        return cast(str, self._node[1].get(key))
+
+    def __repr__(self) -> str:
+        return f'PackedElement(tag={self._node[0]} attributes={self._node[1]})'
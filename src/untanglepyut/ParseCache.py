@@ -0,0 +1,224 @@
+
+from typing import Any
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import makedirs
+from os import replace
+from os import scandir
+from os import stat
+from os import stat_result
+from os import unlink
+from os import utime
+
+from os.path import abspath
+from os.path import join as osPathJoin
+
+from hashlib import blake2b
+
+from marshal import dumps
+from marshal import loads
+
+from sys import implementation
+
+from tempfile import NamedTemporaryFile
+
+from zlib import decompress
+
+from untanglepyut.PackedElement import PackedNode
+
+from untanglepyut.ProjectCache import CachedProject
+
+DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+
+ENTRY_SUFFIX: str = '.parsed'
+
+#
+# (format, path, mtime, size, content hash, project, documents)
+#
+CacheEntry = Tuple[int, str, int, int, str, PackedNode, List[PackedNode]]
+
+
+class ParseCache:
+    """
+    Parsed projects in a directory, so processes that start cold do not parse the same unchanged
+    files again.  An entry is the packed project in `marshal` form.  It is used while the file's
+    path, modification time and size are the same;  With `verifyContent` its content hash must also match,
+    which costs a read of the file but no parse.
+
+    Each entry is written to a temporary file that is renamed over the old one, so concurrent
+    readers and writers only ever see complete entries;  The last writer wins.  A hit refreshes the
+    entry's modification time and the oldest entries are removed once the directory is over budget.
+
+    The entries are only for the Python that wrote them, the same as `__pycache__`;  Do not point
+    the cache at a directory that others can write
+    """
+    FORMAT_VERSION: int = 1
+
+    def __init__(self, cacheDirectory: str, maxBytes: int = DEFAULT_MAX_BYTES, verifyContent: bool = False):
+        """
+
+        Args:
+            cacheDirectory: Where the entries go;  Created when missing
+            maxBytes:       The most bytes of entries to keep
+            verifyContent:  When `True` an entry is also checked against a hash of the file's bytes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._cacheDirectory: str  = cacheDirectory
+        self._maxBytes:       int  = maxBytes
+        self._verifyContent:  bool = verifyContent
+
+        self._hits:   int = 0
+        self._misses: int = 0
+
+        makedirs(cacheDirectory, exist_ok=True)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def load(self, fqFileName: str) -> CachedProject:
+        """
+        Args:
+            fqFileName:  An .xml or .put file
+
+        Returns:  The parsed project, from the cache when the file has not changed
+        """
+        fqFileName = abspath(fqFileName)
+
+        fileStat:  stat_result = stat(fqFileName)
+        entryPath: str         = self._entryPath(fqFileName=fqFileName)
+        rawBytes:  bytes       = cast(bytes, None)
+
+        cacheEntry: CacheEntry = self._readEntry(entryPath=entryPath)
+        if cacheEntry is not None and cacheEntry[1:4] == (fqFileName, fileStat.st_mtime_ns, fileStat.st_size):
+            if self._verifyContent is True:
+                rawBytes = self._readFile(fqFileName=fqFileName)
+            if rawBytes is None or self._contentHash(rawBytes) == cacheEntry[4]:
+                self._hits += 1
+                self._touch(entryPath=entryPath)
+                return self._toCachedProject(cacheEntry=cacheEntry)
+
+        self._misses += 1
+        if rawBytes is None:
+            rawBytes = self._readFile(fqFileName=fqFileName)
+
+        cacheEntry = self._parse(fqFileName=fqFileName, fileStat=fileStat, rawBytes=rawBytes)
+        self._writeEntry(entryPath=entryPath, cacheEntry=cacheEntry)
+        self._evict()
+
+        return self._toCachedProject(cacheEntry=cacheEntry)
+
+    def clear(self):
+        for entryPath, _, _ in self._entries():
+            self._remove(entryPath=entryPath)
+
+    def _entryPath(self, fqFileName: str) -> str:
+        """
+        The interpreter's cache tag keeps one Python's entries away from another's
+        """
+        pathHash: str = blake2b(fqFileName.encode('utf-8'), digest_size=16).hexdigest()
+
+        return osPathJoin(self._cacheDirectory, f'{pathHash}.{implementation.cache_tag}{ENTRY_SUFFIX}')
+
+    def _readEntry(self, entryPath: str) -> CacheEntry:
+        """
+        Returns:  The entry or `None` if there is none or it is not usable
+        """
+        try:
+            with open(entryPath, 'rb') as entryFile:
+                cacheEntry: Any = loads(entryFile.read())
+        except FileNotFoundError:
+            return cast(CacheEntry, None)
+        except (EOFError, ValueError, TypeError) as e:
+            self.logger.warning(f'Ignoring a damaged cache entry {entryPath}: {e}')
+            return cast(CacheEntry, None)
+
+        if isinstance(cacheEntry, tuple) is False or len(cacheEntry) != 7 or cacheEntry[0] != ParseCache.FORMAT_VERSION:
+            return cast(CacheEntry, None)
+
+        return cacheEntry
+
+    def _parse(self, fqFileName: str, fileStat: stat_result, rawBytes: bytes) -> CacheEntry:
+
+        xmlBytes:      bytes         = decompress(rawBytes) if fqFileName.endswith('.put') else rawBytes
+        cachedProject: CachedProject = CachedProject.fromXml(xmlBytes=xmlBytes)
+
+        contentHash: str = self._contentHash(rawBytes) if self._verifyContent is True else ''
+
+        return ParseCache.FORMAT_VERSION, fqFileName, fileStat.st_mtime_ns, fileStat.st_size, contentHash, cachedProject.projectNode, cachedProject.documentNodes
+
+    def _writeEntry(self, entryPath: str, cacheEntry: CacheEntry):
+        """
+        A failed write only costs a parse the next time
+        """
+        temporaryName: str = cast(str, None)
+        try:
+            with NamedTemporaryFile(mode='wb', dir=self._cacheDirectory, suffix='.tmp', delete=False) as temporaryFile:
+                temporaryName = temporaryFile.name
+                temporaryFile.write(dumps(cacheEntry))
+            replace(temporaryName, entryPath)
+        except OSError as e:
+            self.logger.warning(f'Could not write cache entry {entryPath}: {e}')
+            if temporaryName is not None:
+                self._remove(entryPath=temporaryName)
+
+    def _evict(self):
+        """
+        Oldest first;  Other processes may be removing the same entries
+        """
+        entries:   List[Tuple[str, int, float]] = self._entries()
+        totalSize: int                          = sum(size for _, size, _ in entries)
+
+        for entryPath, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if totalSize <= self._maxBytes:
+                break
+            self._remove(entryPath=entryPath)
+            totalSize -= size
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        """
+        Returns:  The path, size and modification time of every entry
+        """
+        entries: List[Tuple[str, int, float]] = []
+        with scandir(self._cacheDirectory) as directoryEntries:
+            for directoryEntry in directoryEntries:
+                if directoryEntry.name.endswith(ENTRY_SUFFIX) is True:
+                    try:
+                        entryStat: stat_result = directoryEntry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((directoryEntry.path, entryStat.st_size, entryStat.st_mtime))
+
+        return entries
+
+    def _toCachedProject(self, cacheEntry: CacheEntry) -> CachedProject:
+        return CachedProject.fromNodes(projectNode=cacheEntry[5], documentNodes=cacheEntry[6])
+
+    def _readFile(self, fqFileName: str) -> bytes:
+        with open(fqFileName, 'rb') as projectFile:
+            return projectFile.read()
+
+    def _contentHash(self, rawBytes: bytes) -> str:
+        return blake2b(rawBytes, digest_size=20).hexdigest()
+
+    def _touch(self, entryPath: str):
+        try:
+            utime(entryPath)
+        except OSError:
+            pass
+
+    def _remove(self, entryPath: str):
+        try:
+            unlink(entryPath)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,193 @@
+
+from typing import List
+from typing import NamedTuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from hashlib import blake2b
+
+from threading import Lock
+
+from untanglepyut.ElementTreeDocumentStream import ElementTreeDocumentStream
+from untanglepyut.ElementTreeElement import ElementTreeElement
+
+from untanglepyut.PackedElement import PackedElement
+from untanglepyut.PackedElement import PackedNode
+
+from untanglepyut.XmlBackend import XmlElement
+
+DEFAULT_MAX_ENTRIES: int = 16
+
+
+class CacheKey(NamedTuple):
+    """
+    Equal bytes parsed with the same encoding give equal packed trees
+    """
+    contentHash: str
+    encoding:    str
+
+
+class CachedProject(NamedTuple):
+    """
+    The packed form of a project;  The untanglers only read it, so every hit can share it.  The
+    element views over the packed nodes are built each time they are asked for, so they are not
+    kept alive by the caches
+    """
+    projectNode:   PackedNode
+    documentNodes: List[PackedNode]
+    byteSize:      int
+
+    @classmethod
+    def fromXml(cls, xmlBytes: bytes, encoding: str = cast(str, None)) -> 'CachedProject':
+        """
+        ElementTree builds the tree in C and packing it is a single walk
+
+        Args:
+            xmlBytes:  The raw XML of a whole project
+            encoding:  Overrides the encoding in the XML declaration
+
+        Returns:  The packed project
+        """
+        documentStream: ElementTreeDocumentStream = ElementTreeDocumentStream(encoding=encoding)
+        documentNodes:  List[PackedNode]          = [
+            PackedElement.pack(cast(ElementTreeElement, pyutDocument.pyutDocument).element) for pyutDocument in documentStream.documents(xmlChunks=[xmlBytes])
+        ]
+        projectNode: PackedNode = PackedElement.pack(documentStream.pyutProject.element)
+
+        return cls.fromNodes(projectNode=projectNode, documentNodes=documentNodes)
+
+    @classmethod
+    def fromNodes(cls, projectNode: PackedNode, documentNodes: List[PackedNode]) -> 'CachedProject':
+        """
+        Args:
+            projectNode:    The packed PyutProject without its documents
+            documentNodes:  The packed PyutDocuments in file order
+
+        Returns:  The project charged with what its packed nodes take in memory
+        """
+        byteSize: int = PackedElement.packedSize(projectNode) + sum(PackedElement.packedSize(documentNode) for documentNode in documentNodes)
+
+        return cls(projectNode=projectNode, documentNodes=documentNodes, byteSize=byteSize)
+
+    @property
+    def pyutProject(self) -> XmlElement:
+        return PackedElement(self.projectNode)
+
+    @property
+    def pyutDocuments(self) -> List[XmlElement]:
+        """
+        Returns:  A fresh view of each document with its children indexed by tag name
+        """
+        return [PackedElement.indexDocument(documentNode) for documentNode in self.documentNodes]
+
+
+class ProjectCache:
+    """
+    Parsed projects by the hash of their raw bytes, least recently used first out.  A hit skips the
+    decompression and the parse;  The Ogl objects are still built fresh for every untangle since
+    they are mutable.
+
+    The projects are kept packed, the same as in the ParseCache, and the byte budget counts what
+    the packed nodes take in memory.  The parse always uses ElementTree, so untanglers with any
+    backend share the entries.  One cache can be shared by any number of untanglers, including from
+    different threads
+    """
+    __slots__ = ('logger', '_maxEntries', '_maxBytes', '_projects', '_byteSize', '_hits', '_misses', '_lock')
+
+    def __init__(self, maxEntries: int = DEFAULT_MAX_ENTRIES, maxBytes: int = cast(int, None)):
+        """
+
+        Args:
+            maxEntries:  The most projects to keep
+            maxBytes:    The most bytes of packed projects to keep;  When `None` only the entries count
+        """
+        assert maxEntries > 0, 'A cache needs room for at least one project'
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxEntries: int = maxEntries
+        self._maxBytes:   int = maxBytes
+
+        self._projects: OrderedDict[CacheKey, CachedProject] = OrderedDict()
+        self._byteSize: int = 0
+        self._hits:     int = 0
+        self._misses:   int = 0
+        self._lock:     Lock = Lock()
+
+    @classmethod
+    def contentKey(cls, rawBytes: bytes, encoding: str = cast(str, None)) -> CacheKey:
+        """
+        Args:
+            rawBytes:  The bytes as read;  Compressed ones are hashed before they are decompressed
+            encoding:  The encoding override the parser is given
+
+        Returns:  The key for these bytes
+        """
+        return CacheKey(contentHash=blake2b(rawBytes, digest_size=20).hexdigest(), encoding=encoding)
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    @property
+    def byteSize(self) -> int:
+        return self._byteSize
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, cacheKey: CacheKey) -> CachedProject:
+        """
+        Args:
+            cacheKey:  From `contentKey`
+
+        Returns:  The packed project or `None`
+        """
+        with self._lock:
+            cachedProject: CachedProject = cast(CachedProject, self._projects.get(cacheKey))
+            if cachedProject is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._projects.move_to_end(cacheKey)
+
+        return cachedProject
+
+    def put(self, cacheKey: CacheKey, cachedProject: CachedProject):
+        """
+        Evicts the least recently used projects until the new one fits;  A project bigger than
+        the whole byte budget is not kept
+
+        Args:
+            cacheKey:       From `contentKey`
+            cachedProject:  The packed project
+        """
+        if self._maxBytes is not None and cachedProject.byteSize > self._maxBytes:
+            self.logger.info(f'Not caching {cachedProject.byteSize} bytes;  Budget is {self._maxBytes}')
+            return
+
+        with self._lock:
+            previous: CachedProject = cast(CachedProject, self._projects.pop(cacheKey, None))
+            if previous is not None:
+                self._byteSize -= previous.byteSize
+
+            self._projects[cacheKey] = cachedProject
+            self._byteSize += cachedProject.byteSize
+
+            while len(self._projects) > self._maxEntries or (self._maxBytes is not None and self._byteSize > self._maxBytes):
+                evictedKey, evicted = self._projects.popitem(last=False)
+                self._byteSize -= evicted.byteSize
+                self.logger.debug(f'Evicted {evictedKey.contentHash}')
+
+    def clear(self):
+        with self._lock:
+            self._projects.clear()
+            self._byteSize = 0
@@ -0,0 +1,113 @@
+
+from typing import Generator
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from untanglepyut.PyutDocumentStream import PyutDocumentStream
+from untanglepyut.UnTangleIO import UnTangleIO
+from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
+from untanglepyut.XmlBackend import XmlChunk
+
+XmlChunks = Generator[XmlChunk, None, None]
+
+
+@dataclass
+class ProbedDocument:
+    """
+    The PyutDocument attributes a router cares about;  Nothing in the document is parsed
+    """
+    documentTitle: str = ''
+    documentType:  str = ''
+
+
+@dataclass
+class ProbedProject:
+    """
+    `documents` is `None` unless the documents were catalogued
+    """
+    fileName:  str                  = cast(str, None)
+    version:   str                  = cast(str, None)
+    codePath:  str                  = cast(str, None)
+    documents: List[ProbedDocument] = cast(List[ProbedDocument], None)
+
+
+class ProjectProbe(UnTangleIO):
+    """
+    Reads the PyutProject header without loading the project.  Use it to pick the XmlVersion or to
+    route files.  Without the catalogue only the first few kilobytes of a file are read;  For a .put
+    file only those few kilobytes are decompressed.  Neither mode imports or builds any Ogl objects.
+
+    The catalogue has to read the whole file, but the document content is skipped, not parsed into
+    elements
+    """
+    HEADER_CHUNK_SIZE: int = 4 * 1024
+
+    def __init__(self):
+        super().__init__()
+        self.logger: Logger = getLogger(__name__)
+
+    def probe(self, fqFileName: str, catalogue: bool = False) -> ProbedProject:
+        """
+
+        Args:
+            fqFileName:  The fully qualified file for a .xml or .put file
+            catalogue:   When `True` also list the title and type of every document
+
+        Returns:  The project header plus the optional document catalogue
+        """
+        if fqFileName.endswith('.put') is False and fqFileName.endswith('.xml') is False:
+            raise UnsupportedFileTypeException(message='File must end with .xml or .put extension')
+
+        if catalogue is True:
+            chunkSize: int = UnTangleIO.CHUNK_SIZE
+        else:
+            chunkSize = ProjectProbe.HEADER_CHUNK_SIZE
+
+        documentStream: PyutDocumentStream   = PyutDocumentStream(skipDocumentContent=True)
+        documents:      List[ProbedDocument] = []
+
+        xmlChunks: XmlChunks = self._xmlChunks(fqFileName=fqFileName, chunkSize=chunkSize)
+        for xmlChunk in xmlChunks:
+            documentStream.feed(xmlChunk)
+            if catalogue is False and documentStream.pyutProject is not None:
+                break
+            documents.extend(self._toProbedDocuments(documentStream=documentStream))
+        else:
+            documentStream.close()
+            documents.extend(self._toProbedDocuments(documentStream=documentStream))
+        #
+        # Give the file (and for .xml the map) back right away
+        #
+        xmlChunks.close()
+
+        if documentStream.pyutProject is None:
+            raise UnsupportedFileTypeException(message=f'No PyutProject in {fqFileName}')
+
+        probedProject: ProbedProject = ProbedProject(fileName=fqFileName,
+                                                     version=documentStream.pyutProject['version'],
+                                                     codePath=documentStream.pyutProject['CodePath'])
+        if catalogue is True:
+            probedProject.documents = documents
+
+        self.logger.debug(f'{probedProject=}')
+
+        return probedProject
+
+    def _xmlChunks(self, fqFileName: str, chunkSize: int) -> XmlChunks:
+
+        if fqFileName.endswith('.put'):
+            return cast(XmlChunks, self.decompressedChunks(fqFileName=fqFileName, chunkSize=chunkSize))
+        else:
+            return cast(XmlChunks, self.mappedXmlChunks(fqFileName=fqFileName, chunkSize=chunkSize))
+
+    def _toProbedDocuments(self, documentStream: PyutDocumentStream) -> List[ProbedDocument]:
+
+        return [
+            ProbedDocument(documentTitle=pyutDocument['title'], documentType=pyutDocument['type'])
+            for pyutDocument in documentStream.popDocuments()
+        ]
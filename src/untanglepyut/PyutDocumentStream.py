@@ -0,0 +1,207 @@
+
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from xml.parsers.expat import ParserCreate
+from xml.parsers.expat import XMLParserType
+
+from defusedxml.common import EntitiesForbidden
+from defusedxml.common import ExternalReferenceForbidden
+
+from untangle import Element
+
+from untanglepyut import XmlConstants
+
+from untanglepyut.IndexedDocument import IndexedDocument
+from untanglepyut.IndexedDocument import TagIndex
+from untanglepyut.IndexedDocument import createTagIndex
+from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from untanglepyut.XmlBackend import XmlChunk
+
+
+class PyutDocumentStream:
+    """
+    An incremental (expat) parser for Pyut project XML.
+
+    Unlike `untangle.parse` this class never builds the tree for the whole project.  It builds
+    `untangle` Elements for a single PyutDocument;  When the document's closing tag arrives
+    the completed subtree is detached from the project element and queued for the caller as
+    an IndexedDocument;  The tag index is filled in as the document's children start.  Once
+    the caller drops its reference the subtree is garbage.  Peak memory tracks one document instead
+    of the whole file.
+
+    Like `untangle`, entity declarations and external references are forbidden
+    """
+    def __init__(self, encoding: str = cast(str, None), skipDocumentContent: bool = False):
+        """
+
+        Args:
+            encoding:            Overrides the encoding in the XML declaration;  Use it when feeding
+                                 bytes that were encoded from a Python string
+            skipDocumentContent: When `True` the PyutDocument elements only have their attributes;  Use it
+                                 to catalogue a project without paying for the document content
+        """
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._parser:              XMLParserType = ParserCreate(encoding)
+        self._skipDocumentContent: bool          = skipDocumentContent
+
+        self._parser.buffer_text = True
+
+        self._parser.StartElementHandler      = self._startElement
+        self._parser.EndElementHandler        = self._endElement
+        self._parser.CharacterDataHandler     = self._characterData
+        self._parser.EntityDeclHandler        = self._forbidEntityDeclaration
+        self._parser.ExternalEntityRefHandler = self._forbidExternalReference
+
+        self._pyutProject:     Element                = cast(Element, None)
+        self._elements:        List[Element]          = []
+        self._tagIndex:        TagIndex               = createTagIndex()
+        self._documents:       deque[IndexedDocument] = deque()
+        self._documentOffsets: List[int]              = []
+        self._documentEnds:    List[int]              = []
+        self._skippedDepth:    int                    = 0
+
+    @property
+    def pyutProject(self) -> Element:
+        """
+        The PyutProject element;  It only ever has attributes, the documents are handed out
+        by `popDocuments()`.
+
+        Returns: `None` until the PyutProject start tag has been parsed
+        """
+        return self._pyutProject
+
+    @property
+    def documentOffsets(self) -> List[int]:
+        """
+        Where each PyutDocument start tag begins in the raw XML, in document order.  These are byte
+        offsets into the fed bytes (or the UTF-8 encoding of the fed strings)
+
+        Returns:  The offsets of the documents seen so far
+        """
+        return self._documentOffsets
+
+    @property
+    def documentEnds(self) -> List[int]:
+        """
+        Where each PyutDocument end tag begins, in the same bytes as `documentOffsets`.  A document's
+        content is the bytes from its offset to its end
+
+        Returns:  The ends of the documents completed so far
+        """
+        return self._documentEnds
+
+    @property
+    def headerLength(self) -> int:
+        """
+        The XML declaration and the PyutProject start tag come before the first PyutDocument.  Feeding
+        this many bytes followed by the bytes at one of the `documentOffsets` parses just that document
+
+        Returns:  The offset of the first PyutDocument;  -1 until it has been parsed
+        """
+        if len(self._documentOffsets) == 0:
+            return -1
+        return self._documentOffsets[0]
+
+    def feed(self, xmlChunk: XmlChunk):
+        """
+        Parse the next piece of the XML.  If the chunk is bytes the XML declaration decides the encoding
+
+        Args:
+            xmlChunk:  Any sized chunk of the raw XML
+        """
+        self._parser.Parse(xmlChunk, False)
+
+    def close(self):
+        """
+        Tell the parser there is no more XML;  Raises an ExpatError if the XML is incomplete
+        """
+        self._parser.Parse(b'', True)
+
+    def popDocuments(self) -> List[IndexedDocument]:
+        """
+        Hands out the completed PyutDocuments and forgets about them
+
+        Returns:  The PyutDocument elements completed since the last call;  May be empty
+        """
+        documents: List[IndexedDocument] = list(self._documents)
+        self._documents.clear()
+
+        return documents
+
+    def documents(self, xmlChunks: Iterable[XmlChunk]) -> Iterator[IndexedDocument]:
+        """
+        Feeds the XML chunks and yields each PyutDocument as soon as it is complete
+
+        Args:
+            xmlChunks:  The raw XML in one or more pieces
+
+        Returns:  A PyutDocument iterator
+        """
+        for xmlChunk in xmlChunks:
+            self.feed(xmlChunk)
+            yield from self.popDocuments()
+
+        self.close()
+        yield from self.popDocuments()
+
+    def _startElement(self, name: str, attributes: Dict[str, str]):
+
+        if self._skippedDepth > 0 or (self._skipDocumentContent is True and len(self._elements) == 2):
+            self._skippedDepth += 1
+            return
+
+        if name == XmlConstants.ELEMENT_DOCUMENT and len(self._elements) == 1:
+            self._documentOffsets.append(self._parser.CurrentByteIndex)
+            self._tagIndex = createTagIndex()
+
+        element: Element = Element(name, attributes)
+        if len(self._elements) == 2:
+            self._tagIndex.setdefault(name, []).append(element)
+
+        if len(self._elements) == 0:
+            if name != XmlConstants.ELEMENT_PROJECT:
+                raise UnsupportedFileTypeException(message=f'Not a Pyut project: {name}')
+            self._pyutProject = element
+        else:
+            self._elements[-1].add_child(element)
+
+        self._elements.append(element)
+
+    def _endElement(self, name: str):
+
+        if self._skippedDepth > 0:
+            self._skippedDepth -= 1
+            return
+
+        element: Element = self._elements.pop()
+        if name == XmlConstants.ELEMENT_DOCUMENT and len(self._elements) == 1:
+            self._documentEnds.append(self._parser.CurrentByteIndex)
+            self._pyutProject.children.pop()
+            self._documents.append(IndexedDocument(pyutDocument=element, tagIndex=self._tagIndex))
+            self.logger.debug(f'Completed document: {element["title"]}')
+
+    def _characterData(self, cdata: str):
+        """
+        Whitespace between documents does not belong to anybody
+        """
+        if len(self._elements) > 1 and self._skippedDepth == 0:
+            self._elements[-1].add_cdata(cdata)
+
+    # noinspection PyUnusedLocal
+    def _forbidEntityDeclaration(self, name, isParameterEntity, value, base, sysId, pubId, notationName):
+        raise EntitiesForbidden(name, value, base, sysId, pubId, notationName)
+
+    def _forbidExternalReference(self, context, base, sysId, pubId):
+        raise ExternalReferenceForbidden(context, base, sysId, pubId)
@@ -0,0 +1,69 @@
+
+from typing import Dict
+from typing import Generic
+from typing import List
+from typing import NewType
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar('T')
+
+GridCell = NewType('GridCell', Tuple[int, int])
+
+DEFAULT_CELL_SIZE: int = 256
+
+
+class SpatialGrid(Generic[T]):
+    """
+    A uniform grid of square cells;  Each item is filed in every cell its bounding box touches, so a
+    point lookup only looks at the items in one cell.  The bounds are inclusive on every side, the same
+    as a shape's `Inside`, so a point on an edge finds the shape.
+
+    The candidates come back in insertion order;  Callers that want the first match in their own order
+    insert in that order
+    """
+    __slots__ = ('_cellSize', '_cells')
+
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+        """
+
+        Args:
+            cellSize:  The width and height of a cell;  About the size of a typical item works well
+        """
+        assert cellSize > 0, 'Cells need a size'
+
+        self._cellSize: int                     = cellSize
+        self._cells:    Dict[GridCell, List[T]] = {}
+
+    @property
+    def cellSize(self) -> int:
+        return self._cellSize
+
+    def insert(self, item: T, x: int, y: int, width: int, height: int):
+        """
+        Negative sizes are allowed;  The box is normalized
+
+        Args:
+            item:    The thing to find later
+            x:       The box's x
+            y:       The box's y
+            width:   The box's width
+            height:  The box's height
+        """
+        left, right = min(x, x + width),  max(x, x + width)
+        top, bottom = min(y, y + height), max(y, y + height)
+
+        cellSize: int = self._cellSize
+        for column in range(left // cellSize, right // cellSize + 1):
+            for row in range(top // cellSize, bottom // cellSize + 1):
+                self._cells.setdefault(GridCell((column, row)), []).append(item)
+
+    def candidates(self, x: int, y: int) -> List[T]:
+        """
+        Args:
+            x:  A point's x
+            y:  A point's y
+
+        Returns:  The items whose box might hold the point;  Check each one
+        """
+        return self._cells.get(GridCell((x // self._cellSize, y // self._cellSize)), [])
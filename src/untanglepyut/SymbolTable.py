@@ -0,0 +1,115 @@
+
+from typing import Dict
+from typing import Generic
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+from typing import TypeVar
+
+from untanglepyut.ModelTypes import DocumentTitle
+
+T = TypeVar('T')
+
+
+class Symbol(NamedTuple, Generic[T]):
+    """
+    Where an object lives
+    """
+    documentTitle: DocumentTitle
+    symbol:        T
+
+
+class SymbolTable(Generic[T]):
+    """
+    Every named or linkable object of a project by Pyut id and by name, across all the documents.
+    The Ogl untangler files Ogl objects and the model untangler files Pyut objects;  Either way the
+    lookups are a dict access instead of a walk of every document.
+
+    The entries for a key are in the order the documents were untangled, and in document order
+    within a document
+    """
+    __slots__ = ('_byId', '_byName', '_documentKeys')
+
+    def __init__(self):
+
+        self._byId:   Dict[int, List[Symbol[T]]] = {}
+        self._byName: Dict[str, List[Symbol[T]]] = {}
+        #
+        # So a re-untangled document can be taken out without a scan
+        #
+        self._documentKeys: Dict[DocumentTitle, List[Tuple[int, str | None]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(symbols) for symbols in self._byId.values())
+
+    def add(self, documentTitle: DocumentTitle, pyutId: int, symbol: T, name: str | None = None):
+        """
+
+        Args:
+            documentTitle:  The document the object is in
+            pyutId:         Its Pyut object id
+            symbol:         The object
+            name:           Its name;  `None` for objects that are not looked up by name, like notes
+        """
+        entry: Symbol[T] = Symbol(documentTitle=documentTitle, symbol=symbol)
+
+        self._byId.setdefault(pyutId, []).append(entry)
+        if name is not None:
+            self._byName.setdefault(name, []).append(entry)
+
+        self._documentKeys.setdefault(documentTitle, []).append((pyutId, name))
+
+    def removeDocument(self, documentTitle: DocumentTitle):
+        """
+        Forget everything filed for a document;  Nothing happens for an unknown title
+
+        Args:
+            documentTitle:  The document's title
+        """
+        for pyutId, name in self._documentKeys.pop(documentTitle, []):
+            self._remove(self._byId, pyutId, documentTitle)
+            if name is not None:
+                self._remove(self._byName, name, documentTitle)
+
+    def byId(self, pyutId: int) -> List[Symbol[T]]:
+        """
+        Args:
+            pyutId:  A Pyut object id
+
+        Returns:  Every object with the id, in any document
+        """
+        return self._byId.get(pyutId, [])
+
+    def byName(self, name: str) -> List[Symbol[T]]:
+        """
+        Args:
+            name:  A class, actor, use case or sequence diagram instance name
+
+        Returns:  Every object with the name, in any document
+        """
+        return self._byName.get(name, [])
+
+    def documentsContaining(self, name: str) -> List[DocumentTitle]:
+        """
+        Args:
+            name:  An object name
+
+        Returns:  The titles of the documents with an object of that name, each title once
+        """
+        return list(dict.fromkeys(entry.documentTitle for entry in self.byName(name)))
+
+    def reusedIds(self) -> Dict[int, List[Symbol[T]]]:
+        """
+        Pyut ids are only unique within a document
+
+        Returns:  The ids used in more than one document, with their objects
+        """
+        return {pyutId: symbols for pyutId, symbols in self._byId.items() if len({symbol.documentTitle for symbol in symbols}) > 1}
+
+    def _remove(self, index: Dict, key: int | str, documentTitle: DocumentTitle):
+
+        remaining: List[Symbol[T]] = [entry for entry in index.get(key, []) if entry.documentTitle != documentTitle]
+        if len(remaining) == 0:
+            index.pop(key, None)
+        else:
+            index[key] = remaining
@@ -2,16 +2,13 @@
 from typing import Dict
 from typing import List
 from typing import NewType
+from typing import TYPE_CHECKING
 from typing import Union
 from typing import cast
 
 from dataclasses import dataclass
 from dataclasses import field
 
-from untangle import Element
-
-from codeallybasic.SecureConversions import SecureConversions
-
 from miniogl.ControlPoint import ControlPoint
 
 from ogl.OglActor import OglActor
@@ -24,36 +21,20 @@ from ogl.OglInterface2 import OglInterface2
 from ogl.sd.OglSDInstance import OglSDInstance
 from ogl.sd.OglSDMessage import OglSDMessage
 
-from untanglepyut.XmlVersion import XmlVersion
-
-UntangledControlPoints = NewType('UntangledControlPoints', List[ControlPoint])
-
-Elements = NewType('Elements', List[Element])
+from untanglepyut.GraphicRecords import GraphicInformation
+from untanglepyut.GraphicRecords import GraphicLinkAttributes
 
+from untanglepyut.ModelTypes import DocumentTitle
+from untanglepyut.ModelTypes import ProjectInformation
 
-@dataclass
-class GraphicInformation:
-    """
-    Internal Class use to move information from a Graphic XML element
-    into Python
-    """
-    x: int = -1
-    y: int = -1
-    width:  int = -1
-    height: int = -1
+from untanglepyut.OglClassProxy import OglClassProxy
 
-    @classmethod
-    def toGraphicInfo(cls, graphicElement: Element) -> 'GraphicInformation':
-        graphicInformation: GraphicInformation = GraphicInformation()
+from untanglepyut.XmlBackend import Elements
 
-        graphicInformation.x = int(graphicElement['x'])
-        graphicInformation.y = int(graphicElement['y'])
-
-        graphicInformation.width  = int(graphicElement['width'])
-        graphicInformation.height = int(graphicElement['height'])
-
-        return graphicInformation
+if TYPE_CHECKING:
+    from untanglepyut.GeometryTable import GeometryTable     # numpy is optional
 
+UntangledControlPoints = NewType('UntangledControlPoints', List[ControlPoint])
 
 UntangledOglClasses    = NewType('UntangledOglClasses', List[OglClass])
 UntangledLink          = Union[OglLink, OglInterface2]
@@ -67,6 +48,8 @@ UntangledOglUseCases   = NewType('UntangledOglUseCases', List[OglUseCase])
 OglSDInstances = NewType('OglSDInstances', Dict[int, OglSDInstance])
 OglSDMessages  = NewType('OglSDMessages',  Dict[int, OglSDMessage])
 
+OglClassesByName = NewType('OglClassesByName', Dict[str, List[OglClass]])
+
 """
 Factory methods for our dataclasses
 """
@@ -81,6 +64,10 @@ def createUntangledOglClasses() -> UntangledOglClasses:
     return UntangledOglClasses([])
 
 
+def createOglClassesByName() -> OglClassesByName:
+    return OglClassesByName({})
+
+
 def createUntangledOglNotes() -> UntangledOglNotes:
     return UntangledOglNotes([])
 
@@ -109,15 +96,16 @@ def createOglSDMessages() -> OglSDMessages:
     return OglSDMessages({})
 
 
-DocumentTitle = NewType('DocumentTitle', str)
-
-
 @dataclass
 class Document:
     """
-    Create a UseCaseDocument and a ClassDiagramDocument
+    Create a UseCaseDocument and a ClassDiagramDocument.  `geometryTable` is `None` unless the
+    untangler was asked to build it.
+
+    `oglClassesByName` maps each class name to its classes in document order;  A name is only
+    used more than once when the diagram has duplicate classes, and the first one is the one to use
     """
-    documentType:    DocumentTitle = DocumentTitle('')
+    documentType:    str = ''
     documentTitle:   str = ''
     scrollPositionX: int = -1
     scrollPositionY: int = -1
@@ -131,50 +119,19 @@ class Document:
     oglUseCases:     UntangledOglUseCases = field(default_factory=createUntangledOglUseCases)
     oglSDInstances:  OglSDInstances = field(default_factory=createOglSDInstances)
     oglSDMessages:   OglSDMessages  = field(default_factory=createOglSDMessages)
+    geometryTable:   'GeometryTable' = cast('GeometryTable', None)
+
+    oglClassesByName: OglClassesByName = field(default_factory=createOglClassesByName)
 
 
 Documents     = NewType('Documents', dict[DocumentTitle, Document])
 
-LinkableOglObject = Union[OglClass, OglNote, OglActor, OglUseCase]
+LinkableOglObject = Union[OglClass, OglClassProxy, OglNote, OglActor, OglUseCase]
 
 LinkableOglObjects = NewType('LinkableOglObjects',   Dict[int, LinkableOglObject])
 
+ProjectOglObject = Union[LinkableOglObject, OglSDInstance]
+
 
 def createLinkableOglObjects() -> LinkableOglObjects:
     return LinkableOglObjects({})
-
-
-@dataclass
-class GraphicLinkAttributes:
-
-    srcX:   int = -1
-    srcY:   int = -1
-    dstX:   int = -1
-    dstY:   int = -1
-    spline: bool = False
-
-    @classmethod
-    def fromGraphicLink(cls, xmlVersion: XmlVersion, graphicLink: Element) -> 'GraphicLinkAttributes':
-
-        gla: GraphicLinkAttributes = GraphicLinkAttributes()
-        if xmlVersion == XmlVersion.V10:
-            gla.srcX = int(graphicLink['srcX'])
-            gla.srcY = int(graphicLink['srcY'])
-            gla.dstX = int(graphicLink['dstX'])
-            gla.dstY = int(graphicLink['dstY'])
-        else:
-            gla.srcX = int(graphicLink['sourceAnchorX'])
-            gla.srcY = int(graphicLink['sourceAnchorY'])
-            gla.dstX = int(graphicLink['destinationAnchorX'])
-            gla.dstY = int(graphicLink['destinationAnchorY'])
-
-        gla.spline = SecureConversions.secureBoolean(graphicLink['spline'])
-
-        return gla
-
-
-@dataclass
-class ProjectInformation:
-    fileName: str = cast(str, None)
-    version:  str = cast(str, None)
-    codePath: str = cast(str, None)
@@ -1,12 +1,22 @@
 
+from typing import Iterator
+from typing import cast
+
+from logging import DEBUG
 from logging import Logger
 from logging import getLogger
 
-from zlib import decompress
+from mmap import ACCESS_READ
+from mmap import mmap
+
+from zlib import decompressobj
 from zlib import ZLIB_VERSION
 
 
 class UnTangleIO:
+
+    CHUNK_SIZE: int = 64 * 1024
+
     def __init__(self):
         self.ioLogger: Logger = getLogger(__name__)
 
@@ -28,6 +38,32 @@ class UnTangleIO:
 
         return xmlString
 
+    def mappedXmlChunks(self, fqFileName: str, chunkSize: int = cast(int, None)) -> Iterator[memoryview]:
+        """
+        Memory maps an XML file and hands out zero-copy views of it.  The pages come straight from the
+        page cache, and since they are bytes the XML declaration decides the encoding.  The map is
+        closed once the iteration is done, so do not keep the views.  Pages that are never
+        handed out are never read
+
+        Args:
+            fqFileName: The file to read
+            chunkSize:  The size of each view;  Defaults to CHUNK_SIZE
+
+        Returns:  The raw XML bytes, a chunk at a time
+        """
+        if chunkSize is None:
+            chunkSize = UnTangleIO.CHUNK_SIZE
+        try:
+            xmlFile = open(fqFileName, "rb")
+        except (ValueError, Exception) as e:
+            self.ioLogger.error(f'xml open:  {e}')
+            raise e
+
+        with xmlFile, mmap(xmlFile.fileno(), 0, access=ACCESS_READ) as mappedXml:
+            for start in range(0, len(mappedXml), chunkSize):
+                with memoryview(mappedXml)[start:start + chunkSize] as xmlChunk:
+                    yield xmlChunk
+
     def decompressFile(self, fqFileName: str) -> str:
         """
         Decompresses a previously Pyut compressed file
@@ -36,16 +72,51 @@ class UnTangleIO:
 
         Returns:  A raw XML String
         """
+        xmlBytes:  bytes = b''.join(self.decompressedChunks(fqFileName=fqFileName))
+        xmlString: str   = xmlBytes.decode()
+        if self.ioLogger.isEnabledFor(DEBUG):
+            self.ioLogger.debug(f'Document read:\n{xmlString}')
+
+        return xmlString
+
+    def decompressedChunks(self, fqFileName: str, chunkSize: int = cast(int, None)) -> Iterator[bytes]:
+        """
+        Streams a previously Pyut compressed file.  Only one compressed chunk and at most a chunk
+        of bytes decompressed from it are alive at any time, however well the XML compresses;  Feed
+        them straight into an incremental parser.  Stop iterating early to decompress just the start
+        of the file
+
+        Args:
+            fqFileName: Fully qualified file name with a .put suffix
+            chunkSize:  How much compressed data to read and decompressed data to hand out at a time;
+                        Defaults to CHUNK_SIZE
+
+        Returns:  The raw XML bytes, a chunk at a time
+        """
+        if chunkSize is None:
+            chunkSize = UnTangleIO.CHUNK_SIZE
         try:
-            with open(fqFileName, "rb") as compressedFile:
-                compressedData: bytes = compressedFile.read()
+            compressedFile = open(fqFileName, "rb")
         except (ValueError, Exception) as e:
             self.ioLogger.error(f'decompress open:  {e}')
             raise e
-        else:
-            self.ioLogger.info(f'{ZLIB_VERSION=}')
-            xmlBytes:  bytes = decompress(compressedData)  # has b'....' around it
-            xmlString: str   = xmlBytes.decode()
-            self.ioLogger.debug(f'Document read:\n{xmlString}')
 
-        return xmlString
+        self.ioLogger.info(f'{ZLIB_VERSION=}')
+        with compressedFile:
+            decompressor = decompressobj()
+            while True:
+                compressedData: bytes = compressedFile.read(chunkSize)
+                if len(compressedData) == 0:
+                    break
+                #
+                # What does not fit in one chunk stays compressed in the unconsumed tail
+                #
+                while len(compressedData) > 0:
+                    xmlBytes: bytes = decompressor.decompress(compressedData, chunkSize)
+                    if len(xmlBytes) > 0:
+                        yield xmlBytes
+                    compressedData = decompressor.unconsumed_tail
+
+            xmlBytes = decompressor.flush()
+            if len(xmlBytes) > 0:
+                yield xmlBytes
@@ -4,58 +4,115 @@ from typing import cast
 from logging import Logger
 from logging import getLogger
 
-from untangle import Element
-
 from pyutmodelv2.PyutClass import PyutClass
 
 from ogl.OglClass import OglClass
 
-from untanglepyut import XmlConstants
-
 from untanglepyut.BaseUnTangle import BaseUnTangle
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.GeometryTableBuilder import ShapeKind
+from untanglepyut.LinkableObjectRegistry import LinkableObjectRegistry
+from untanglepyut.OglClassProxy import OglClassProxy
 
 from untanglepyut.Types import Elements
 from untanglepyut.Types import GraphicInformation
+from untanglepyut.Types import OglClassesByName
 from untanglepyut.Types import UntangledOglClasses
+from untanglepyut.Types import createOglClassesByName
 from untanglepyut.Types import createUntangledOglClasses
 
 from untanglepyut.UnTanglePyut import UnTanglePyut
 
 from untanglepyut.XmlVersion import XmlVersion
 
+from untanglepyut.XmlBackend import XmlElement
+
 
 class UnTangleOglClasses(BaseUnTangle):
 
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, deferred: bool = False, untanglePyut: UnTanglePyut = cast(UnTanglePyut, None)):
+        """
+
+        Args:
+            xmlVersion:   The XML version of the document
+            deferred:     When `True` unTangle returns an `OglClassProxy` for each class;  The PyutClass
+                          and OglClass are built the first time something needs them
+            untanglePyut: A shared Pyut untangler of the same version;  When `None` it has its own
+        """
 
         super().__init__(xmlVersion)
         self.logger: Logger = getLogger(__name__)
 
-        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
+        self._deferred:     bool         = deferred
+        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion) if untanglePyut is None else untanglePyut
 
-        if xmlVersion == XmlVersion.V10:
-            self._elementOglClass: str = XmlConstants.V10_ELEMENT_CLASS
-        else:
-            self._elementOglClass = XmlConstants.V11_ELEMENT_CLASS
+        self._oglClassesByName: OglClassesByName = createOglClassesByName()
 
-    def unTangle(self, pyutDocument: Element) -> UntangledOglClasses:
-        oglClasses:     UntangledOglClasses = createUntangledOglClasses()
-        graphicClasses: Elements            = cast(Elements, pyutDocument.get_elements(self._elementOglClass))
+    @property
+    def oglClassesByName(self) -> OglClassesByName:
+        """
+        Returns:  The classes of the last untangled document by name, in document order
+        """
+        return self._oglClassesByName
+
+    def unTangle(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry = cast(LinkableObjectRegistry, None),
+                 geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)) -> UntangledOglClasses:
+        """
+        In deferred mode the list holds `OglClassProxy` entries
+
+        Args:
+            pyutDocument:            The PyutDocument element
+            linkableObjectRegistry:  When given, each class is registered as it is created
+            geometryTableBuilder:    When given, each class's geometry is added to it
+
+        Returns:  The document's classes
+        """
+        oglClasses:       UntangledOglClasses = createUntangledOglClasses()
+        oglClassesByName: OglClassesByName    = createOglClassesByName()
+        graphicClasses:   Elements            = cast(Elements, pyutDocument.get_elements(self._schema.elementOglClass))
 
         for graphicClass in graphicClasses:
             self.logger.debug(f'{graphicClass=}')
 
-            graphicInformation: GraphicInformation = GraphicInformation.toGraphicInfo(graphicElement=graphicClass)
-            oglClass:           OglClass           = OglClass(pyutClass=None, w=graphicInformation.width, h=graphicInformation.height)
-            oglClass.SetPosition(x=graphicInformation.x, y=graphicInformation.y)
-            #
-            # This is necessary if it is never added to a diagram
-            # and immediately serialized
-            #
-            self._updateModel(oglObject=oglClass, graphicInformation=graphicInformation)
-
-            pyutClass: PyutClass = self._untanglePyut.classToPyutClass(graphicClass=graphicClass)
-            oglClass.pyutObject = pyutClass
+            if self._deferred is True:
+                oglClassProxy: OglClassProxy = OglClassProxy(graphicClass=graphicClass,
+                                                             classElement=graphicClass.get_elements(self._schema.elementPyutClass)[0],
+                                                             pyutClassFactory=self._untanglePyut.classToPyutClass,
+                                                             oglClassFactory=self._createOglClass)
+                oglClass:  OglClass = cast(OglClass, oglClassProxy)
+                className: str      = oglClassProxy.name
+                pyutId:    int      = oglClassProxy.pyutId
+
+                graphicInformation: GraphicInformation = oglClassProxy.graphicInformation
+            else:
+                graphicInformation = GraphicInformation.toGraphicInfo(graphicElement=graphicClass)
+                pyutClass:          PyutClass          = self._untanglePyut.classToPyutClass(graphicClass=graphicClass)
+
+                oglClass  = self._createOglClass(graphicInformation=graphicInformation, pyutClass=pyutClass)
+                className = pyutClass.name
+                pyutId    = pyutClass.id
+
             oglClasses.append(oglClass)
+            if linkableObjectRegistry is not None:
+                linkableObjectRegistry.register(pyutId=pyutId, oglObject=oglClass)
+            if geometryTableBuilder is not None:
+                geometryTableBuilder.addShape(pyutId=pyutId, shapeKind=ShapeKind.CLASS, graphicInformation=graphicInformation)
+            oglClassesByName.setdefault(className, []).append(oglClass)
+
+        self._oglClassesByName = oglClassesByName
 
         return oglClasses
+
+    def _createOglClass(self, graphicInformation: GraphicInformation, pyutClass: PyutClass) -> OglClass:
+
+        oglClass: OglClass = OglClass(pyutClass=None, w=graphicInformation.width, h=graphicInformation.height)
+        oglClass.SetPosition(x=graphicInformation.x, y=graphicInformation.y)
+        #
+        # This is necessary if it is never added to a diagram
+        # and immediately serialized
+        #
+        self._updateModel(oglObject=oglClass, graphicInformation=graphicInformation)
+
+        oglClass.pyutObject = pyutClass
+
+        return oglClass
@@ -1,12 +1,12 @@
 
 from typing import List
+from typing import Tuple
+from typing import Union
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from untangle import Element
-
 from codeallyadvanced.ui.AttachmentSide import AttachmentSide
 
 from miniogl.ControlPoint import ControlPoint
@@ -30,10 +30,19 @@ from ogl.OglLink import OglLink
 from ogl.OglInterface2 import OglInterface2
 from ogl.OglAssociationLabel import OglAssociationLabel
 
-from untanglepyut import XmlConstants
+from untanglepyut.GraphicRecords import GraphicInformation
+from untanglepyut.GraphicRecords import LinkRecord
+from untanglepyut.GraphicRecords import LollipopRecord
+from untanglepyut.GraphicRecords import PointRecord
+from untanglepyut.GraphicRecords import PyutLinkRecord
+
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+
+from untanglepyut.OglClassProxy import OglClassProxy
+from untanglepyut.SpatialGrid import DEFAULT_CELL_SIZE
+from untanglepyut.SpatialGrid import SpatialGrid
 
 from untanglepyut.Types import Elements
-from untanglepyut.Types import GraphicLinkAttributes
 from untanglepyut.Types import LinkableOglObject
 from untanglepyut.Types import LinkableOglObjects
 from untanglepyut.Types import UntangledControlPoints
@@ -41,66 +50,60 @@ from untanglepyut.Types import UntangledOglLinks
 from untanglepyut.Types import createUntangledOglLinks
 
 from untanglepyut.UnTanglePyut import UnTanglePyut
+from untanglepyut.XmlSchema import XmlSchema
 from untanglepyut.XmlVersion import XmlVersion
 
+from untanglepyut.XmlBackend import XmlElement
+
+ClassGrid = SpatialGrid[Union[OglClass, OglClassProxy]]
+
 
 class UnTangleOglLinks:
     """
     """
 
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, untanglePyut: UnTanglePyut = cast(UnTanglePyut, None)):
+        """
 
+        Args:
+            xmlVersion:   The XML version of the documents
+            untanglePyut: A shared Pyut untangler of the same version;  When `None` it has its own
+        """
         self.logger: Logger = getLogger(__name__)
 
-        self._untanglePyut:  UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
-        self._xmlVersion:    XmlVersion   = xmlVersion
-        if xmlVersion == XmlVersion.V10:
-            self._elementOglLink:       str = XmlConstants.V10_ELEMENT_OGL_LINK
-            self._elementOglInterface2: str = XmlConstants.V10_ELEMENT_OGL_INTERFACE2
-            self._elementInterface2:    str = XmlConstants.V10_ELEMENT_INTERFACE2
-            self._elementLink:          str = XmlConstants.V10_ELEMENT_LINK
-            self._elementCenter:        str = XmlConstants.V10_ELEMENT_LABEL_CENTER
-            self._elementSource:        str = XmlConstants.V10_ELEMENT_LABEL_SOURCE
-            self._elementDestination:   str = XmlConstants.V10_ELEMENT_LABEL_DESTINATION
-            self._attrSourceId:         str = XmlConstants.V10_ATTR_SOURCE_ID
-            self._attrDestinationId:    str = XmlConstants.V10_ATTR_DESTINATION_ID
-        else:
-            self._elementOglLink       = XmlConstants.V11_ELEMENT_OGL_LINK
-            self._elementOglInterface2 = XmlConstants.V11_ELEMENT_OGL_INTERFACE2
-            self._elementInterface2    = XmlConstants.V11_ELEMENT_INTERFACE2
-            self._elementLink          = XmlConstants.V11_ELEMENT_LINK
-            self._elementCenter        = XmlConstants.V11_ELEMENT_LABEL_CENTER
-            self._elementSource        = XmlConstants.V11_ELEMENT_LABEL_SOURCE
-            self._elementDestination   = XmlConstants.V11_ELEMENT_LABEL_DESTINATION
-            self._attrSourceId         = XmlConstants.V11_ATTR_SOURCE_ID
-            self._attrDestinationId    = XmlConstants.V11_ATTR_DESTINATION_ID
-
-    def unTangle(self, pyutDocument: Element, linkableOglObjects: LinkableOglObjects) -> UntangledOglLinks:
+        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion) if untanglePyut is None else untanglePyut
+        self._schema:       XmlSchema    = XmlSchema.forVersion(xmlVersion)
+
+    def unTangle(self, pyutDocument: XmlElement, linkableOglObjects: LinkableOglObjects,
+                 geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)) -> UntangledOglLinks:
         """
         Convert from XML to Ogl Links
 
         Args:
             pyutDocument:  The Element that represents the Class Diagram XML
             linkableOglObjects:    OGL objects that can have links
+            geometryTableBuilder:  When given, each link's geometry is added to it;  Lollipops are not links
 
         Returns:  The links between any of the above objects.  Also returns the graphic lollipop links
         """
 
         oglLinks: UntangledOglLinks = createUntangledOglLinks()
 
-        graphicLinks: Elements = cast(Elements, pyutDocument.get_elements(self._elementOglLink))
+        graphicLinks: Elements = cast(Elements, pyutDocument.get_elements(self._schema.elementOglLink))
         for graphicLink in graphicLinks:
-            oglLink: OglLink = self._graphicLinkToOglLink(graphicLink, linkableOglObjects=linkableOglObjects)
+            oglLink: OglLink = self._graphicLinkToOglLink(graphicLink, linkableOglObjects=linkableOglObjects, geometryTableBuilder=geometryTableBuilder)
             oglLinks.append(oglLink)
 
-        graphicLollipops: Elements = cast(Elements, pyutDocument.get_elements(self._elementOglInterface2))
-        for graphicLollipop in graphicLollipops:
-            oglInterface2: OglInterface2 = self._graphicLollipopToOglInterface(graphicLollipop, linkableOglObjects)
-            oglLinks.append(oglInterface2)
+        graphicLollipops: Elements = cast(Elements, pyutDocument.get_elements(self._schema.elementOglInterface2))
+        if len(graphicLollipops) > 0:
+            classGrid: ClassGrid = self._buildClassGrid(linkableOglObjects=linkableOglObjects)
+            for graphicLollipop in graphicLollipops:
+                oglInterface2: OglInterface2 = self._graphicLollipopToOglInterface(graphicLollipop, classGrid=classGrid)
+                oglLinks.append(oglInterface2)
 
         return oglLinks
 
-    def _graphicLinkToOglLink(self, graphicLink: Element, linkableOglObjects: LinkableOglObjects) -> OglLink:
+    def _graphicLinkToOglLink(self, graphicLink: XmlElement, linkableOglObjects: LinkableOglObjects, geometryTableBuilder: GeometryTableBuilder) -> OglLink:
         """
         This code is way too convoluted.  Failing to do any of these step in this code leads to BAD
         visual representations.
@@ -110,57 +113,57 @@ class UnTangleOglLinks:
         Args:
             graphicLink:        The XML `GraphicClass` element
             linkableOglObjects:    OGL objects that can have links
+            geometryTableBuilder:  When not `None` the link's geometry is added to it
 
         Returns:  A fully formed OglLink including control points
         """
 
         assert len(linkableOglObjects) != 0, 'Developer forgot to create dictionary'
-        gla: GraphicLinkAttributes = GraphicLinkAttributes.fromGraphicLink(xmlVersion=self._xmlVersion, graphicLink=graphicLink)
-
-        links: Elements = cast(Elements, graphicLink.get_elements(self._elementLink))
-        assert len(links) == 1, 'Should only ever be one'
+        linkRecord: LinkRecord = LinkRecord.fromGraphicLink(schema=self._schema, graphicLink=graphicLink)
+        if geometryTableBuilder is not None:
+            geometryTableBuilder.addLink(linkRecord=linkRecord)
 
-        singleLink:  Element = links[0]
-        sourceId:    int = int(singleLink[self._attrSourceId])
-        dstId:       int = int(singleLink[self._attrDestinationId])
-        self.logger.debug(f'graphicLink= {gla.srcX=} {gla.srcY=} {gla.dstX=} {gla.dstY=} {gla.spline=}')
+        pyutLinkRecord: PyutLinkRecord = linkRecord.pyutLinkRecord
+        sourceId:       int            = pyutLinkRecord.sourceId
+        dstId:          int            = pyutLinkRecord.destinationId
+        self.logger.debug(f'{linkRecord=}')
 
         try:
-            srcShape: LinkableOglObject = linkableOglObjects[sourceId]
-            dstShape: LinkableOglObject = linkableOglObjects[dstId]
+            srcShape: LinkableOglObject = self._materialize(linkableOglObjects[sourceId])
+            dstShape: LinkableOglObject = self._materialize(linkableOglObjects[dstId])
         except KeyError as ke:
             self.logger.error(f'{linkableOglObjects=}')
-            self.logger.error(f'Developer Error -- {singleLink=}')
+            self.logger.error(f'Developer Error -- {pyutLinkRecord=}')
             self.logger.error(f'Developer Error -- {sourceId=} {dstId=}  KeyError index: {ke}')
             return cast(OglLink, None)
 
-        pyutLink: PyutLink = self._untanglePyut.linkToPyutLink(singleLink, source=srcShape.pyutObject, destination=dstShape.pyutObject)
+        pyutLink: PyutLink = self._untanglePyut.linkRecordToPyutLink(pyutLinkRecord, source=srcShape.pyutObject, destination=dstShape.pyutObject)
         oglLink:  OglLink  = self._oglLinkFactory(srcShape=srcShape, pyutLink=pyutLink, destShape=dstShape,
                                                   linkType=pyutLink.linkType,
-                                                  srcPos=(gla.srcX, gla.srcY),
-                                                  dstPos=(gla.dstX, gla.dstY)
+                                                  srcPos=(linkRecord.srcX, linkRecord.srcY),
+                                                  dstPos=(linkRecord.dstX, linkRecord.dstY)
                                                   )
-        oglLink.spline = gla.spline
+        oglLink.spline = linkRecord.spline
         srcShape.addLink(oglLink)
         dstShape.addLink(oglLink)
 
         # put the anchors at the right position
         srcAnchor = oglLink.sourceAnchor
         dstAnchor = oglLink.destinationAnchor
-        srcAnchor.SetPosition(gla.srcX, gla.srcY)
-        dstAnchor.SetPosition(gla.dstX, gla.dstY)
+        srcAnchor.SetPosition(linkRecord.srcX, linkRecord.srcY)
+        dstAnchor.SetPosition(linkRecord.dstX, linkRecord.dstY)
 
         srcModel = srcAnchor.model
-        srcModel.SetPosition(x=gla.srcX, y=gla.srcY)
+        srcModel.SetPosition(x=linkRecord.srcX, y=linkRecord.srcY)
         dstModel = dstAnchor.model
-        dstModel.SetPosition(x=gla.dstX, y=gla.dstY)
+        dstModel.SetPosition(x=linkRecord.dstX, y=linkRecord.dstY)
 
         # add the control points to the line
         line   = srcAnchor.lines[0]     # only 1 line per anchor in Pyut
         parent = line.sourceAnchor.parent
         selfLink: bool = parent is oglLink.destinationAnchor.parent
 
-        controlPoints: UntangledControlPoints = self._generateControlPoints(graphicLink=graphicLink)
+        controlPoints: UntangledControlPoints = self._generateControlPoints(linkRecord=linkRecord)
         for controlPoint in controlPoints:
             oglLink.AddControl(control=controlPoint, after=None)
             if selfLink:
@@ -169,7 +172,7 @@ class UnTangleOglLinks:
                 controlPoint.SetPosition(x, y)
 
         if isinstance(oglLink, OglAssociation):
-            self._addAssociationLabels(graphicLink, oglLink)
+            self._addAssociationLabels(linkRecord, oglLink)
 
         self._reconstituteLinkDataModel(oglLink)
 
@@ -214,25 +217,21 @@ class UnTangleOglLinks:
             self.logger.error(f"Unknown OglLinkType: {linkType}")
             return None
 
-    def _graphicLollipopToOglInterface(self, graphicLollipop: Element, linkableOglObjects: LinkableOglObjects) -> OglInterface2:
+    def _graphicLollipopToOglInterface(self, graphicLollipop: XmlElement, classGrid: ClassGrid) -> OglInterface2:
 
-        assert len(linkableOglObjects) != 0, 'Developer forgot to create dictionary'
-
-        x: int = int(graphicLollipop['x'])
-        y: int = int(graphicLollipop['y'])
-        attachmentLocationStr: str            = graphicLollipop['attachmentPoint']
-        attachmentSide:        AttachmentSide = AttachmentSide.toEnum(attachmentLocationStr)
+        lollipopRecord: LollipopRecord = LollipopRecord.fromGraphicLollipop(graphicLollipop)
+        x:              int            = lollipopRecord.x
+        y:              int            = lollipopRecord.y
+        attachmentSide: AttachmentSide = AttachmentSide.toEnum(lollipopRecord.attachmentPoint)
 
-        elements: Elements = cast(Elements, graphicLollipop.get_elements(self._elementInterface2))
+        elements: Elements = cast(Elements, graphicLollipop.get_elements(self._schema.elementPyutInterface))
         assert len(elements) == 1, 'If more than one interface tag the XML is invalid'
 
         pyutInterface:    PyutInterface = self._untanglePyut.interfaceToPyutInterface(oglInterface2=graphicLollipop)
 
         self.logger.debug(f'{pyutInterface.name} {pyutInterface.id=} {pyutInterface.implementors=}')
 
-        # oglClass:    OglClass    = self._getOglClassFromName(pyutInterface.implementors[0], linkableOglObjects)
-
-        oglClass:    OglClass    = self._determineAttachedToClass(x=x, y=y, linkableOglObjects=linkableOglObjects)
+        oglClass:    OglClass    = self._determineAttachedToClass(x=x, y=y, classGrid=classGrid)
         oglPosition: OglPosition = self._determineAttachmentPoint(attachmentSide, oglClass)
 
         self.logger.debug(f'{oglClass.id=} {oglPosition.x=} {oglPosition.y=}')
@@ -243,26 +242,6 @@ class UnTangleOglLinks:
         self.logger.debug(f'{oglInterface2.id=} {oglInterface2.destinationAnchor=}')
         return oglInterface2
 
-    def _getOglClassFromName(self, className: str, linkableOglObjects: LinkableOglObjects) -> OglClass:
-        """
-        Looks up a name in the linkable objects dictionary and return the associated class
-        TODO: Make a simple lookup and catch any Key errors
-
-        Args:
-            className:
-            linkableOglObjects:
-
-        Returns:
-        """
-
-        foundClass: OglClass = cast(OglClass, None)
-        for oglClass in linkableOglObjects.values():
-            if oglClass.pyutObject.name == className:
-                foundClass = cast(OglClass, oglClass)
-                break
-        assert foundClass is not None, 'XML must be in error'
-        return foundClass
-
     def _determineAttachmentPoint(self, attachmentPoint: AttachmentSide, oglClass: OglClass) -> OglPosition:
         """
         Even though we serialize the attachment point location that position is relative to the diagram.
@@ -306,15 +285,12 @@ class UnTangleOglLinks:
 
         return oglPosition
 
-    def _generateControlPoints(self, graphicLink: Element) -> UntangledControlPoints:
+    def _generateControlPoints(self, linkRecord: LinkRecord) -> UntangledControlPoints:
 
         controlPoints: UntangledControlPoints = UntangledControlPoints([])
 
-        controlPointElements: Elements = cast(Elements, graphicLink.get_elements('ControlPoint'))
-        for controlPointElement in controlPointElements:
-            x: int = int(controlPointElement['x'])
-            y: int = int(controlPointElement['y'])
-            controlPoint: ControlPoint = ControlPoint(x=x, y=y)
+        for controlPointRecord in linkRecord.controlPoints:
+            controlPoint: ControlPoint = ControlPoint(x=controlPointRecord.x, y=controlPointRecord.y)
             controlPoints.append(controlPoint)
 
         return controlPoints
@@ -343,12 +319,12 @@ class UnTangleOglLinks:
             srcPyutClass:  PyutClass = cast(PyutClass, srcShape.pyutObject)
             srcPyutClass.addLink(pyutLink)
 
-    def _addAssociationLabels(self, graphicLink: Element, oglAssociation: OglAssociation):
+    def _addAssociationLabels(self, linkRecord: LinkRecord, oglAssociation: OglAssociation):
         """
         The association labels are now separate components;  We need to handle that
 
         Args:
-            graphicLink:    The top level GraphicLink Element
+            linkRecord:     The record of the top level GraphicLink Element
             oglAssociation: The current OGL representation of the graphicLink
 
         Returns:  The updated association link
@@ -356,21 +332,19 @@ class UnTangleOglLinks:
 
         pyutLink:         PyutLink            = oglAssociation.pyutObject
 
-        oglAssociation.centerLabel            = self._createALabel(oglAssociation, graphicLink, text=pyutLink.name,
-                                                                   tagName=self._elementCenter)
-        oglAssociation.sourceCardinality      = self._createALabel(oglAssociation, graphicLink, text=pyutLink.sourceCardinality,
-                                                                   tagName=self._elementSource)
-        oglAssociation.destinationCardinality = self._createALabel(oglAssociation, graphicLink, text=pyutLink.destinationCardinality,
-                                                                   tagName=self._elementDestination)
+        oglAssociation.centerLabel            = self._createALabel(oglAssociation, linkRecord.centerLabel, text=pyutLink.name,
+                                                                   tagName=self._schema.elementLabelCenter)
+        oglAssociation.sourceCardinality      = self._createALabel(oglAssociation, linkRecord.sourceLabel, text=pyutLink.sourceCardinality,
+                                                                   tagName=self._schema.elementLabelSource)
+        oglAssociation.destinationCardinality = self._createALabel(oglAssociation, linkRecord.destinationLabel, text=pyutLink.destinationCardinality,
+                                                                   tagName=self._schema.elementLabelDestination)
 
-    def _createALabel(self, parentAssociation: OglAssociation, graphicLink: Element, text: str, tagName: str) -> OglAssociationLabel:
+    def _createALabel(self, parentAssociation: OglAssociation, labelRecord: PointRecord | None, text: str, tagName: str) -> OglAssociationLabel:
 
-        labels:  List[Element]   = graphicLink.get_elements(tagName)
-        assert len(labels) == 1, 'There can be only one'
+        assert labelRecord is not None, f'Association is missing {tagName}'
 
-        label: Element = labels[0]
-        x:     int     = int(label['x'])
-        y:     int     = int(label['y'])
+        x: int = labelRecord.x
+        y: int = labelRecord.y
 
         self.logger.debug(f'{tagName=} `{text=}` pos: ({x},{y})')
 
@@ -381,25 +355,76 @@ class UnTangleOglLinks:
 
         return oglAssociationLabel
 
-    def _determineAttachedToClass(self, x: int, y: int, linkableOglObjects: LinkableOglObjects) -> OglClass:
+    def _determineAttachedToClass(self, x: int, y: int, classGrid: ClassGrid) -> OglClass:
         """
         I cannot store a pointer to the class the lollipop is attached to.  However, I need to know the lollipop's
         parent because of
         Args:
             x:
             y:
-            linkableOglObjects:
+            classGrid:  The document's classes
 
         Returns: The OglClass that the lollipop is attached to
         """
 
         foundClass: OglClass = cast(OglClass, None)
 
-        for linkableObject in linkableOglObjects.values():
-            oglClass: OglClass = cast(OglClass, linkableObject)
-            if oglClass.Inside(x=x, y=y) is True:
-                foundClass = oglClass
+        for candidate in classGrid.candidates(x=x, y=y):
+            if isinstance(candidate, OglClassProxy):
+                #
+                # Only build the class that the lollipop is on
+                #
+                if candidate.inside(x=x, y=y) is True:
+                    foundClass = candidate.oglClass
+                    break
+            elif candidate.Inside(x=x, y=y) is True:
+                foundClass = candidate
                 break
 
         assert foundClass is not None, 'XML must be in error'
         return foundClass
+
+    def _buildClassGrid(self, linkableOglObjects: LinkableOglObjects) -> ClassGrid:
+        """
+        Only classes implement interfaces;  The notes, actors and use cases are left out.  The cells
+        are about the size of an average class, so a lookup sees a handful of candidates
+
+        Args:
+            linkableOglObjects:  OGL objects that can have links
+
+        Returns:  The classes filed by where they are
+        """
+        assert len(linkableOglObjects) != 0, 'Developer forgot to create dictionary'
+
+        boxes: List[Tuple[Union[OglClass, OglClassProxy], int, int, int, int]] = []
+        for linkableObject in linkableOglObjects.values():
+            if isinstance(linkableObject, OglClassProxy):
+                gi: GraphicInformation = linkableObject.graphicInformation
+                boxes.append((linkableObject, gi.x, gi.y, gi.width, gi.height))
+            elif isinstance(linkableObject, OglClass):
+                x, y          = linkableObject.GetPosition()
+                width, height = linkableObject.GetSize()
+                boxes.append((linkableObject, x, y, width, height))
+
+        cellSize: int = DEFAULT_CELL_SIZE
+        if len(boxes) > 0:
+            cellSize = max(1, sum(max(abs(width), abs(height)) for _, _, _, width, height in boxes) // len(boxes))
+
+        classGrid: ClassGrid = ClassGrid(cellSize=cellSize)
+        for oglClass, x, y, width, height in boxes:
+            classGrid.insert(oglClass, x=x, y=y, width=width, height=height)
+
+        return classGrid
+
+    def _materialize(self, linkableObject: LinkableOglObject) -> LinkableOglObject:
+        """
+        A link holds the real shape;  Build a deferred class now
+
+        Args:
+            linkableObject:  An Ogl object or an `OglClassProxy`
+
+        Returns:  The Ogl object
+        """
+        if isinstance(linkableObject, OglClassProxy):
+            return linkableObject.oglClass
+        return linkableObject
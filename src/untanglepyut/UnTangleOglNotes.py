@@ -1,14 +1,17 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
-from untangle import Element
-
 from pyutmodelv2.PyutNote import PyutNote
 
 from ogl.OglNote import OglNote
 
 from untanglepyut.BaseUnTangle import BaseUnTangle
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.GeometryTableBuilder import ShapeKind
+from untanglepyut.LinkableObjectRegistry import LinkableObjectRegistry
 
 from untanglepyut.Types import Elements
 from untanglepyut.Types import GraphicInformation
@@ -16,36 +19,40 @@ from untanglepyut.Types import UntangledOglNotes
 from untanglepyut.Types import createUntangledOglNotes
 from untanglepyut.UnTanglePyut import UnTanglePyut
 
-from untanglepyut import XmlConstants
-
 from untanglepyut.XmlVersion import XmlVersion
 
+from untanglepyut.XmlBackend import XmlElement
+
 
 class UnTangleOglNotes(BaseUnTangle):
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, untanglePyut: UnTanglePyut = cast(UnTanglePyut, None)):
+        """
+
+        Args:
+            xmlVersion:   The XML version of the document
+            untanglePyut: A shared Pyut untangler of the same version;  When `None` it has its own
+        """
 
         super().__init__(xmlVersion=xmlVersion)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
-
-        if xmlVersion == XmlVersion.V10:
-            self._elementOglNote: str = XmlConstants.V10_ELEMENT_NOTE
-        else:
-            self._elementOglNote = XmlConstants.V11_ELEMENT_NOTE
+        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion) if untanglePyut is None else untanglePyut
 
-    def unTangle(self, pyutDocument: Element) -> UntangledOglNotes:
+    def unTangle(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry = cast(LinkableObjectRegistry, None),
+                 geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)) -> UntangledOglNotes:
         """
 
         Args:
             pyutDocument:
+            linkableObjectRegistry:  When given, each note is registered as it is created
+            geometryTableBuilder:    When given, each note's geometry is added to it
 
         Returns: untangled OglNote objects if any exist, else an empty list
         """
 
         oglNotes:     UntangledOglNotes = createUntangledOglNotes()
-        graphicNotes: Elements          = pyutDocument.get_elements(self._elementOglNote)
+        graphicNotes: Elements          = cast(Elements, pyutDocument.get_elements(self._schema.elementOglNote))
 
         for graphicNote in graphicNotes:
             self.logger.debug(f'{graphicNote}')
@@ -58,5 +65,9 @@ class UnTangleOglNotes(BaseUnTangle):
             pyutNote: PyutNote = self._untanglePyut.noteToPyutNote(graphicNote=graphicNote)
             oglNote.pyutObject = pyutNote
             oglNotes.append(oglNote)
+            if linkableObjectRegistry is not None:
+                linkableObjectRegistry.register(pyutId=pyutNote.id, oglObject=oglNote)
+            if geometryTableBuilder is not None:
+                geometryTableBuilder.addShape(pyutId=pyutNote.id, shapeKind=ShapeKind.NOTE, graphicInformation=graphicInformation)
 
         return oglNotes
@@ -1,16 +1,16 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
-from untangle import Element
-
 from pyutmodelv2.PyutText import PyutText
 
 from ogl.OglText import OglText
 
-from untanglepyut import XmlConstants
-
 from untanglepyut.BaseUnTangle import BaseUnTangle
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.GeometryTableBuilder import ShapeKind
 from untanglepyut.Types import GraphicInformation
 from untanglepyut.UnTanglePyut import UnTanglePyut
 
@@ -20,35 +20,39 @@ from untanglepyut.Types import Elements
 from untanglepyut.Types import UntangledOglTexts
 from untanglepyut.Types import createUntangledOglTexts
 
+from untanglepyut.XmlBackend import XmlElement
+
 
 class UnTangleOglTexts(BaseUnTangle):
     """
     Yes, I know bad English
     """
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, untanglePyut: UnTanglePyut = cast(UnTanglePyut, None)):
+        """
+
+        Args:
+            xmlVersion:   The XML version of the document
+            untanglePyut: A shared Pyut untangler of the same version;  When `None` it has its own
+        """
 
         super().__init__(xmlVersion=xmlVersion)
 
         self.logger: Logger = getLogger(__name__)
 
-        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
-
-        if xmlVersion == XmlVersion.V10:
-            self._elementOglText: str = XmlConstants.V10_ELEMENT_TEXT
-        else:
-            self._elementOglText = XmlConstants.V11_ELEMENT_TEXT
+        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion) if untanglePyut is None else untanglePyut
 
-    def unTangle(self, pyutDocument: Element) -> UntangledOglTexts:
+    def unTangle(self, pyutDocument: XmlElement, geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)) -> UntangledOglTexts:
         """
 
         Args:
-            pyutDocument:  The Element document
+            pyutDocument:          The Element document
+            geometryTableBuilder:  When given, each text's geometry is added to it
 
         Returns:  untangled OglText objects if any exist, else an empty list
         """
 
         oglTexts:     UntangledOglTexts = createUntangledOglTexts()
-        graphicTexts: Elements          = pyutDocument.get_elements(self._elementOglText)
+        graphicTexts: Elements          = cast(Elements, pyutDocument.get_elements(self._schema.elementOglText))
 
         for graphicText in graphicTexts:
             self.logger.debug(f'{graphicText}')
@@ -64,5 +68,7 @@ class UnTangleOglTexts(BaseUnTangle):
             self._updateModel(oglObject=oglText, graphicInformation=graphicInformation)
             oglText.pyutText = pyutText
             oglTexts.append(oglText)
+            if geometryTableBuilder is not None:
+                geometryTableBuilder.addShape(pyutId=pyutText.id, shapeKind=ShapeKind.TEXT, graphicInformation=graphicInformation)
 
         return oglTexts
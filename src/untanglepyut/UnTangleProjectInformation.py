@@ -1,13 +1,14 @@
 
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
-from untangle import Element
-from untangle import parse
-
-from untanglepyut.Types import ProjectInformation
+from untanglepyut.ProjectProbe import ProbedProject
+from untanglepyut.ProjectProbe import ProjectProbe
+from untanglepyut.ModelTypes import ProjectInformation
 from untanglepyut.UnTangleIO import UnTangleIO
-from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
+from untanglepyut.XmlBackend import XmlElement
 
 
 class UnTangleProjectInformation(UnTangleIO):
@@ -29,35 +30,39 @@ class UnTangleProjectInformation(UnTangleIO):
 
     def _extractProjectInformationForFile(self, fqFileName: str) -> ProjectInformation:
         """
-        Allows callers to inspect the project information.  For example the XML version
+        Allows callers to inspect the project information.  For example the XML version.  Only the
+        file header is read
 
         Args:
             fqFileName: The fully qualified file for a .xml or .put file
 
         Returns:  A project information data class`
         """
-        if fqFileName.endswith('.put') is False and fqFileName.endswith('.xml') is False:
-            raise UnsupportedFileTypeException(message='File must end with .xml or .put extension')
-
-        if fqFileName.endswith('.xml'):
-            xmlString:   str = self.getRawXml(fqFileName=fqFileName)
-        elif fqFileName.endswith('.put'):
-            xmlString = self.decompressFile(fqFileName=fqFileName)
-        else:
-            assert False, 'Unknown file suffix;  Should not get here'
+        probedProject: ProbedProject = ProjectProbe().probe(fqFileName=fqFileName)
 
-        root:        Element = parse(xmlString)
-        pyutProject: Element = root.PyutProject
+        projectInformation: ProjectInformation = ProjectInformation()
 
-        projectInformation = self._populateProjectInformation(pyutProject=pyutProject)
-        projectInformation.fileName = fqFileName
+        projectInformation.fileName = probedProject.fileName
+        projectInformation.version  = probedProject.version
+        projectInformation.codePath = probedProject.codePath
 
         return projectInformation
 
-    def _populateProjectInformation(self, pyutProject: Element) -> ProjectInformation:
+    @classmethod
+    def toProjectInformation(cls, pyutProject: XmlElement, fqFileName: str = cast(str, None)) -> ProjectInformation:
+        """
+        Extracts the project information from an already parsed PyutProject element;  Does no I/O.
+        For example, the element kept by any backend's DocumentStream
+
+        Args:
+            pyutProject:  The PyutProject element;  Only its attributes are used
+            fqFileName:   The file the element came from, if any
 
+        Returns:  A project information data class
+        """
         projectInformation: ProjectInformation = ProjectInformation()
 
+        projectInformation.fileName = fqFileName
         projectInformation.version  = pyutProject['version']
         projectInformation.codePath = pyutProject['CodePath']
 
@@ -8,8 +8,6 @@ from logging import getLogger
 
 from os import linesep as osLineSep
 
-from untangle import Element
-
 from codeallybasic.SecureConversions import SecureConversions
 from codeallybasic.Common import XML_END_OF_LINE_MARKER
 
@@ -28,6 +26,7 @@ from pyutmodelv2.PyutParameter import PyutParameter
 from pyutmodelv2.PyutMethod import PyutMethod
 from pyutmodelv2.PyutMethod import PyutModifiers
 from pyutmodelv2.PyutModifier import PyutModifier
+from pyutmodelv2.PyutModelTypes import ClassName
 from pyutmodelv2.PyutType import PyutType
 from pyutmodelv2.PyutClass import PyutClass
 from pyutmodelv2.PyutNote import PyutNote
@@ -36,20 +35,22 @@ from pyutmodelv2.PyutText import PyutText
 from pyutmodelv2.PyutSDInstance import PyutSDInstance
 from pyutmodelv2.PyutSDMessage import PyutSDMessage
 
-from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
 from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
 from pyutmodelv2.enumerations.PyutDisplayParameters import PyutDisplayParameters
 from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
 from pyutmodelv2.enumerations.PyutDisplayMethods import PyutDisplayMethods
 
-from untanglepyut import XmlConstants
-
+from untanglepyut.GraphicRecords import PyutLinkRecord
+from untanglepyut.InternTable import InternTable
+from untanglepyut.GraphicRecords import SDMessageRecord
+from untanglepyut.XmlSchema import XmlSchema
 from untanglepyut.XmlVersion import XmlVersion
 
-from untanglepyut.Types import Elements
+from untanglepyut.XmlBackend import Elements
+from untanglepyut.XmlBackend import XmlElement
 
 
-@dataclass
+@dataclass(slots=True)
 class ConvolutedPyutSDMessageInformation:
     """
     This class is necessary because I do not want to mix Ogl and pyutmodel code;  Unfortunately,
@@ -68,91 +69,42 @@ class UnTanglePyut:
     NOTE_NAME:   str = 'Note'
     noteCounter: int = 0
 
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, internTable: InternTable = cast(InternTable, None)):
+        """
 
+        Args:
+            xmlVersion:   The XML version of the elements to convert
+            internTable:  Shares repeated values between the objects this converts;  When `None` it has its own
+        """
         self.logger: Logger = getLogger(__name__)
 
-        self._xmlVersion: XmlVersion = xmlVersion
-        if self._xmlVersion == XmlVersion.V10:
-            self._elementMethod:         str = XmlConstants.V10_ELEMENT_METHOD
-            self._elementParameter:      str = XmlConstants.V10_ELEMENT_PARAMETER
-            self._elementField:          str = XmlConstants.V10_ELEMENT_FIELD
-
-            self._attrId:                str = XmlConstants.V10_ATTR_ID
-            self._attrStereoType:        str = XmlConstants.V10_ATTR_STEREOTYPE
-            self._attrDisplayMethods:    str = XmlConstants.V10_ATTR_DISPLAY_METHODS
-
-            self._attrDisplayConstructor   = XmlConstants.V11_ATTR_DISPLAY_CONSTRUCTOR      # V10 never had these
-            self._attrDisplayDunderMethods = XmlConstants.V11_ATTR_DISPLAY_DUNDER_METHODS   # and will never have them
-
-            self._attrDisplayParameters: str = XmlConstants.V10_ATTR_DISPLAY_PARAMETERS
-            self._attrDisplayFields:     str = XmlConstants.V10_ATTR_DISPLAY_FIELDS
-            self._attrDisplayStereoType: str = XmlConstants.V10_ATTR_DISPLAY_STEREOTYPE
-
-            self._attrCardinalitySource:      str = XmlConstants.V10_ATTR_CARDINALITY_SOURCE
-            self._attrCardinalityDestination: str = XmlConstants.V10_ATTR_CARDINALITY_DESTINATION
-            self._attrBidirectional:          str = XmlConstants.V10_ATTR_BIDIRECTIONAL
-            self._attrSourceId:               str = XmlConstants.V10_ATTR_SOURCE_ID
-            self._attrDestinationId:          str = XmlConstants.V10_ATTR_DESTINATION_ID
-            self._attrSDMessageSourceId:      str = XmlConstants.V10_ATTR_SD_MESSAGE_SOURCE_ID
-            self._attrSDMessageDestinationId: str = XmlConstants.V10_ATTR_SD_MESSAGE_DESTINATION_ID
-
-            self._attrSourceTime:             str = XmlConstants.V10_ATTR_SOURCE_TIME
-            self._attrDestinationTime:        str = XmlConstants.V10_ATTR_DESTINATION_TIME
-
-            self._attrFileName: str = XmlConstants.V10_ATTR_FILENAME
-        else:
-            self._elementParameter      = XmlConstants.V11_ELEMENT_PARAMETER
-            self._elementMethod         = XmlConstants.V11_ELEMENT_METHOD
-            self._elementField          = XmlConstants.V11_ELEMENT_FIELD
-
-            self._attrId                   = XmlConstants.V11_ATTR_ID
-            self._attrStereoType           = XmlConstants.V11_ATTR_STEREOTYPE
-            self._attrDisplayMethods       = XmlConstants.V11_ATTR_DISPLAY_METHODS
-            self._attrDisplayParameters    = XmlConstants.V11_ATTR_DISPLAY_PARAMETERS
-            self._attrDisplayConstructor   = XmlConstants.V11_ATTR_DISPLAY_CONSTRUCTOR
-            self._attrDisplayDunderMethods = XmlConstants.V11_ATTR_DISPLAY_DUNDER_METHODS
-            self._attrDisplayFields        = XmlConstants.V11_ATTR_DISPLAY_FIELDS
-            self._attrDisplayStereoType    = XmlConstants.V11_ATTR_DISPLAY_STEREOTYPE
-
-            self._attrCardinalitySource      = XmlConstants.V11_ATTR_CARDINALITY_SOURCE
-            self._attrCardinalityDestination = XmlConstants.V11_ATTR_CARDINALITY_DESTINATION
-            self._attrBidirectional          = XmlConstants.V11_ATTR_BIDIRECTIONAL
-            self._attrSourceId               = XmlConstants.V11_ATTR_SOURCE_ID
-            self._attrDestinationId          = XmlConstants.V11_ATTR_DESTINATION_ID
-            self._attrSDMessageSourceId      = XmlConstants.V11_ATTR_SD_MESSAGE_SOURCE_ID
-            self._attrSDMessageDestinationId = XmlConstants.V11_ATTR_SD_MESSAGE_DESTINATION_ID
-
-            self._attrSourceTime             = XmlConstants.V11_ATTR_SOURCE_TIME
-            self._attrDestinationTime        = XmlConstants.V11_ATTR_DESTINATION_TIME
-
-            self._attrFileName = XmlConstants.V11_ATTR_FILENAME
-
-    def classToPyutClass(self, graphicClass: Element) -> PyutClass:
-        if self._xmlVersion == XmlVersion.V10:
-            classElement: Element = graphicClass.Class
-        elif self._xmlVersion == XmlVersion.V11:
-            classElement = graphicClass.PyutClass
-        else:
-            assert False, f'Unsupported Xml Version {self._xmlVersion}'
+        self._schema:      XmlSchema   = XmlSchema.forVersion(xmlVersion)
+        self._internTable: InternTable = InternTable() if internTable is None else internTable
+
+    @property
+    def internTable(self) -> InternTable:
+        return self._internTable
+
+    def classToPyutClass(self, graphicClass: XmlElement) -> PyutClass:
+        classElement: XmlElement = self._childElement(graphicClass, self._schema.elementPyutClass)
 
         pyutClass: PyutClass = PyutClass()
 
         pyutClass = cast(PyutClass, self._addPyutObjectAttributes(pyutElement=classElement, pyutObject=pyutClass))
 
-        displayStr:              str                   = classElement[self._attrDisplayParameters]
-        displayParameters:       PyutDisplayParameters = PyutDisplayParameters(displayStr)
-        displayConstructorStr:   str                   = classElement[self._attrDisplayConstructor]
-        displayDunderMethodsStr: str                   = classElement[self._attrDisplayDunderMethods]
+        displayStr:              str                   = classElement[self._schema.attrDisplayParameters]
+        displayParameters:       PyutDisplayParameters = self._internTable.displayParameters(displayStr)
+        displayConstructorStr:   str                   = classElement[self._schema.attrDisplayConstructor]
+        displayDunderMethodsStr: str                   = classElement[self._schema.attrDisplayDunderMethods]
 
-        displayConstructor:   PyutDisplayMethods = self._securePyutDisplayMethods(displayStr=displayConstructorStr)
-        displayDunderMethods: PyutDisplayMethods = self._securePyutDisplayMethods(displayStr=displayDunderMethodsStr)
+        displayConstructor:   PyutDisplayMethods = self._internTable.displayMethods(displayStr=displayConstructorStr)
+        displayDunderMethods: PyutDisplayMethods = self._internTable.displayMethods(displayStr=displayDunderMethodsStr)
 
-        showStereotype:     bool = bool(classElement[self._attrDisplayStereoType])
-        showFields:         bool = bool(classElement[self._attrDisplayFields])
-        showMethods:        bool = bool(classElement[self._attrDisplayMethods])
-        stereotypeStr:      str  = classElement[self._attrStereoType]
-        fileName:           str  = classElement[self._attrFileName]
+        showStereotype:     bool = bool(classElement[self._schema.attrDisplayStereoType])
+        showFields:         bool = bool(classElement[self._schema.attrDisplayFields])
+        showMethods:        bool = bool(classElement[self._schema.attrDisplayMethods])
+        stereotypeStr:      str  = classElement[self._schema.attrStereoType]
+        fileName:           str  = self._internTable.string(classElement[self._schema.attrFileName])
 
         pyutClass.displayParameters    = displayParameters
         pyutClass.displayConstructor   = displayConstructor
@@ -163,7 +115,7 @@ class UnTanglePyut:
         pyutClass.showMethods       = showMethods
 
         pyutClass.description = classElement['description']
-        pyutClass.stereotype  = PyutStereotype.toEnum(stereotypeStr)
+        pyutClass.stereotype  = self._internTable.stereotype(stereotypeStr)
         pyutClass.fileName    = fileName
 
         pyutClass.methods = self._methodToPyutMethods(classElement=classElement)
@@ -171,7 +123,7 @@ class UnTanglePyut:
 
         return pyutClass
 
-    def textToPyutText(self, graphicText: Element) -> PyutText:
+    def textToPyutText(self, graphicText: XmlElement) -> PyutText:
         """
         Parses the Text elements
         Args:
@@ -179,14 +131,11 @@ class UnTanglePyut:
 
         Returns: A PyutText Object
         """
-        if self._xmlVersion == XmlVersion.V10:
-            textElement: Element  = graphicText.Text
-        else:
-            textElement = graphicText.PyutText
+        textElement: XmlElement = self._childElement(graphicText, self._schema.elementPyutText)
 
         pyutText:    PyutText = PyutText()
 
-        pyutText.id  = int(textElement[self._attrId])
+        pyutText.id  = int(textElement[self._schema.attrId])
 
         rawContent:   str = textElement['content']
         cleanContent: str = rawContent.replace(XML_END_OF_LINE_MARKER, osLineSep)
@@ -194,7 +143,7 @@ class UnTanglePyut:
 
         return pyutText
 
-    def noteToPyutNote(self, graphicNote: Element) -> PyutNote:
+    def noteToPyutNote(self, graphicNote: XmlElement) -> PyutNote:
         """
         Parse Note elements
         Args:
@@ -202,10 +151,7 @@ class UnTanglePyut:
 
         Returns: A PyutNote Object
         """
-        if self._xmlVersion == XmlVersion.V10:
-            noteElement: Element = graphicNote.Note
-        else:
-            noteElement = graphicNote.PyutNote
+        noteElement: XmlElement = self._childElement(graphicNote, self._schema.elementPyutNote)
 
         pyutNote: PyutNote = PyutNote()
 
@@ -218,15 +164,12 @@ class UnTanglePyut:
 
         return pyutNote
 
-    def interfaceToPyutInterface(self, oglInterface2: Element) -> PyutInterface:
+    def interfaceToPyutInterface(self, oglInterface2: XmlElement) -> PyutInterface:
 
-        if self._xmlVersion == XmlVersion.V10:
-            pyutInterfaceElement: Element = oglInterface2.Interface
-        else:
-            pyutInterfaceElement  = oglInterface2.PyutInterface
+        pyutInterfaceElement: XmlElement = self._childElement(oglInterface2, self._schema.elementPyutInterface)
 
         interfaceId: int = int(pyutInterfaceElement['id'])
-        name:        str = pyutInterfaceElement['name']
+        name:        str = self._internTable.string(pyutInterfaceElement['name'])
         description: str = pyutInterfaceElement['description']
 
         pyutInterface: PyutInterface = PyutInterface(name=name)
@@ -235,12 +178,12 @@ class UnTanglePyut:
 
         implementors: Elements = cast(Elements, pyutInterfaceElement.get_elements('Implementor'))
         for implementor in implementors:
-            pyutInterface.addImplementor(implementor['implementingClassName'])
+            pyutInterface.addImplementor(ClassName(self._internTable.string(implementor['implementingClassName'])))
 
         pyutInterface.methods = self._interfaceMethodsToPyutMethods(interface=pyutInterfaceElement)
         return pyutInterface
 
-    def actorToPyutActor(self, graphicActor: Element) -> PyutActor:
+    def actorToPyutActor(self, graphicActor: XmlElement) -> PyutActor:
         """
 
         Args:
@@ -248,10 +191,7 @@ class UnTanglePyut:
 
         Returns:   PyutActor
         """
-        if self._xmlVersion == XmlVersion.V10:
-            actorElement: Element   = graphicActor.Actor
-        else:
-            actorElement = graphicActor.PyutActor
+        actorElement: XmlElement = self._childElement(graphicActor, self._schema.elementPyutActor)
 
         pyutActor: PyutActor = PyutActor()
 
@@ -259,7 +199,7 @@ class UnTanglePyut:
 
         return pyutActor
 
-    def useCaseToPyutUseCase(self, graphicUseCase: Element) -> PyutUseCase:
+    def useCaseToPyutUseCase(self, graphicUseCase: XmlElement) -> PyutUseCase:
         """
 
         Args:
@@ -267,10 +207,7 @@ class UnTanglePyut:
 
         Returns:  PyutUseCase
         """
-        if self._xmlVersion == XmlVersion.V10:
-            useCaseElement: Element     = graphicUseCase.UseCase
-        else:
-            useCaseElement = graphicUseCase.PyutUseCase
+        useCaseElement: XmlElement = self._childElement(graphicUseCase, self._schema.elementPyutUseCase)
 
         pyutUseCase:    PyutUseCase = PyutUseCase()
 
@@ -278,30 +215,27 @@ class UnTanglePyut:
 
         return pyutUseCase
 
-    def linkToPyutLink(self, singleLink: Element, source: PyutClass, destination: PyutClass) -> PyutLink:
-        linkTypeStr:     str          = singleLink['type']
+    def linkToPyutLink(self, singleLink: XmlElement, source: PyutClass, destination: PyutClass) -> PyutLink:
 
-        linkType:        PyutLinkType = PyutLinkType.toEnum(linkTypeStr)
-        cardSrc:         str          = singleLink[self._attrCardinalitySource]
-        cardDest:        str          = singleLink[self._attrCardinalityDestination]
-        bidir:           bool         = SecureConversions.secureBoolean(singleLink[self._attrBidirectional])
-        linkDescription: str          = singleLink['name']
+        pyutLinkRecord: PyutLinkRecord = PyutLinkRecord.fromLinkElement(schema=self._schema, linkElement=singleLink)
 
-        pyutLink: PyutLink = PyutLink(name=linkDescription,
-                                      linkType=linkType,
-                                      cardinalitySource=cardSrc, cardinalityDestination=cardDest,
-                                      bidirectional=bidir,
+        return self.linkRecordToPyutLink(pyutLinkRecord=pyutLinkRecord, source=source, destination=destination)
+
+    def linkRecordToPyutLink(self, pyutLinkRecord: PyutLinkRecord, source: PyutClass, destination: PyutClass) -> PyutLink:
+
+        pyutLink: PyutLink = PyutLink(name=pyutLinkRecord.name,
+                                      linkType=self._internTable.linkType(pyutLinkRecord.linkType),
+                                      cardinalitySource=pyutLinkRecord.cardinalitySource,
+                                      cardinalityDestination=pyutLinkRecord.cardinalityDestination,
+                                      bidirectional=pyutLinkRecord.bidirectional,
                                       source=source,
                                       destination=destination)
 
         return pyutLink
 
-    def sdInstanceToPyutSDInstance(self, oglSDInstanceElement: Element) -> PyutSDInstance:
+    def sdInstanceToPyutSDInstance(self, oglSDInstanceElement: XmlElement) -> PyutSDInstance:
 
-        if self._xmlVersion == XmlVersion.V10:
-            instanceElement: Element = oglSDInstanceElement.SDInstance
-        else:
-            instanceElement = oglSDInstanceElement.PyutSDInstance
+        instanceElement: XmlElement = self._childElement(oglSDInstanceElement, self._schema.elementPyutSDInstance)
         pyutSDInstance:  PyutSDInstance = PyutSDInstance()
 
         pyutSDInstance.id                     = int(instanceElement['id'])
@@ -310,7 +244,7 @@ class UnTanglePyut:
 
         return pyutSDInstance
 
-    def sdMessageToPyutSDMessage(self, oglSDMessageElement: Element) -> ConvolutedPyutSDMessageInformation:
+    def sdMessageToPyutSDMessage(self, oglSDMessageElement: XmlElement) -> ConvolutedPyutSDMessageInformation:
         """
         TODO:  Need to fix how SD Messages are created
         Args:
@@ -318,35 +252,37 @@ class UnTanglePyut:
 
         Returns:  Bogus data class
         """
-        if self._xmlVersion == XmlVersion.V10:
-            messageElement: Element = oglSDMessageElement.SDMessage
-        else:
-            messageElement = oglSDMessageElement.PyutSDMessage
+        sdMessageRecord: SDMessageRecord = SDMessageRecord.fromSDMessage(schema=self._schema, sdMessageElement=oglSDMessageElement)
 
-        pyutSDMessage:  PyutSDMessage = PyutSDMessage()
+        bogus: ConvolutedPyutSDMessageInformation = ConvolutedPyutSDMessageInformation()
 
-        pyutSDMessage.id = int(messageElement['id'])
-        pyutSDMessage.message = messageElement['message']
-        pyutSDMessage.linkType = PyutLinkType.SD_MESSAGE
+        bogus.pyutSDMessage = self.sdMessageRecordToPyutSDMessage(sdMessageRecord=sdMessageRecord)
+        bogus.sourceId      = sdMessageRecord.sourceId
+        bogus.destinationId = sdMessageRecord.destinationId
+
+        return bogus
 
-        srcID: int = int(messageElement[self._attrSDMessageSourceId])
-        dstID: int = int(messageElement[self._attrSDMessageDestinationId])
+    def sdMessageRecordToPyutSDMessage(self, sdMessageRecord: SDMessageRecord) -> PyutSDMessage:
+        """
+        The source and destination instances are left for the caller to resolve
 
-        srcTime: int = int(messageElement[self._attrSourceTime])
-        dstTime: int = int(messageElement[self._attrDestinationTime])
+        Args:
+            sdMessageRecord:  The message attributes
 
-        pyutSDMessage.sourceY      = srcTime
-        pyutSDMessage.destinationY = dstTime
+        Returns:  The message with the source and destination times set
+        """
+        pyutSDMessage:  PyutSDMessage = PyutSDMessage()
 
-        bogus: ConvolutedPyutSDMessageInformation = ConvolutedPyutSDMessageInformation()
+        pyutSDMessage.id       = sdMessageRecord.id
+        pyutSDMessage.message  = sdMessageRecord.message
+        pyutSDMessage.linkType = PyutLinkType.SD_MESSAGE
 
-        bogus.pyutSDMessage = pyutSDMessage
-        bogus.sourceId      = srcID
-        bogus.destinationId = dstID
+        pyutSDMessage.sourceY      = sdMessageRecord.sourceTime
+        pyutSDMessage.destinationY = sdMessageRecord.destinationTime
 
-        return bogus
+        return pyutSDMessage
 
-    def _methodToPyutMethods(self, classElement: Element) -> PyutMethods:
+    def _methodToPyutMethods(self, classElement: XmlElement) -> PyutMethods:
         """
         The pyutClass may not have methods;
         Args:
@@ -356,27 +292,20 @@ class UnTanglePyut:
         """
         untangledPyutMethods: PyutMethods = PyutMethods([])
 
-        methodElements: Elements = cast(Elements, classElement.get_elements(self._elementMethod))
+        methodElements: Elements = cast(Elements, classElement.get_elements(self._schema.elementMethod))
 
         for methodElement in methodElements:
-            methodName: str            = methodElement['name']
-            visibility: PyutVisibility = PyutVisibility.toEnum(methodElement['visibility'])
+            methodName: str            = self._internTable.string(methodElement['name'])
+            visibility: PyutVisibility = self._internTable.visibility(methodElement['visibility'])
             self.logger.debug(f"{methodName=} - {visibility=}")
 
             pyutMethod: PyutMethod = PyutMethod(name=methodName, visibility=visibility)
 
             pyutMethod.modifiers = self._modifierToPyutMethodModifiers(methodElement=methodElement)
 
-            if self._xmlVersion == XmlVersion.V10:
-                returnElement = methodElement.get_elements('Return')
-                if len(returnElement) > 0:
-                    pyutType: PyutType = PyutType(value=returnElement[0]['type'])
-                    pyutMethod.returnType = pyutType
-            elif self._xmlVersion == XmlVersion.V11:
-                returnAttribute = methodElement['returnType']
-                pyutMethod.returnType = PyutType(returnAttribute)
-            else:
-                assert False, f'Unsupported Xml Version {self._xmlVersion}'
+            returnTypeName: str = self._schema.methodReturnType(methodElement)
+            if returnTypeName is not None:
+                pyutMethod.returnType = self._internTable.pyutType(returnTypeName)
 
             parameters = self._paramToPyutParameters(methodElement)
             pyutMethod.parameters = parameters
@@ -386,37 +315,23 @@ class UnTanglePyut:
 
         return untangledPyutMethods
 
-    def _fieldToPyutFields(self, classElement: Element) -> PyutFields:
+    def _fieldToPyutFields(self, classElement: XmlElement) -> PyutFields:
         untangledPyutFields: PyutFields = PyutFields([])
 
-        fieldElements: Elements = cast(Elements, classElement.get_elements(self._elementField))
+        fieldElements: Elements = cast(Elements, classElement.get_elements(self._schema.elementField))
 
         for fieldElement in fieldElements:
-            visibility: PyutVisibility = PyutVisibility.toEnum(fieldElement['visibility'])
-            if self._xmlVersion == XmlVersion.V10:
-                paramElements: Elements           = fieldElement.get_elements('Param')
-                assert len(paramElements) == 1, 'Curiously there should be only one'
-
-                paramElement: Element = paramElements[0]
-                fieldName:    str       = paramElement[XmlConstants.V10_ATTR_NAME]
-                pyutType:     PyutType  = PyutType(paramElement[XmlConstants.V10_ATTR_TYPE])
-                defaultValue: str       = paramElement[XmlConstants.V10_ATTR_DEFAULT_VALUE]
-                if defaultValue is None:
-                    defaultValue = ''
-            elif self._xmlVersion == XmlVersion.V11:
-                fieldName    = fieldElement[XmlConstants.V11_ATTR_NAME]
-                pyutType     = PyutType(fieldElement[XmlConstants.V11_ATTR_TYPE])
-                defaultValue = fieldElement[XmlConstants.V11_ATTR_DEFAULT_VALUE]
-            else:
-                assert False, f'Unsupported Xml Version {self._xmlVersion}'
-
-            pyutField: PyutField = PyutField(name=fieldName, visibility=visibility, type=pyutType, defaultValue=defaultValue)
+            visibility: PyutVisibility = self._internTable.visibility(fieldElement['visibility'])
+            fieldName, fieldType, defaultValue = self._schema.fieldAttributes(fieldElement)
+            pyutType: PyutType = self._internTable.pyutType(fieldType)
+
+            pyutField: PyutField = PyutField(name=self._internTable.string(fieldName), visibility=visibility, type=pyutType, defaultValue=defaultValue)
 
             untangledPyutFields.append(pyutField)
 
         return untangledPyutFields
 
-    def _modifierToPyutMethodModifiers(self, methodElement: Element) -> PyutModifiers:
+    def _modifierToPyutMethodModifiers(self, methodElement: XmlElement) -> PyutModifiers:
         """
         Should be in this form:
 
@@ -437,20 +352,20 @@ class UnTanglePyut:
         if len(modifierElements) > 0:
             for modifierElement in modifierElements:
                 modifierName:           str       = modifierElement['name']
-                pyutModifier: PyutModifier = PyutModifier(name=modifierName)
+                pyutModifier: PyutModifier = self._internTable.pyutModifier(modifierName)
                 pyutModifiers.append(pyutModifier)
 
         return pyutModifiers
 
-    def _paramToPyutParameters(self, methodElement: Element) -> PyutParameters:
+    def _paramToPyutParameters(self, methodElement: XmlElement) -> PyutParameters:
 
-        parameterElements = methodElement.get_elements(self._elementParameter)
+        parameterElements = methodElement.get_elements(self._schema.elementParameter)
 
         untangledPyutMethodParameters: PyutParameters = PyutParameters([])
         for parameterElement in parameterElements:
-            name:           str = parameterElement['name']
+            name:           str = self._internTable.string(parameterElement['name'])
             defaultValue:   str = parameterElement['defaultValue']
-            parameterType:  PyutType = PyutType(parameterElement['type'])
+            parameterType:  PyutType = self._internTable.pyutType(parameterElement['type'])
 
             pyutParameter: PyutParameter = PyutParameter(name=name, type=parameterType, defaultValue=defaultValue)
 
@@ -458,7 +373,7 @@ class UnTanglePyut:
 
         return untangledPyutMethodParameters
 
-    def _sourceCodeToPyutSourceCode(self, methodElement: Element) -> SourceCode:
+    def _sourceCodeToPyutSourceCode(self, methodElement: XmlElement) -> SourceCode:
 
         sourceCodeElements = methodElement.get_elements('SourceCode')
         codeElements = sourceCodeElements[0].get_elements('Code')
@@ -469,13 +384,13 @@ class UnTanglePyut:
             sourceCode.append(codeLine)
         return sourceCode
 
-    def _interfaceMethodsToPyutMethods(self, interface: Element) -> PyutMethods:
+    def _interfaceMethodsToPyutMethods(self, interface: XmlElement) -> PyutMethods:
 
         pyutMethods: PyutMethods = self._methodToPyutMethods(interface)
 
         return pyutMethods
 
-    def _addPyutObjectAttributes(self, pyutElement: Element, pyutObject: PyutObject) -> PyutObject:
+    def _addPyutObjectAttributes(self, pyutElement: XmlElement, pyutObject: PyutObject) -> PyutObject:
         """
 
         Args:
@@ -485,20 +400,26 @@ class UnTanglePyut:
         Returns:  The updated pyutObject as
         """
 
-        pyutObject.id       = int(pyutElement[self._attrId])    # TODO revisit this when we start using UUIDs
-        pyutObject.name     = pyutElement['name']
-        pyutObject.fileName = pyutElement[self._attrFileName]
+        pyutObject.id       = int(pyutElement[self._schema.attrId])    # TODO revisit this when we start using UUIDs
+        pyutObject.name     = self._internTable.string(pyutElement['name'])
+        pyutObject.fileName = self._internTable.string(pyutElement[self._schema.attrFileName])
 
         if pyutObject.name is None:
             UnTanglePyut.noteCounter += 1
             pyutObject.name = f'{UnTanglePyut.NOTE_NAME}-{UnTanglePyut.noteCounter}'
         return pyutObject
 
-    def _securePyutDisplayMethods(self, displayStr: str) -> PyutDisplayMethods:
+    def _childElement(self, parentElement: XmlElement, tagName: str) -> XmlElement:
+        """
+        Not every backend supports `untangle`'s attribute style child access
+
+        Args:
+            parentElement:  A Graphic XML element
+            tagName:        The tag name of its model element
 
-        if displayStr is not None:
-            pyutDisplayMethods: PyutDisplayMethods = PyutDisplayMethods(displayStr)
-        else:
-            pyutDisplayMethods = PyutDisplayMethods.UNSPECIFIED
+        Returns:  The first child with the tag name
+        """
+        childElements: Elements = cast(Elements, parentElement.get_elements(tagName))
+        assert len(childElements) > 0, f'{tagName} missing from {parentElement}'
 
-        return pyutDisplayMethods
+        return childElements[0]
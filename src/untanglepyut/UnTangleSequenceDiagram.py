@@ -1,6 +1,5 @@
 
 from typing import List
-from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -8,7 +7,6 @@ from logging import getLogger
 
 from ogl.OglActor import OglActor
 from pyutmodelv2.PyutLink import PyutLink
-from untangle import Element
 
 from pyutmodelv2.PyutSDInstance import PyutSDInstance
 from pyutmodelv2.PyutSDMessage import PyutSDMessage
@@ -18,18 +16,22 @@ from ogl.sd.OglSDMessage import OglSDMessage
 
 from ogl.OglAssociation import OglAssociation
 
-from untanglepyut import XmlConstants
+from untanglepyut.GraphicRecords import LinkRecord
+from untanglepyut.GraphicRecords import PyutLinkRecord
+
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.GeometryTableBuilder import ShapeKind
+
+from untanglepyut.LinkableObjectRegistry import LinkableObjectRegistry
+
 from untanglepyut.Types import Elements
 
 from untanglepyut.Types import GraphicInformation
-from untanglepyut.Types import GraphicLinkAttributes
 from untanglepyut.Types import LinkableOglObject
-from untanglepyut.Types import LinkableOglObjects
 from untanglepyut.Types import OglSDInstances
 from untanglepyut.Types import OglSDMessages
 from untanglepyut.Types import UntangledOglActors
 from untanglepyut.Types import UntangledOglLinks
-from untanglepyut.Types import createLinkableOglObjects
 from untanglepyut.Types import createOglSDInstances
 from untanglepyut.Types import createOglSDMessages
 from untanglepyut.Types import createUntangledOglActors
@@ -44,11 +46,23 @@ from untanglepyut.XmlVersion import XmlVersion
 
 from untanglepyut.BaseUnTangle import BaseUnTangle
 
+from untanglepyut.XmlBackend import XmlElement
+
 
 class UnTangleSequenceDiagram(BaseUnTangle):
 
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, untanglePyut: UnTanglePyut = cast(UnTanglePyut, None),
+                 untangleUseCaseDiagram: UnTangleUseCaseDiagram = cast(UnTangleUseCaseDiagram, None),
+                 untangleOglLinks: UnTangleOglLinks = cast(UnTangleOglLinks, None)):
+        """
+        The shared untanglers must be of the same version;  Any that are `None` it builds for itself
 
+        Args:
+            xmlVersion:             The XML version of the document
+            untanglePyut:           A shared Pyut untangler
+            untangleUseCaseDiagram: A shared actor untangler
+            untangleOglLinks:       A shared link untangler
+        """
         super().__init__(xmlVersion)
 
         self.logger: Logger = getLogger(__name__)
@@ -58,45 +72,38 @@ class UnTangleSequenceDiagram(BaseUnTangle):
         self._oglActors:      UntangledOglActors = createUntangledOglActors()
         self._oglLinks:       UntangledOglLinks  = createUntangledOglLinks()
 
-        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion)
+        self._untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion) if untanglePyut is None else untanglePyut
         #
         # Need some help
         #
-        self._untangleUseCaseStuff: UnTangleUseCaseDiagram = UnTangleUseCaseDiagram(xmlVersion=xmlVersion)
-        self._untangleLinks:        UnTangleOglLinks       = UnTangleOglLinks(xmlVersion=xmlVersion)
-
-        if xmlVersion == XmlVersion.V10:
-            self._elementInstance:   str = XmlConstants.V10_ELEMENT_INSTANCE
-            self._elementMessage:    str = XmlConstants.V10_ELEMENT_MESSAGE
-            self._elementOglLink:    str = XmlConstants.V10_ELEMENT_OGL_LINK
-            self._elementLink:       str = XmlConstants.V10_ELEMENT_LINK
-            self._attrSourceId:      str = XmlConstants.V10_ATTR_SOURCE_ID
-            self._attrDestinationId: str = XmlConstants.V10_ATTR_DESTINATION_ID
-
-        else:
-            self._elementInstance   = XmlConstants.V11_ELEMENT_INSTANCE
-            self._elementMessage    = XmlConstants.V11_ELEMENT_MESSAGE
-            self._elementOglLink    = XmlConstants.V11_ELEMENT_OGL_LINK
-            self._elementLink       = XmlConstants.V11_ELEMENT_LINK
-            self._attrSourceId      = XmlConstants.V11_ATTR_SOURCE_ID
-            self._attrDestinationId = XmlConstants.V11_ATTR_DESTINATION_ID
-
-    def unTangle(self, pyutDocument: Element):
+        if untangleUseCaseDiagram is None:
+            untangleUseCaseDiagram = UnTangleUseCaseDiagram(xmlVersion=xmlVersion, untanglePyut=self._untanglePyut)
+        if untangleOglLinks is None:
+            untangleOglLinks = UnTangleOglLinks(xmlVersion=xmlVersion, untanglePyut=self._untanglePyut)
+
+        self._untangleUseCaseStuff: UnTangleUseCaseDiagram = untangleUseCaseDiagram
+        self._untangleLinks:        UnTangleOglLinks       = untangleOglLinks
+
+    def unTangle(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry = cast(LinkableObjectRegistry, None),
+                 geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)):
         """
 
         Args:
-            pyutDocument:  The pyut untangle element that represents a sequence diagram
+            pyutDocument:            The pyut untangle element that represents a sequence diagram
+            linkableObjectRegistry:  The document's registry;  A private one is used when not given
+            geometryTableBuilder:    When given, the instances', actors' and links' geometry is added to it
         """
-        self._oglSDInstances = self._untangleSDInstances(pyutDocument=pyutDocument)
-        self._oglSDMessages  = self._untangleSDMessages(pyutDocument=pyutDocument)
+        if linkableObjectRegistry is None:
+            linkableObjectRegistry = LinkableObjectRegistry()
+
+        self._oglSDInstances = self._untangleSDInstances(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
+        self._oglSDMessages  = self._untangleSDMessages(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry)
 
-        self._untangleUseCaseStuff.unTangle(pyutDocument=pyutDocument)
+        self._untangleUseCaseStuff.unTangle(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
 
         self._oglActors = self._untangleUseCaseStuff.oglActors
 
-        linkableOglObjects: LinkableOglObjects = self._buildLinkableObjects()
-        # self._oglLinks       = self._untangleLinks.unTangle(pyutDocument=pyutDocument, linkableOglObjects=linkableOglObjects)
-        self._oglLinks       = self._connectActorsToSDInstances(pyutDocument=pyutDocument, linkableOglObjects=linkableOglObjects)
+        self._oglLinks  = self._connectActorsToSDInstances(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
 
     @property
     def oglSDInstances(self) -> OglSDInstances:
@@ -114,10 +121,10 @@ class UnTangleSequenceDiagram(BaseUnTangle):
     def oglLinks(self) -> UntangledOglLinks:
         return self._oglLinks
 
-    def _untangleSDInstances(self, pyutDocument: Element) -> OglSDInstances:
+    def _untangleSDInstances(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry, geometryTableBuilder: GeometryTableBuilder) -> OglSDInstances:
 
-        oglSDInstances:     OglSDInstances = createOglSDInstances()
-        graphicSDInstances: List[Element]  = pyutDocument.get_elements(self._elementInstance)
+        oglSDInstances:     OglSDInstances   = createOglSDInstances()
+        graphicSDInstances: List[XmlElement] = pyutDocument.get_elements(self._schema.elementInstance)
 
         for graphicSDInstance in graphicSDInstances:
             self.logger.debug(f'{graphicSDInstance=}')
@@ -132,20 +139,23 @@ class UnTangleSequenceDiagram(BaseUnTangle):
             self._updateModel(oglObject=oglSDInstance, graphicInformation=graphicInfo)
 
             oglSDInstances[pyutSDInstance.id] = oglSDInstance
+            linkableObjectRegistry.register(pyutId=pyutSDInstance.id, oglObject=oglSDInstance)
+            if geometryTableBuilder is not None:
+                geometryTableBuilder.addShape(pyutId=pyutSDInstance.id, shapeKind=ShapeKind.SD_INSTANCE, graphicInformation=graphicInfo)
         return oglSDInstances
 
-    def _untangleSDMessages(self, pyutDocument: Element) -> OglSDMessages:
+    def _untangleSDMessages(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry) -> OglSDMessages:
 
         oglSDMessages:     OglSDMessages = createOglSDMessages()
-        graphicSDMessages: List[Element] = pyutDocument.get_elements(self._elementMessage)
+        graphicSDMessages: List[XmlElement] = pyutDocument.get_elements(self._schema.elementMessage)
 
         for graphicSDMessage in graphicSDMessages:
             bogus: ConvolutedPyutSDMessageInformation = self._untanglePyut.sdMessageToPyutSDMessage(oglSDMessageElement=graphicSDMessage)
 
             pyutSDMessage: PyutSDMessage = bogus.pyutSDMessage
 
-            srcInstance: OglSDInstance = self._oglSDInstances[bogus.sourceId]
-            dstInstance: OglSDInstance = self._oglSDInstances[bogus.destinationId]
+            srcInstance: OglSDInstance = linkableObjectRegistry.oglSDInstances[bogus.sourceId]
+            dstInstance: OglSDInstance = linkableObjectRegistry.oglSDInstances[bogus.destinationId]
 
             pyutSDMessage.source      = srcInstance.pyutSDInstance         # Ugh, time was set by sdMessageToPyutSDMessage
             pyutSDMessage.destination = dstInstance.pyutSDInstance         # This "split" functionality must be fixed
@@ -156,98 +166,70 @@ class UnTangleSequenceDiagram(BaseUnTangle):
 
         return oglSDMessages
 
-    def _connectActorsToSDInstances(self, pyutDocument: Element, linkableOglObjects: LinkableOglObjects) -> UntangledOglLinks:
+    def _connectActorsToSDInstances(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry, geometryTableBuilder: GeometryTableBuilder) -> UntangledOglLinks:
 
         oglLinks: UntangledOglLinks = createUntangledOglLinks()
 
         # US Agency for International Development must go away
 
-        graphicLinks: Elements = cast(Elements, pyutDocument.get_elements(self._elementOglLink))
+        graphicLinks: Elements = cast(Elements, pyutDocument.get_elements(self._schema.elementOglLink))
         for graphicLink in graphicLinks:
-            oglAssociation: OglAssociation = self._createActorLink(graphicLink=graphicLink, linkableOglObjects=linkableOglObjects)
+            oglAssociation: OglAssociation = self._createActorLink(graphicLink=graphicLink, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
             oglLinks.append(oglAssociation)
 
         return oglLinks
 
-    def _createActorLink(self, graphicLink: Element, linkableOglObjects: LinkableOglObjects) -> OglAssociation:
+    def _createActorLink(self, graphicLink: XmlElement, linkableObjectRegistry: LinkableObjectRegistry, geometryTableBuilder: GeometryTableBuilder) -> OglAssociation:
         """
 
         Args:
             graphicLink:
-            linkableOglObjects:
+            linkableObjectRegistry:
+            geometryTableBuilder:    When not `None` the link's geometry is added to it
 
         Returns:
         """
 
-        links: Elements = cast(Elements, graphicLink.get_elements(self._elementLink))
-        assert len(links) == 1, 'Should only ever be one'
+        linkRecord:     LinkRecord     = LinkRecord.fromGraphicLink(schema=self._schema, graphicLink=graphicLink)
+        pyutLinkRecord: PyutLinkRecord = linkRecord.pyutLinkRecord
+        if geometryTableBuilder is not None:
+            geometryTableBuilder.addLink(linkRecord=linkRecord)
 
-        singleLink: Element = links[0]
-        sourceId, dstId     = self._linkIDs(singleLink=singleLink)
+        sourceId: int = pyutLinkRecord.sourceId
+        dstId:    int = pyutLinkRecord.destinationId
         try:
-            srcShape: LinkableOglObject = linkableOglObjects[sourceId]
-            dstShape: OglSDInstance     = linkableOglObjects[dstId]        # type: ignore
+            srcShape: LinkableOglObject = linkableObjectRegistry.linkableOglObjects[sourceId]
+            dstShape: OglSDInstance     = linkableObjectRegistry.oglSDInstances[dstId]
         except KeyError as ke:
-            self.logger.error(f'{linkableOglObjects=}')
-            self.logger.error(f'Developer Error -- {singleLink=}')
+            self.logger.error(f'{linkableObjectRegistry.linkableOglObjects=} {linkableObjectRegistry.oglSDInstances=}')
+            self.logger.error(f'Developer Error -- {pyutLinkRecord=}')
             self.logger.error(f'Developer Error -- {sourceId=} {dstId=}  KeyError index: {ke}')
             return cast(OglAssociation, None)
 
         assert isinstance(srcShape, OglActor),      'Developer Error'
         assert isinstance(dstShape, OglSDInstance), 'Developer Error'
 
-        pyutLink: PyutLink              = self._untanglePyut.linkToPyutLink(singleLink, source=srcShape.pyutObject, destination=dstShape.pyutSDInstance)
-        gla:      GraphicLinkAttributes = GraphicLinkAttributes.fromGraphicLink(xmlVersion=self._xmlVersion, graphicLink=graphicLink)
+        pyutLink: PyutLink = self._untanglePyut.linkRecordToPyutLink(pyutLinkRecord, source=srcShape.pyutObject, destination=dstShape.pyutSDInstance)
 
-        self.logger.debug(f'graphicLink= {gla.srcX=} {gla.srcY=} {gla.dstX=} {gla.dstY=} {gla.spline=}')
+        self.logger.debug(f'{linkRecord=}')
 
         oglAssociation: OglAssociation = OglAssociation(srcShape=srcShape,
                                                         pyutLink=pyutLink,
                                                         dstShape=dstShape,
-                                                        srcPos=(gla.srcX, gla.srcY),
-                                                        dstPos=(gla.dstX, gla.dstY)
+                                                        srcPos=(linkRecord.srcX, linkRecord.srcY),
+                                                        dstPos=(linkRecord.dstX, linkRecord.dstY)
                                                         )
         # put the anchors at the right position
         srcAnchor = oglAssociation.sourceAnchor
         dstAnchor = oglAssociation.destinationAnchor
-        srcAnchor.SetPosition(gla.srcX, gla.srcY)
-        dstAnchor.SetPosition(gla.dstX, gla.dstY)
+        srcAnchor.SetPosition(linkRecord.srcX, linkRecord.srcY)
+        dstAnchor.SetPosition(linkRecord.dstX, linkRecord.dstY)
 
         srcModel = srcAnchor.model
-        srcModel.SetPosition(x=gla.srcX, y=gla.srcY)
+        srcModel.SetPosition(x=linkRecord.srcX, y=linkRecord.srcY)
         dstModel = dstAnchor.model
-        dstModel.SetPosition(x=gla.dstX, y=gla.dstY)
+        dstModel.SetPosition(x=linkRecord.dstX, y=linkRecord.dstY)
         #
         # Do not create association labels
         #
         return oglAssociation
-
-    def _linkIDs(self, singleLink: Element) -> Tuple[int, int]:
-        """
-        Extracts the source and destination IDs
-        Args:
-            singleLink:
-
-        Returns:  A tuple of sourceId,destinationId
-        """
-
-        sourceId:    int = int(singleLink[self._attrSourceId])
-        dstId:       int = int(singleLink[self._attrDestinationId])
-
-        return sourceId, dstId
-
-    def _buildLinkableObjects(self) -> LinkableOglObjects:
-        """
-
-        Returns:  Linkable Objects Dictionary
-        """
-
-        linkableOglObjects: LinkableOglObjects = createLinkableOglObjects()
-
-        for oglActor in self.oglActors:
-            linkableOglObjects[oglActor.pyutObject.id] = oglActor
-
-        for pyutID, oglSDInstance in self.oglSDInstances.items():
-            linkableOglObjects[pyutID] = oglSDInstance              # type: ignore
-
-        return linkableOglObjects
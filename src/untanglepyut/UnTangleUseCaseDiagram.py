@@ -1,18 +1,20 @@
 
+from typing import List
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
-from untangle import Element
-
 from pyutmodelv2.PyutActor import PyutActor
 from pyutmodelv2.PyutUseCase import PyutUseCase
 
 from ogl.OglActor import OglActor
 from ogl.OglUseCase import OglUseCase
 
-from untanglepyut import XmlConstants
-
 from untanglepyut.BaseUnTangle import BaseUnTangle
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.GeometryTableBuilder import ShapeKind
+from untanglepyut.LinkableObjectRegistry import LinkableObjectRegistry
 from untanglepyut.UnTanglePyut import UnTanglePyut
 from untanglepyut.XmlVersion import XmlVersion
 
@@ -22,6 +24,8 @@ from untanglepyut.Types import UntangledOglUseCases
 from untanglepyut.Types import createUntangledOglActors
 from untanglepyut.Types import createUntangledOglUseCases
 
+from untanglepyut.XmlBackend import XmlElement
+
 
 class UnTangleUseCaseDiagram(BaseUnTangle):
     """
@@ -41,31 +45,33 @@ class UnTangleUseCaseDiagram(BaseUnTangle):
         </PyutDocument>
     """
 
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion, untanglePyut: UnTanglePyut = cast(UnTanglePyut, None)):
+        """
+
+        Args:
+            xmlVersion:   The XML version of the document
+            untanglePyut: A shared Pyut untangler of the same version;  When `None` it has its own
+        """
 
         super().__init__(xmlVersion)
         self.logger: Logger = getLogger(__name__)
 
         self._untangledOglActors:   UntangledOglActors   = createUntangledOglActors()
         self._untangledOglUseCases: UntangledOglUseCases = createUntangledOglUseCases()
-        self._untanglePyut:         UnTanglePyut         = UnTanglePyut(xmlVersion=xmlVersion)
-
-        if xmlVersion == XmlVersion.V10:
-            self._elementActor:   str = XmlConstants.V10_ELEMENT_ACTOR
-            self._elementUseCase: str = XmlConstants.V10_ELEMENT_USE_CASE
-        else:
-            self._elementActor   = XmlConstants.V11_ELEMENT_ACTOR
-            self._elementUseCase = XmlConstants.V11_ELEMENT_USE_CASE
+        self._untanglePyut:         UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion) if untanglePyut is None else untanglePyut
 
-    def unTangle(self, pyutDocument: Element):
+    def unTangle(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry = cast(LinkableObjectRegistry, None),
+                 geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)):
         """
 
         Args:
             pyutDocument:
+            linkableObjectRegistry:  When given, each actor and use case is registered as it is created
+            geometryTableBuilder:    When given, each actor's and use case's geometry is added to it
         """
 
-        self._untangledOglActors   = self._unTangleOglActors(pyutDocument=pyutDocument)
-        self._untangledOglUseCases = self._unTangleOglUseCases(pyutDocument=pyutDocument)
+        self._untangledOglActors   = self._unTangleOglActors(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
+        self._untangledOglUseCases = self._unTangleOglUseCases(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
 
     @property
     def oglActors(self) -> UntangledOglActors:
@@ -75,9 +81,9 @@ class UnTangleUseCaseDiagram(BaseUnTangle):
     def oglUseCases(self) -> UntangledOglUseCases:
         return self._untangledOglUseCases
 
-    def _unTangleOglActors(self, pyutDocument: Element) -> UntangledOglActors:
+    def _unTangleOglActors(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry, geometryTableBuilder: GeometryTableBuilder) -> UntangledOglActors:
         untangledOglActors: UntangledOglActors = createUntangledOglActors()
-        graphicActors:      Element            = pyutDocument.get_elements(self._elementActor)
+        graphicActors:      List[XmlElement]   = pyutDocument.get_elements(self._schema.elementActor)
 
         for graphicActor in graphicActors:
             graphicInfo: GraphicInformation = GraphicInformation.toGraphicInfo(graphicActor)
@@ -91,14 +97,18 @@ class UnTangleUseCaseDiagram(BaseUnTangle):
             oglActor.pyutObject = pyutActor
 
             untangledOglActors.append(oglActor)
+            if linkableObjectRegistry is not None:
+                linkableObjectRegistry.register(pyutId=pyutActor.id, oglObject=oglActor)
+            if geometryTableBuilder is not None:
+                geometryTableBuilder.addShape(pyutId=pyutActor.id, shapeKind=ShapeKind.ACTOR, graphicInformation=graphicInfo)
 
         return untangledOglActors
 
-    def _unTangleOglUseCases(self, pyutDocument: Element) -> UntangledOglUseCases:
+    def _unTangleOglUseCases(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry, geometryTableBuilder: GeometryTableBuilder) -> UntangledOglUseCases:
 
         untangledOglUseCases: UntangledOglUseCases = createUntangledOglUseCases()
 
-        graphicUseCases: Element = pyutDocument.get_elements(self._elementUseCase)
+        graphicUseCases: List[XmlElement] = pyutDocument.get_elements(self._schema.elementUseCase)
         for graphicUseCase in graphicUseCases:
             graphicInfo: GraphicInformation = GraphicInformation.toGraphicInfo(graphicUseCase)
             oglUseCase:  OglUseCase         = OglUseCase(w=graphicInfo.width, h=graphicInfo.height)
@@ -112,5 +122,9 @@ class UnTangleUseCaseDiagram(BaseUnTangle):
             oglUseCase.pyutObject = pyutUseCase
 
             untangledOglUseCases.append(oglUseCase)
+            if linkableObjectRegistry is not None:
+                linkableObjectRegistry.register(pyutId=pyutUseCase.id, oglObject=oglUseCase)
+            if geometryTableBuilder is not None:
+                geometryTableBuilder.addShape(pyutId=pyutUseCase.id, shapeKind=ShapeKind.USE_CASE, graphicInformation=graphicInfo)
 
         return untangledOglUseCases
@@ -1,51 +1,121 @@
 
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
-from untangle import parse
-from untangle import Element
+from functools import partial
+
+from zlib import decompress
+
+from hashlib import blake2b
 
 from untanglepyut.BaseUnTangle import BaseUnTangle
 
+from untanglepyut.ModelTypes import DocumentChanges
+
 from untanglepyut.Types import Document
 from untanglepyut.Types import DocumentTitle
 from untanglepyut.Types import Documents
 
 from untanglepyut.Types import ProjectInformation
-from untanglepyut.Types import UntangledOglClasses
+from untanglepyut.Types import ProjectOglObject
 from untanglepyut.Types import UntangledOglNotes
 from untanglepyut.Types import UntangledOglTexts
-from untanglepyut.Types import createLinkableOglObjects
 
 from untanglepyut.UnTangleOglTexts import UnTangleOglTexts
 
+from untanglepyut.GeometryTableBuilder import GeometryTableBuilder
+from untanglepyut.LazyDocuments import LazyDocuments
+from untanglepyut.LinkableObjectRegistry import LinkableObjectRegistry
+from untanglepyut.OglClassProxy import OglClassProxy
+from untanglepyut.ParseCache import ParseCache
+from untanglepyut.ProjectCache import CacheKey
+from untanglepyut.ProjectCache import CachedProject
+from untanglepyut.ProjectCache import ProjectCache
 from untanglepyut.UnTangleProjectInformation import UnTangleProjectInformation
-from untanglepyut.UnTanglePyut import UnTanglePyut
 from untanglepyut.UnTangleUseCaseDiagram import UnTangleUseCaseDiagram
 from untanglepyut.UnTangleSequenceDiagram import UnTangleSequenceDiagram
-from untanglepyut.UnTangleOglLinks import LinkableOglObjects
-from untanglepyut.UnTangleOglLinks import UnTangleOglLinks
 from untanglepyut.UnTangleOglClasses import UnTangleOglClasses
 from untanglepyut.UnTangleOglNotes import UnTangleOglNotes
+from untanglepyut.UnTanglerComponents import UnTanglerComponents
 
+from untanglepyut.SymbolTable import SymbolTable
+
+from untanglepyut.XmlSchema import XmlSchema
 from untanglepyut.XmlVersion import XmlVersion
 
+from untanglepyut.XmlBackend import DocumentStream
+from untanglepyut.XmlBackend import XmlBackendType
+from untanglepyut.XmlBackend import XmlChunk
+from untanglepyut.XmlBackend import XmlElement
+
 
 class UnTangler(BaseUnTangle):
 
-    def __init__(self, xmlVersion: XmlVersion):
+    def __init__(self, xmlVersion: XmlVersion = cast(XmlVersion, None), lazy: bool = False, backendType: XmlBackendType = XmlBackendType.UNTANGLE,
+                 deferOglClasses: bool = False, geometryTable: bool = False, projectCache: ProjectCache = cast(ProjectCache, None),
+                 parseCache: ParseCache = cast(ParseCache, None)):
         """
+
+        Args:
+            xmlVersion:  The XML version of the files to untangle;  When `None` the version is read from
+                         each file's PyutProject header during the same pass that untangles it, so
+                         one untangler handles a mix of versions
+            lazy:        When `True` the documents are only catalogued;  Each one is untangled the
+                         first time its title is looked up in `documents`
+            backendType: The XML parser that feeds the untanglers
+            deferOglClasses: When `True` a class diagram's `oglClasses` holds an `OglClassProxy` for each
+                         class;  Only the classes at either end of a link or under a lollipop are built
+                         while untangling, the rest when they are first used
+            geometryTable: When `True` each document also gets a columnar `GeometryTable`;  Needs numpy
+            projectCache: When given, `untangleFile` and `untangleXml` keep the parsed XML in it and
+                         reuse it for the same bytes;  The Ogl objects are always new.  Lazy mode and
+                         `iterDocuments` do not use it
+            parseCache:  When given, `untangleFile` loads unchanged files from this on-disk cache before
+                         it reads them and ignores `projectCache`;  The documents are untangled from the
+                         cached form whatever the backend.  Lazy mode and `iterDocuments` do not use it
         """
+        self._detectXmlVersion: bool = xmlVersion is None
+        if self._detectXmlVersion is True:
+            xmlVersion = XmlVersion.V11     # Until we read a header
+
         super().__init__(xmlVersion)
         self.logger: Logger = getLogger(__name__)
 
-        self._projectInformation: ProjectInformation = cast(ProjectInformation, None)
-        self._documents:          Documents          = Documents({})
+        self._lazy:            bool           = lazy
+        self._backendType:     XmlBackendType = backendType
+        self._deferOglClasses: bool           = deferOglClasses
+        self._geometryTable:   bool           = geometryTable
+        self._projectCache:    ProjectCache   = projectCache
+        self._parseCache:      ParseCache     = parseCache
+
+        self._projectInformation: ProjectInformation            = cast(ProjectInformation, None)
+        self._documents:          Documents                     = Documents({})
+        self._symbolTable:        SymbolTable[ProjectOglObject] = SymbolTable()
+        #
+        # Only the incremental untangles keep these;  Anything else starts them over
+        #
+        self._fingerprints:       Dict[DocumentTitle, str]      = {}
+        self._projectFingerprint: str                           = cast(str, None)
+
+        #
+        # Built once per version and reused by every document of every load
+        #
+        self._componentPool: Dict[XmlVersion, UnTanglerComponents] = {}
+        self._components:    UnTanglerComponents                   = self._componentsFor(xmlVersion=xmlVersion)
 
-        self._untanglePyut:     UnTanglePyut     = UnTanglePyut(xmlVersion=xmlVersion)
-        self._untangleOglLinks: UnTangleOglLinks = UnTangleOglLinks(xmlVersion=xmlVersion)
+    @property
+    def xmlVersion(self) -> XmlVersion:
+        """
+        When detecting, the version of the last untangled file
+
+        Returns:  The XML version the untanglers are bound to
+        """
+        return self._xmlVersion
 
     @property
     def projectInformation(self) -> ProjectInformation:
@@ -58,8 +128,22 @@ class UnTangler(BaseUnTangle):
 
     @property
     def documents(self) -> Documents:
+        """
+        In lazy mode this is a read-only `LazyDocuments` mapping
+
+        Returns:  The untangled documents by title
+        """
         return self._documents
 
+    @property
+    def symbolTable(self) -> SymbolTable[ProjectOglObject]:
+        """
+        Kept in step with `documents`;  In lazy mode it only has the documents untangled so far
+
+        Returns:  The classes, notes, actors, use cases and sequence diagram instances of every document
+        """
+        return self._symbolTable
+
     def untangleFile(self, fqFileName: str):
         """
         Read input file and untangle to Ogl
@@ -67,8 +151,30 @@ class UnTangler(BaseUnTangle):
             fqFileName:  The file name with the XML
 
         """
-        xmlString:   str     = self.getRawXml(fqFileName=fqFileName)
-        self.untangleXml(xmlString=xmlString, fqFileName=fqFileName)
+        self._forgetFingerprints()
+
+        compressed: bool = fqFileName.endswith('.put')
+        if self._lazy is True:
+            if compressed is True:
+                rawXml: bytes = b''.join(self.decompressedChunks(fqFileName=fqFileName))
+            else:
+                #
+                # Not memory mapped;  The lazy documents outlive this call and a
+                # map of a file that is rewritten underneath us is a crash waiting to happen
+                #
+                with open(fqFileName, 'rb') as xmlFile:
+                    rawXml = xmlFile.read()
+            self._untangleLazily(rawXml=rawXml, fqFileName=fqFileName)
+        elif self._parseCache is not None:
+            self._untangleParsedProject(cachedProject=self._parseCache.load(fqFileName=fqFileName), fqFileName=fqFileName)
+        elif self._projectCache is not None:
+            with open(fqFileName, 'rb') as xmlFile:
+                rawBytes: bytes = xmlFile.read()
+            self._untangleCachedProject(rawBytes=rawBytes, compressed=compressed, fqFileName=fqFileName)
+        elif compressed is True:
+            self._untangleXmlChunks(xmlChunks=self.decompressedChunks(fqFileName=fqFileName), fqFileName=fqFileName)
+        else:
+            self._untangleXmlChunks(xmlChunks=self.mappedXmlChunks(fqFileName=fqFileName), fqFileName=fqFileName)
 
         self._projectInformation.fileName = fqFileName
 
@@ -79,51 +185,373 @@ class UnTangler(BaseUnTangle):
             fqFileName:  The file name from which the XML came from
             xmlString: The string with the raw XML
         """
-        root:        Element = parse(xmlString)
-        pyutProject: Element = root.PyutProject
+        self._forgetFingerprints()
+
+        if self._lazy is True:
+            self._untangleLazily(rawXml=xmlString.encode('utf-8'), fqFileName=fqFileName, encoding='utf-8')
+        elif self._projectCache is not None:
+            self._untangleCachedProject(rawBytes=xmlString.encode('utf-8'), compressed=False, fqFileName=fqFileName, encoding='utf-8')
+        else:
+            self._untangleXmlChunks(xmlChunks=[xmlString], fqFileName=fqFileName)
+
+    def untangleFileIncrementally(self, fqFileName: str) -> DocumentChanges:
+        """
+        Untangles only the documents whose XML changed since the last incremental untangle;  The
+        others keep their Document, the very same objects.  The first call untangles every
+        document.  Any other untangle in between starts over.  Not for lazy mode
+
+        Args:
+            fqFileName:  The .xml or .put file name
+
+        Returns:  The titles that were added, removed, rebuilt and left alone
+        """
+        if fqFileName.endswith('.put'):
+            rawXml: bytes = b''.join(self.decompressedChunks(fqFileName=fqFileName))
+        else:
+            with open(fqFileName, 'rb') as xmlFile:
+                rawXml = xmlFile.read()
+
+        documentChanges: DocumentChanges = self._untangleIncrementally(rawXml=rawXml, fqFileName=fqFileName)
+
+        self._projectInformation.fileName = fqFileName
+
+        return documentChanges
+
+    def untangleXmlIncrementally(self, xmlString: str, fqFileName: str) -> DocumentChanges:
+        """
+        The same as `untangleFileIncrementally` for XML that is already in memory
+
+        Args:
+            xmlString:   The string with the raw XML
+            fqFileName:  The file name from which the XML came from
+
+        Returns:  The titles that were added, removed, rebuilt and left alone
+        """
+        return self._untangleIncrementally(rawXml=xmlString.encode('utf-8'), fqFileName=fqFileName, encoding='utf-8')
+
+    def iterDocuments(self, fqFileName: str) -> Iterator[Document]:
+        """
+        Yields each fully linked document as soon as its PyutDocument closes;  The rest of the file
+        is still unread.  The documents are not kept in `documents`, so a caller that drops each one
+        after using it keeps memory flat.  `projectInformation` is valid from the first document on.
+        Ignores lazy mode
+
+        Args:
+            fqFileName:  The .xml or .put file name
+
+        Returns:  The untangled documents in file order
+        """
+        if fqFileName.endswith('.put'):
+            xmlChunks: Iterable[XmlChunk] = self.decompressedChunks(fqFileName=fqFileName)
+        else:
+            xmlChunks = self.mappedXmlChunks(fqFileName=fqFileName)
+
+        yield from self._iterXmlChunks(xmlChunks=xmlChunks, fqFileName=fqFileName)
+
+    def _untangleXmlChunks(self, xmlChunks: Iterable[XmlChunk], fqFileName: str):
+        """
+        Untangle each document as soon as the stream completes it
+
+        Args:
+            xmlChunks:   The raw XML in one or more pieces
+            fqFileName:  The file name from which the XML came from
+        """
+        for document in self._iterXmlChunks(xmlChunks=xmlChunks, fqFileName=fqFileName):
+            self._documents[DocumentTitle(document.documentTitle)] = document
+            self._addSymbols(document=document)
+
+    def _untangleCachedProject(self, rawBytes: bytes, compressed: bool, fqFileName: str, encoding: str = cast(str, None)):
+        """
+        Parses the bytes only when the cache does not have them
+
+        Args:
+            rawBytes:    The file's bytes as read
+            compressed:  When `True` the bytes are a Pyut compressed file
+            fqFileName:  The file name from which the XML came from
+            encoding:    Overrides the encoding in the XML declaration
+        """
+        cacheKey:      CacheKey      = ProjectCache.contentKey(rawBytes=rawBytes, encoding=encoding)
+        cachedProject: CachedProject = self._projectCache.get(cacheKey)
+        if cachedProject is None:
+            xmlBytes: bytes = decompress(rawBytes) if compressed is True else rawBytes
 
-        unTangleProjectInformation: UnTangleProjectInformation = UnTangleProjectInformation(fqFileName=fqFileName)
+            cachedProject = CachedProject.fromXml(xmlBytes=xmlBytes, encoding=encoding)
+            self._projectCache.put(cacheKey, cachedProject)
 
-        self._projectInformation = unTangleProjectInformation.projectInformation
+        self._untangleParsedProject(cachedProject=cachedProject, fqFileName=fqFileName)
+
+    def _untangleParsedProject(self, cachedProject: CachedProject, fqFileName: str):
+        """
+        The cached elements are only read, so they can be untangled again and again
 
-        for pyutDocument in pyutProject.PyutDocument:
-            document: Document = self._updateCurrentDocumentInformation(pyutDocument=pyutDocument)
+        Args:
+            cachedProject:  A project from one of the caches
+            fqFileName:     The file name from which the XML came from
+        """
+        self._startProject(pyutProject=cachedProject.pyutProject, fqFileName=fqFileName)
+        for pyutDocument in cachedProject.pyutDocuments:
+            document: Document = self._untangleDocument(pyutDocument=pyutDocument)
 
             self._documents[DocumentTitle(document.documentTitle)] = document
+            self._addSymbols(document=document)
 
-            self.logger.debug(f'{document=}')
-            if document.documentType == 'CLASS_DIAGRAM':
-                document.oglClasses = self._graphicClassesToOglClasses(pyutDocument=pyutDocument)
-                document.oglNotes   = self._graphicNotesToOglNotes(pyutDocument=pyutDocument)
-                document.oglTexts   = self._graphicalTextToOglTexts(pyutDocument=pyutDocument)
+    def _iterXmlChunks(self, xmlChunks: Iterable[XmlChunk], fqFileName: str) -> Iterator[Document]:
+        """
 
-                linkableOglObjects: LinkableOglObjects = self._buildDictionary(document=document)
-                document.oglLinks   = self._untangleOglLinks.unTangle(pyutDocument=pyutDocument, linkableOglObjects=linkableOglObjects)
-            elif document.documentType == 'SEQUENCE_DIAGRAM':
-                untangleSequenceDiagram: UnTangleSequenceDiagram = UnTangleSequenceDiagram(xmlVersion=self._xmlVersion)
+        Args:
+            xmlChunks:   The raw XML in one or more pieces
+            fqFileName:  The file name from which the XML came from
 
-                untangleSequenceDiagram.unTangle(pyutDocument=pyutDocument)
-                document.oglSDInstances = untangleSequenceDiagram.oglSDInstances
-                document.oglSDMessages  = untangleSequenceDiagram.oglSDMessages
-                document.oglActors      = untangleSequenceDiagram.oglActors
-                document.oglLinks       = untangleSequenceDiagram.oglLinks
+        Returns:  Each document as soon as the stream completes it
+        """
+        documentStream: DocumentStream = self._backendType.createDocumentStream()
+
+        projectStarted: bool = False
+        for pyutDocument in documentStream.documents(xmlChunks=xmlChunks):
+            if projectStarted is False:
+                #
+                # The stream always sees the project header before the first document
+                #
+                self._startProject(pyutProject=documentStream.pyutProject, fqFileName=fqFileName)
+                projectStarted = True
 
-            elif document.documentType == 'USECASE_DIAGRAM':
+            yield self._untangleDocument(pyutDocument=pyutDocument)
 
-                unTangleUseCaseDiagram: UnTangleUseCaseDiagram = UnTangleUseCaseDiagram(xmlVersion=self._xmlVersion)
+        if projectStarted is False:
+            self._startProject(pyutProject=documentStream.pyutProject, fqFileName=fqFileName)
 
-                unTangleUseCaseDiagram.unTangle(pyutDocument=pyutDocument)
-                document.oglActors   = unTangleUseCaseDiagram.oglActors
-                document.oglUseCases = unTangleUseCaseDiagram.oglUseCases
-                document.oglNotes    = self._graphicNotesToOglNotes(pyutDocument=pyutDocument)
-                document.oglTexts    = self._graphicalTextToOglTexts(pyutDocument=pyutDocument)
+    def _untangleIncrementally(self, rawXml: bytes, fqFileName: str, encoding: str = cast(str, None)) -> DocumentChanges:
+        """
+        The catalogue pass finds where each document is without building it;  A document's fingerprint
+        is a hash of its bytes.  Identical bytes skip even the catalogue pass
 
-                linkableOglObjects = self._buildDictionary(document=document)
-                document.oglLinks  = self._untangleOglLinks.unTangle(pyutDocument, linkableOglObjects=linkableOglObjects)
+        Args:
+            rawXml:      The raw XML bytes
+            fqFileName:  The file name from which the XML came from
+            encoding:    Overrides the encoding in the XML declaration
+
+        Returns:  The titles that were added, removed, rebuilt and left alone
+        """
+        assert self._lazy is False, 'A lazy untangler only untangles what is looked up'
+
+        documentChanges:    DocumentChanges = DocumentChanges()
+        projectFingerprint: str             = blake2b(rawXml, digest_size=20).hexdigest()
+        if projectFingerprint == self._projectFingerprint:
+            documentChanges.unchanged.extend(self._documents.keys())
+            return documentChanges
+
+        lazyDocuments: LazyDocuments = LazyDocuments(rawXml=rawXml,
+                                                     documentInformation=self._updateCurrentDocumentInformation,
+                                                     documentUnTangler=self._untangleDocument,
+                                                     encoding=encoding,
+                                                     backendType=self._backendType)
+        self._startProject(pyutProject=lazyDocuments.pyutProject, fqFileName=fqFileName)
+
+        previousDocuments: Documents                = self._documents
+        documents:         Documents                = Documents({})
+        fingerprints:      Dict[DocumentTitle, str] = {}
+        for documentTitle in lazyDocuments:
+            fingerprint: str = lazyDocuments.fingerprint(documentTitle)
+            if documentTitle in previousDocuments and self._fingerprints.get(documentTitle) == fingerprint:
+                documents[documentTitle] = previousDocuments[documentTitle]
+                documentChanges.unchanged.append(documentTitle)
             else:
-                assert False, f'Unknown document type: {document.documentType}'
+                documents[documentTitle] = lazyDocuments[documentTitle]
+                self._addSymbols(document=documents[documentTitle])
+                if documentTitle in previousDocuments:
+                    documentChanges.rebuilt.append(documentTitle)
+                else:
+                    documentChanges.added.append(documentTitle)
+
+            fingerprints[documentTitle] = fingerprint
+
+        for documentTitle in previousDocuments:
+            if documentTitle not in documents:
+                self._symbolTable.removeDocument(documentTitle)
+                documentChanges.removed.append(documentTitle)
 
-    def _updateCurrentDocumentInformation(self, pyutDocument: Element) -> Document:
+        self._documents          = documents
+        self._fingerprints       = fingerprints
+        self._projectFingerprint = projectFingerprint
+
+        return documentChanges
+
+    def _forgetFingerprints(self):
+        self._fingerprints       = {}
+        self._projectFingerprint = cast(str, None)
+
+    def _startProject(self, pyutProject: XmlElement, fqFileName: str):
+        """
+        The project element came from the same parse;  No need to read the file again
+
+        Args:
+            pyutProject:  The PyutProject element
+            fqFileName:   The file name from which the XML came from
+        """
+        if self._detectXmlVersion is True:
+            self._bindXmlVersion(pyutProject=pyutProject)
+        self._components.startLoad()
+
+        self._projectInformation = UnTangleProjectInformation.toProjectInformation(pyutProject=pyutProject, fqFileName=fqFileName)
+
+    def _untangleLazily(self, rawXml: bytes, fqFileName: str, encoding: str = cast(str, None)):
+        """
+        Only catalogues the documents;  LazyDocuments untangles each one on demand
+
+        Args:
+            rawXml:      The raw XML bytes
+            fqFileName:  The file name from which the XML came from
+            encoding:    Overrides the encoding in the XML declaration
+        """
+        symbolTable: SymbolTable[ProjectOglObject] = SymbolTable()
+
+        lazyDocuments: LazyDocuments = LazyDocuments(rawXml=rawXml,
+                                                     documentInformation=self._updateCurrentDocumentInformation,
+                                                     documentUnTangler=self._untangleDocument,
+                                                     encoding=encoding,
+                                                     backendType=self._backendType)
+        #
+        # The catalogue pass has read the header;  Nothing is untangled until a title is looked up.  The
+        # documents keep this version's untanglers and this load's symbol table even after another file
+        # is untangled
+        #
+        self._startProject(pyutProject=lazyDocuments.pyutProject, fqFileName=fqFileName)
+        lazyDocuments.documentUnTangler = partial(self._untangleAndAddSymbols, components=self._components, symbolTable=symbolTable)
+
+        self._symbolTable = symbolTable
+        self._documents   = cast(Documents, lazyDocuments)
+
+    def _bindXmlVersion(self, pyutProject: XmlElement):
+        """
+        Point the untanglers at the schema of the project's XML version;  Keeps them when the
+        version is unchanged
+
+        Args:
+            pyutProject:  The PyutProject element;  Only its version attribute is used
+        """
+        xmlVersion: XmlVersion = XmlVersion.fromProjectVersion(pyutProject['version'])
+        if xmlVersion == self._xmlVersion:
+            return
+
+        self.logger.debug(f'Detected {xmlVersion=}')
+
+        self._xmlVersion = xmlVersion
+        self._schema     = XmlSchema.forVersion(xmlVersion)
+        self._components = self._componentsFor(xmlVersion=xmlVersion)
+
+    def _componentsFor(self, xmlVersion: XmlVersion) -> UnTanglerComponents:
+        """
+        Args:
+            xmlVersion:  The version of the next documents
+
+        Returns:  The version's untanglers;  Built the first time the version shows up
+        """
+        components: UnTanglerComponents = self._componentPool.get(xmlVersion, cast(UnTanglerComponents, None))
+        if components is None:
+            components = UnTanglerComponents(xmlVersion=xmlVersion, deferOglClasses=self._deferOglClasses)
+            self._componentPool[xmlVersion] = components
+
+        return components
+
+    def _untangleDocument(self, pyutDocument: XmlElement, components: UnTanglerComponents = cast(UnTanglerComponents, None)) -> Document:
+        """
+        Untangle a single PyutDocument to Ogl.  The stream drops the
+        document subtree once we are done with it
+
+        Args:
+            pyutDocument:  A complete PyutDocument element
+            components:    The untanglers of the document's XML version;  When `None` the current ones
+
+        Returns:  The fully untangled document
+        """
+        if components is None:
+            components = self._components
+
+        document:               Document               = self._updateCurrentDocumentInformation(pyutDocument=pyutDocument)
+        linkableObjectRegistry: LinkableObjectRegistry = LinkableObjectRegistry()
+        geometryTableBuilder:   GeometryTableBuilder   = GeometryTableBuilder() if self._geometryTable is True else cast(GeometryTableBuilder, None)
+
+        self.logger.debug(f'{document=}')
+        if document.documentType == 'CLASS_DIAGRAM':
+            unTangleOglClasses: UnTangleOglClasses = components.untangleOglClasses
+
+            document.oglClasses       = unTangleOglClasses.unTangle(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
+            document.oglClassesByName = unTangleOglClasses.oglClassesByName
+            document.oglNotes   = self._graphicNotesToOglNotes(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, components=components,
+                                                               geometryTableBuilder=geometryTableBuilder)
+            document.oglTexts   = self._graphicalTextToOglTexts(pyutDocument=pyutDocument, components=components, geometryTableBuilder=geometryTableBuilder)
+
+            document.oglLinks   = components.untangleOglLinks.unTangle(pyutDocument=pyutDocument, linkableOglObjects=linkableObjectRegistry.linkableOglObjects,
+                                                                       geometryTableBuilder=geometryTableBuilder)
+        elif document.documentType == 'SEQUENCE_DIAGRAM':
+            untangleSequenceDiagram: UnTangleSequenceDiagram = components.untangleSequenceDiagram
+
+            untangleSequenceDiagram.unTangle(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
+            document.oglSDInstances = untangleSequenceDiagram.oglSDInstances
+            document.oglSDMessages  = untangleSequenceDiagram.oglSDMessages
+            document.oglActors      = untangleSequenceDiagram.oglActors
+            document.oglLinks       = untangleSequenceDiagram.oglLinks
+
+        elif document.documentType == 'USECASE_DIAGRAM':
+
+            unTangleUseCaseDiagram: UnTangleUseCaseDiagram = components.untangleUseCaseDiagram
+
+            unTangleUseCaseDiagram.unTangle(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
+            document.oglActors   = unTangleUseCaseDiagram.oglActors
+            document.oglUseCases = unTangleUseCaseDiagram.oglUseCases
+            document.oglNotes    = self._graphicNotesToOglNotes(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, components=components,
+                                                                geometryTableBuilder=geometryTableBuilder)
+            document.oglTexts    = self._graphicalTextToOglTexts(pyutDocument=pyutDocument, components=components, geometryTableBuilder=geometryTableBuilder)
+
+            document.oglLinks  = components.untangleOglLinks.unTangle(pyutDocument, linkableOglObjects=linkableObjectRegistry.linkableOglObjects,
+                                                                     geometryTableBuilder=geometryTableBuilder)
+        else:
+            assert False, f'Unknown document type: {document.documentType}'
+
+        if geometryTableBuilder is not None:
+            document.geometryTable = geometryTableBuilder.build()
+
+        return document
+
+    def _untangleAndAddSymbols(self, pyutDocument: XmlElement, components: UnTanglerComponents, symbolTable: SymbolTable[ProjectOglObject]) -> Document:
+
+        document: Document = self._untangleDocument(pyutDocument=pyutDocument, components=components)
+        self._addSymbols(document=document, symbolTable=symbolTable)
+
+        return document
+
+    def _addSymbols(self, document: Document, symbolTable: SymbolTable[ProjectOglObject] = cast(SymbolTable[ProjectOglObject], None)):
+        """
+        Files the document's objects in the project symbol table;  Replaces what was filed for an
+        earlier document with the same title.  Deferred classes are filed without being built
+
+        Args:
+            document:     A fully untangled document
+            symbolTable:  The symbol table of the document's load;  When `None` the current one
+        """
+        documentTitle: DocumentTitle = DocumentTitle(document.documentTitle)
+        if symbolTable is None:
+            symbolTable = self._symbolTable
+
+        symbolTable.removeDocument(documentTitle)
+
+        for name, oglClasses in document.oglClassesByName.items():
+            for oglClass in oglClasses:
+                if isinstance(oglClass, OglClassProxy):
+                    symbolTable.add(documentTitle, pyutId=oglClass.pyutId, symbol=oglClass, name=name)
+                else:
+                    symbolTable.add(documentTitle, pyutId=oglClass.pyutObject.id, symbol=oglClass, name=name)
+
+        for oglNote in document.oglNotes:
+            symbolTable.add(documentTitle, pyutId=oglNote.pyutObject.id, symbol=oglNote)
+        for oglActor in document.oglActors:
+            symbolTable.add(documentTitle, pyutId=oglActor.pyutObject.id, symbol=oglActor, name=oglActor.pyutObject.name)
+        for oglUseCase in document.oglUseCases:
+            symbolTable.add(documentTitle, pyutId=oglUseCase.pyutObject.id, symbol=oglUseCase, name=oglUseCase.pyutObject.name)
+        for pyutId, oglSDInstance in document.oglSDInstances.items():
+            symbolTable.add(documentTitle, pyutId=pyutId, symbol=oglSDInstance, name=oglSDInstance.pyutSDInstance.instanceName)
+
+    def _updateCurrentDocumentInformation(self, pyutDocument: XmlElement) -> Document:
 
         documentInformation: Document = Document()
 
@@ -141,62 +569,37 @@ class UnTangler(BaseUnTangle):
 
         return documentInformation
 
-    def _graphicClassesToOglClasses(self, pyutDocument: Element) -> UntangledOglClasses:
-
-        unTangleOglClasses: UnTangleOglClasses  = UnTangleOglClasses(xmlVersion=self._xmlVersion)
-        oglClasses:         UntangledOglClasses = unTangleOglClasses.unTangle(pyutDocument=pyutDocument)
-
-        return oglClasses
-
-    def _graphicNotesToOglNotes(self, pyutDocument: Element) -> UntangledOglNotes:
+    def _graphicNotesToOglNotes(self, pyutDocument: XmlElement, linkableObjectRegistry: LinkableObjectRegistry, components: UnTanglerComponents,
+                                geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)) -> UntangledOglNotes:
         """
 
         Args:
             pyutDocument:
+            linkableObjectRegistry:  The document's registry;  The notes are registered in it
+            components:              The untanglers of the document's XML version
+            geometryTableBuilder:    When given, the notes' geometry is added to it
 
         Returns: untangled OglNote objects if any exist, else an empty list
         """
-        unTangleOglNotes: UnTangleOglNotes  = UnTangleOglNotes(xmlVersion=self._xmlVersion)
-        oglNotes:         UntangledOglNotes = unTangleOglNotes.unTangle(pyutDocument=pyutDocument)
+        unTangleOglNotes: UnTangleOglNotes  = components.untangleOglNotes
+        oglNotes:         UntangledOglNotes = unTangleOglNotes.unTangle(pyutDocument=pyutDocument, linkableObjectRegistry=linkableObjectRegistry, geometryTableBuilder=geometryTableBuilder)
 
         return oglNotes
 
-    def _graphicalTextToOglTexts(self, pyutDocument: Element) -> UntangledOglTexts:
+    def _graphicalTextToOglTexts(self, pyutDocument: XmlElement, components: UnTanglerComponents,
+                                 geometryTableBuilder: GeometryTableBuilder = cast(GeometryTableBuilder, None)) -> UntangledOglTexts:
         """
         Yeah, yeah, I know bad English;
 
         Args:
-            pyutDocument:  The Element document
+            pyutDocument:          The Element document
+            components:            The untanglers of the document's XML version
+            geometryTableBuilder:  When given, the texts' geometry is added to it
 
         Returns:  untangled OglText objects if any exist, else an empty list
         """
 
-        unTangleOglTexts: UnTangleOglTexts  = UnTangleOglTexts(xmlVersion=self._xmlVersion)
-        oglTexts:         UntangledOglTexts = unTangleOglTexts.unTangle(pyutDocument=pyutDocument)
+        unTangleOglTexts: UnTangleOglTexts  = components.untangleOglTexts
+        oglTexts:         UntangledOglTexts = unTangleOglTexts.unTangle(pyutDocument=pyutDocument, geometryTableBuilder=geometryTableBuilder)
 
         return oglTexts
-
-    def _buildDictionary(self, document: Document) -> LinkableOglObjects:
-        """
-
-        Args:
-            document:   The created document either Use case or class diagram
-
-        Returns:  Linkable Objects Dictionary
-        """
-
-        linkableOglObjects: LinkableOglObjects = createLinkableOglObjects()
-
-        for oglClass in document.oglClasses:
-            linkableOglObjects[oglClass.pyutObject.id] = oglClass
-
-        for oglNote in document.oglNotes:
-            linkableOglObjects[oglNote.pyutObject.id] = oglNote
-
-        for oglUseCase in document.oglUseCases:
-            linkableOglObjects[oglUseCase.pyutObject.id] = oglUseCase
-
-        for oglActor in document.oglActors:
-            linkableOglObjects[oglActor.pyutObject.id] = oglActor
-
-        return linkableOglObjects
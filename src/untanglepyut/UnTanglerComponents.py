@@ -0,0 +1,90 @@
+
+from logging import Logger
+from logging import getLogger
+
+from untanglepyut.InternTable import InternTable
+from untanglepyut.UnTangleOglClasses import UnTangleOglClasses
+from untanglepyut.UnTangleOglLinks import UnTangleOglLinks
+from untanglepyut.UnTangleOglNotes import UnTangleOglNotes
+from untanglepyut.UnTangleOglTexts import UnTangleOglTexts
+from untanglepyut.UnTanglePyut import UnTanglePyut
+from untanglepyut.UnTangleSequenceDiagram import UnTangleSequenceDiagram
+from untanglepyut.UnTangleUseCaseDiagram import UnTangleUseCaseDiagram
+from untanglepyut.XmlVersion import XmlVersion
+
+
+class UnTanglerComponents:
+    """
+    The Pyut, shape and link untanglers of one XML version, built once and used for every document
+    of every load;  They all share one UnTanglePyut.  What one document leaves behind is never read
+    by the next:  The link registry is made per document and the intern table is cleared by `startLoad`.
+
+    The shape untanglers keep the results of their last document until the next one, so like the
+    UnTangler that owns them they are for one thread at a time
+    """
+    def __init__(self, xmlVersion: XmlVersion, deferOglClasses: bool = False):
+        """
+
+        Args:
+            xmlVersion:       The XML version of the documents
+            deferOglClasses:  When `True` the class untangler builds an `OglClassProxy` per class
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._xmlVersion:  XmlVersion  = xmlVersion
+        self._internTable: InternTable = InternTable()
+
+        untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=xmlVersion, internTable=self._internTable)
+
+        self._untanglePyut:            UnTanglePyut            = untanglePyut
+        self._untangleOglClasses:      UnTangleOglClasses      = UnTangleOglClasses(xmlVersion=xmlVersion, deferred=deferOglClasses, untanglePyut=untanglePyut)
+        self._untangleOglNotes:        UnTangleOglNotes        = UnTangleOglNotes(xmlVersion=xmlVersion, untanglePyut=untanglePyut)
+        self._untangleOglTexts:        UnTangleOglTexts        = UnTangleOglTexts(xmlVersion=xmlVersion, untanglePyut=untanglePyut)
+        self._untangleOglLinks:        UnTangleOglLinks        = UnTangleOglLinks(xmlVersion=xmlVersion, untanglePyut=untanglePyut)
+        self._untangleUseCaseDiagram:  UnTangleUseCaseDiagram  = UnTangleUseCaseDiagram(xmlVersion=xmlVersion, untanglePyut=untanglePyut)
+        self._untangleSequenceDiagram: UnTangleSequenceDiagram = UnTangleSequenceDiagram(xmlVersion=xmlVersion,
+                                                                                         untanglePyut=untanglePyut,
+                                                                                         untangleUseCaseDiagram=self._untangleUseCaseDiagram,
+                                                                                         untangleOglLinks=self._untangleOglLinks)
+
+    @property
+    def xmlVersion(self) -> XmlVersion:
+        return self._xmlVersion
+
+    @property
+    def internTable(self) -> InternTable:
+        return self._internTable
+
+    @property
+    def untanglePyut(self) -> UnTanglePyut:
+        return self._untanglePyut
+
+    @property
+    def untangleOglClasses(self) -> UnTangleOglClasses:
+        return self._untangleOglClasses
+
+    @property
+    def untangleOglNotes(self) -> UnTangleOglNotes:
+        return self._untangleOglNotes
+
+    @property
+    def untangleOglTexts(self) -> UnTangleOglTexts:
+        return self._untangleOglTexts
+
+    @property
+    def untangleOglLinks(self) -> UnTangleOglLinks:
+        return self._untangleOglLinks
+
+    @property
+    def untangleUseCaseDiagram(self) -> UnTangleUseCaseDiagram:
+        return self._untangleUseCaseDiagram
+
+    @property
+    def untangleSequenceDiagram(self) -> UnTangleSequenceDiagram:
+        return self._untangleSequenceDiagram
+
+    def startLoad(self):
+        """
+        Forgets the previous load's interned values;  The documents it built keep theirs
+        """
+        self._internTable.clear()
@@ -0,0 +1,125 @@
+
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import Protocol
+from typing import TYPE_CHECKING
+from typing import Union
+from typing import cast
+
+from enum import Enum
+
+from importlib.util import find_spec
+
+if TYPE_CHECKING:
+    from untanglepyut.IndexedDocument import IndexedDocument
+
+XmlChunk = Union[bytes, memoryview, str]
+
+
+class XmlElement(Protocol):
+    """
+    The only element access the untanglers use.  It is a subset of the `untangle` Element
+    API, so `untangle` Elements need no adapter;  The other backends wrap their elements
+    """
+    @property
+    def cdata(self) -> str:
+        """
+        Returns:  The character data directly inside the element
+        """
+        ...
+
+    def get_elements(self, name: str = cast(str, None)) -> List['XmlElement']:
+        """
+        Args:
+            name:  A tag name;  When `None` all the children
+
+        Returns:  The child elements with the given tag name, in document order
+        """
+        ...
+
+    def __getitem__(self, key: str) -> str:
+        """
+        Args:
+            key:  An attribute name
+
+        Returns:  The attribute value or `None` if the element does not have the attribute
+        """
+        ...
+
+
+Elements = NewType('Elements', List[XmlElement])
+
+
+class DocumentStream(Protocol):
+    """
+    What every backend's incremental parser provides;  See PyutDocumentStream.  The documents
+    are IndexedDocuments, so looking up a document's children by tag name is cheap
+    """
+    @property
+    def pyutProject(self) -> XmlElement:
+        ...
+
+    def feed(self, xmlChunk: XmlChunk):
+        ...
+
+    def close(self):
+        ...
+
+    def popDocuments(self) -> List['IndexedDocument']:
+        ...
+
+    def documents(self, xmlChunks: Iterable[XmlChunk]) -> Iterator['IndexedDocument']:
+        ...
+
+
+class XmlBackendType(Enum):
+    """
+    The parsers that can feed the untanglers.  `untangle` is the compatible default;  `lxml`
+    is only available when it is installed
+    """
+    UNTANGLE     = 'untangle'
+    ELEMENT_TREE = 'ElementTree'
+    LXML         = 'lxml'
+
+    @classmethod
+    def availableBackends(cls) -> List['XmlBackendType']:
+        """
+        Returns:  The backends that can be used on this host
+        """
+        backends: List[XmlBackendType] = [XmlBackendType.UNTANGLE, XmlBackendType.ELEMENT_TREE]
+        if find_spec('lxml') is not None:
+            backends.append(XmlBackendType.LXML)
+
+        return backends
+
+    @classmethod
+    def fastestBackend(cls) -> 'XmlBackendType':
+        """
+        Both lxml and ElementTree build their trees in C;  `untangle` builds them in Python
+
+        Returns:  The fastest backend available on this host
+        """
+        if XmlBackendType.LXML in XmlBackendType.availableBackends():
+            return XmlBackendType.LXML
+        return XmlBackendType.ELEMENT_TREE
+
+    def createDocumentStream(self, encoding: str = cast(str, None)) -> DocumentStream:
+        """
+        Args:
+            encoding:  Overrides the encoding in the XML declaration
+
+        Returns:  A new incremental parser for this backend
+        """
+        if self == XmlBackendType.UNTANGLE:
+            from untanglepyut.PyutDocumentStream import PyutDocumentStream
+            return PyutDocumentStream(encoding=encoding)
+        elif self == XmlBackendType.ELEMENT_TREE:
+            from untanglepyut.ElementTreeDocumentStream import ElementTreeDocumentStream
+            return ElementTreeDocumentStream(encoding=encoding)
+        elif self == XmlBackendType.LXML:
+            from untanglepyut.LxmlDocumentStream import LxmlDocumentStream
+            return LxmlDocumentStream(encoding=encoding)
+        else:
+            assert False, f'Unknown backend: {self}'
@@ -98,3 +98,41 @@ V10_ELEMENT_LINK:           str = 'Link'
 V11_ELEMENT_OGL_LINK:       str = 'OglLink'
 V11_ELEMENT_OGL_INTERFACE2: str = 'OglInterface2'
 V11_ELEMENT_LINK:           str = 'PyutLink'
+#
+# Project structure;  Same in all versions
+#
+ELEMENT_PROJECT:  str = 'PyutProject'
+ELEMENT_DOCUMENT: str = 'PyutDocument'
+#
+# The model element inside each graphic element
+#
+V10_ELEMENT_PYUT_CLASS:       str = 'Class'
+V10_ELEMENT_PYUT_TEXT:        str = 'Text'
+V10_ELEMENT_PYUT_NOTE:        str = 'Note'
+V10_ELEMENT_PYUT_ACTOR:       str = 'Actor'
+V10_ELEMENT_PYUT_USE_CASE:    str = 'UseCase'
+V10_ELEMENT_PYUT_SD_INSTANCE: str = 'SDInstance'
+V10_ELEMENT_PYUT_SD_MESSAGE:  str = 'SDMessage'
+V10_ELEMENT_FIELD_PARAMETER:  str = 'Param'
+V10_ELEMENT_RETURN:           str = 'Return'
+
+V11_ELEMENT_PYUT_CLASS:       str = 'PyutClass'
+V11_ELEMENT_PYUT_TEXT:        str = 'PyutText'
+V11_ELEMENT_PYUT_NOTE:        str = 'PyutNote'
+V11_ELEMENT_PYUT_ACTOR:       str = 'PyutActor'
+V11_ELEMENT_PYUT_USE_CASE:    str = 'PyutUseCase'
+V11_ELEMENT_PYUT_SD_INSTANCE: str = 'PyutSDInstance'
+V11_ELEMENT_PYUT_SD_MESSAGE:  str = 'PyutSDMessage'
+V11_ATTR_RETURN_TYPE:         str = 'returnType'
+#
+# Link anchors
+#
+V10_ATTR_SOURCE_ANCHOR_X:      str = 'srcX'
+V10_ATTR_SOURCE_ANCHOR_Y:      str = 'srcY'
+V10_ATTR_DESTINATION_ANCHOR_X: str = 'dstX'
+V10_ATTR_DESTINATION_ANCHOR_Y: str = 'dstY'
+
+V11_ATTR_SOURCE_ANCHOR_X:      str = 'sourceAnchorX'
+V11_ATTR_SOURCE_ANCHOR_Y:      str = 'sourceAnchorY'
+V11_ATTR_DESTINATION_ANCHOR_X: str = 'destinationAnchorX'
+V11_ATTR_DESTINATION_ANCHOR_Y: str = 'destinationAnchorY'
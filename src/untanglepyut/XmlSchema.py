@@ -0,0 +1,281 @@
+
+from typing import Dict
+from typing import Tuple
+from typing import cast
+
+from abc import ABC
+from abc import abstractmethod
+
+
+from untanglepyut import XmlConstants
+
+from untanglepyut.XmlBackend import XmlElement
+from untanglepyut.XmlVersion import XmlVersion
+
+FieldAttributes = Tuple[str, str, str]
+LinkAnchors     = Tuple[str, str, str, str]
+
+
+class XmlSchema(ABC):
+    """
+    The element and attribute names of a single XML version plus resolvers for the places where
+    the versions differ in shape.  There is one shared, immutable instance per version;  Every untangler
+    resolves it once with `forVersion()`, so per-element code never looks at the XML version.
+
+    A new XML version is one more subclass and one more entry in `forVersion()`
+    """
+    xmlVersion: XmlVersion = cast(XmlVersion, None)
+
+    elementOglClass:      str = ''
+    elementOglNote:       str = ''
+    elementOglText:       str = ''
+    elementOglLink:       str = ''
+    elementOglInterface2: str = ''
+    elementActor:         str = ''
+    elementUseCase:       str = ''
+    elementInstance:      str = ''
+    elementMessage:       str = ''
+
+    elementPyutClass:      str = ''
+    elementPyutText:       str = ''
+    elementPyutNote:       str = ''
+    elementPyutInterface:  str = ''
+    elementPyutActor:      str = ''
+    elementPyutUseCase:    str = ''
+    elementPyutSDInstance: str = ''
+    elementPyutSDMessage:  str = ''
+    elementLink:           str = ''
+
+    elementMethod:    str = ''
+    elementParameter: str = ''
+    elementField:     str = ''
+
+    elementLabelCenter:      str = ''
+    elementLabelSource:      str = ''
+    elementLabelDestination: str = ''
+
+    attrId:                   str = ''
+    attrStereoType:           str = ''
+    attrDisplayMethods:       str = ''
+    attrDisplayParameters:    str = ''
+    attrDisplayConstructor:   str = XmlConstants.V11_ATTR_DISPLAY_CONSTRUCTOR      # V10 never had these
+    attrDisplayDunderMethods: str = XmlConstants.V11_ATTR_DISPLAY_DUNDER_METHODS   # and will never have them
+    attrDisplayFields:        str = ''
+    attrDisplayStereoType:    str = ''
+
+    attrCardinalitySource:      str = ''
+    attrCardinalityDestination: str = ''
+    attrBidirectional:          str = ''
+    attrSourceId:               str = ''
+    attrDestinationId:          str = ''
+    attrSDMessageSourceId:      str = ''
+    attrSDMessageDestinationId: str = ''
+    attrSourceTime:             str = ''
+    attrDestinationTime:        str = ''
+
+    attrFileName: str = ''
+
+    def __init__(self, linkAnchors: LinkAnchors):
+        """
+
+        Args:
+            linkAnchors:  The source x, source y, destination x and destination y attribute names
+        """
+        self._linkAnchors: LinkAnchors = linkAnchors
+
+    @classmethod
+    def forVersion(cls, xmlVersion: XmlVersion) -> 'XmlSchema':
+        """
+        Args:
+            xmlVersion:  An XML version
+
+        Returns:  The shared schema for the version
+        """
+        assert xmlVersion in _SCHEMAS, f'Unsupported Xml Version {xmlVersion}'
+
+        return _SCHEMAS[xmlVersion]
+
+    def linkAnchors(self, graphicLink: XmlElement) -> LinkAnchors:
+        """
+        Args:
+            graphicLink:  A graphic link element
+
+        Returns:  The raw source x, source y, destination x and destination y
+        """
+        srcX, srcY, dstX, dstY = self._linkAnchors
+
+        return graphicLink[srcX], graphicLink[srcY], graphicLink[dstX], graphicLink[dstY]
+
+    @abstractmethod
+    def fieldAttributes(self, fieldElement: XmlElement) -> FieldAttributes:
+        """
+        Args:
+            fieldElement:  A field element
+
+        Returns:  The field name, type and default value
+        """
+        pass
+
+    @abstractmethod
+    def methodReturnType(self, methodElement: XmlElement) -> str:
+        """
+        Args:
+            methodElement:  A method element
+
+        Returns:  The return type's name;  `None` if the method does not declare one
+        """
+        pass
+
+
+class V10XmlSchema(XmlSchema):
+    """
+    Fields keep their attributes in a nested Param element and methods keep their
+    return type in a nested Return element
+    """
+    xmlVersion: XmlVersion = XmlVersion.V10
+
+    elementOglClass      = XmlConstants.V10_ELEMENT_CLASS
+    elementOglNote       = XmlConstants.V10_ELEMENT_NOTE
+    elementOglText       = XmlConstants.V10_ELEMENT_TEXT
+    elementOglLink       = XmlConstants.V10_ELEMENT_OGL_LINK
+    elementOglInterface2 = XmlConstants.V10_ELEMENT_OGL_INTERFACE2
+    elementActor         = XmlConstants.V10_ELEMENT_ACTOR
+    elementUseCase       = XmlConstants.V10_ELEMENT_USE_CASE
+    elementInstance      = XmlConstants.V10_ELEMENT_INSTANCE
+    elementMessage       = XmlConstants.V10_ELEMENT_MESSAGE
+
+    elementPyutClass      = XmlConstants.V10_ELEMENT_PYUT_CLASS
+    elementPyutText       = XmlConstants.V10_ELEMENT_PYUT_TEXT
+    elementPyutNote       = XmlConstants.V10_ELEMENT_PYUT_NOTE
+    elementPyutInterface  = XmlConstants.V10_ELEMENT_INTERFACE2
+    elementPyutActor      = XmlConstants.V10_ELEMENT_PYUT_ACTOR
+    elementPyutUseCase    = XmlConstants.V10_ELEMENT_PYUT_USE_CASE
+    elementPyutSDInstance = XmlConstants.V10_ELEMENT_PYUT_SD_INSTANCE
+    elementPyutSDMessage  = XmlConstants.V10_ELEMENT_PYUT_SD_MESSAGE
+    elementLink           = XmlConstants.V10_ELEMENT_LINK
+
+    elementMethod    = XmlConstants.V10_ELEMENT_METHOD
+    elementParameter = XmlConstants.V10_ELEMENT_PARAMETER
+    elementField     = XmlConstants.V10_ELEMENT_FIELD
+
+    elementLabelCenter      = XmlConstants.V10_ELEMENT_LABEL_CENTER
+    elementLabelSource      = XmlConstants.V10_ELEMENT_LABEL_SOURCE
+    elementLabelDestination = XmlConstants.V10_ELEMENT_LABEL_DESTINATION
+
+    attrId                = XmlConstants.V10_ATTR_ID
+    attrStereoType        = XmlConstants.V10_ATTR_STEREOTYPE
+    attrDisplayMethods    = XmlConstants.V10_ATTR_DISPLAY_METHODS
+    attrDisplayParameters = XmlConstants.V10_ATTR_DISPLAY_PARAMETERS
+    attrDisplayFields     = XmlConstants.V10_ATTR_DISPLAY_FIELDS
+    attrDisplayStereoType = XmlConstants.V10_ATTR_DISPLAY_STEREOTYPE
+
+    attrCardinalitySource      = XmlConstants.V10_ATTR_CARDINALITY_SOURCE
+    attrCardinalityDestination = XmlConstants.V10_ATTR_CARDINALITY_DESTINATION
+    attrBidirectional          = XmlConstants.V10_ATTR_BIDIRECTIONAL
+    attrSourceId               = XmlConstants.V10_ATTR_SOURCE_ID
+    attrDestinationId          = XmlConstants.V10_ATTR_DESTINATION_ID
+    attrSDMessageSourceId      = XmlConstants.V10_ATTR_SD_MESSAGE_SOURCE_ID
+    attrSDMessageDestinationId = XmlConstants.V10_ATTR_SD_MESSAGE_DESTINATION_ID
+    attrSourceTime             = XmlConstants.V10_ATTR_SOURCE_TIME
+    attrDestinationTime        = XmlConstants.V10_ATTR_DESTINATION_TIME
+
+    attrFileName = XmlConstants.V10_ATTR_FILENAME
+
+    def __init__(self):
+        super().__init__(linkAnchors=(XmlConstants.V10_ATTR_SOURCE_ANCHOR_X,      XmlConstants.V10_ATTR_SOURCE_ANCHOR_Y,
+                                      XmlConstants.V10_ATTR_DESTINATION_ANCHOR_X, XmlConstants.V10_ATTR_DESTINATION_ANCHOR_Y))
+
+    def fieldAttributes(self, fieldElement: XmlElement) -> FieldAttributes:
+
+        paramElements = fieldElement.get_elements(XmlConstants.V10_ELEMENT_FIELD_PARAMETER)
+        assert len(paramElements) == 1, 'Curiously there should be only one'
+
+        paramElement: XmlElement = paramElements[0]
+
+        fieldName:    str = paramElement[XmlConstants.V10_ATTR_NAME]
+        fieldType:    str = paramElement[XmlConstants.V10_ATTR_TYPE]
+        defaultValue: str = paramElement[XmlConstants.V10_ATTR_DEFAULT_VALUE]
+        if defaultValue is None:
+            defaultValue = ''
+
+        return fieldName, fieldType, defaultValue
+
+    def methodReturnType(self, methodElement: XmlElement) -> str:
+
+        returnElements = methodElement.get_elements(XmlConstants.V10_ELEMENT_RETURN)
+        if len(returnElements) > 0:
+            return returnElements[0]['type']
+
+        return cast(str, None)
+
+
+class V11XmlSchema(XmlSchema):
+    """
+    Fields and methods are flat;  Everything is an attribute
+    """
+    xmlVersion: XmlVersion = XmlVersion.V11
+
+    elementOglClass      = XmlConstants.V11_ELEMENT_CLASS
+    elementOglNote       = XmlConstants.V11_ELEMENT_NOTE
+    elementOglText       = XmlConstants.V11_ELEMENT_TEXT
+    elementOglLink       = XmlConstants.V11_ELEMENT_OGL_LINK
+    elementOglInterface2 = XmlConstants.V11_ELEMENT_OGL_INTERFACE2
+    elementActor         = XmlConstants.V11_ELEMENT_ACTOR
+    elementUseCase       = XmlConstants.V11_ELEMENT_USE_CASE
+    elementInstance      = XmlConstants.V11_ELEMENT_INSTANCE
+    elementMessage       = XmlConstants.V11_ELEMENT_MESSAGE
+
+    elementPyutClass      = XmlConstants.V11_ELEMENT_PYUT_CLASS
+    elementPyutText       = XmlConstants.V11_ELEMENT_PYUT_TEXT
+    elementPyutNote       = XmlConstants.V11_ELEMENT_PYUT_NOTE
+    elementPyutInterface  = XmlConstants.V11_ELEMENT_INTERFACE2
+    elementPyutActor      = XmlConstants.V11_ELEMENT_PYUT_ACTOR
+    elementPyutUseCase    = XmlConstants.V11_ELEMENT_PYUT_USE_CASE
+    elementPyutSDInstance = XmlConstants.V11_ELEMENT_PYUT_SD_INSTANCE
+    elementPyutSDMessage  = XmlConstants.V11_ELEMENT_PYUT_SD_MESSAGE
+    elementLink           = XmlConstants.V11_ELEMENT_LINK
+
+    elementMethod    = XmlConstants.V11_ELEMENT_METHOD
+    elementParameter = XmlConstants.V11_ELEMENT_PARAMETER
+    elementField     = XmlConstants.V11_ELEMENT_FIELD
+
+    elementLabelCenter      = XmlConstants.V11_ELEMENT_LABEL_CENTER
+    elementLabelSource      = XmlConstants.V11_ELEMENT_LABEL_SOURCE
+    elementLabelDestination = XmlConstants.V11_ELEMENT_LABEL_DESTINATION
+
+    attrId                   = XmlConstants.V11_ATTR_ID
+    attrStereoType           = XmlConstants.V11_ATTR_STEREOTYPE
+    attrDisplayMethods       = XmlConstants.V11_ATTR_DISPLAY_METHODS
+    attrDisplayParameters    = XmlConstants.V11_ATTR_DISPLAY_PARAMETERS
+    attrDisplayConstructor   = XmlConstants.V11_ATTR_DISPLAY_CONSTRUCTOR
+    attrDisplayDunderMethods = XmlConstants.V11_ATTR_DISPLAY_DUNDER_METHODS
+    attrDisplayFields        = XmlConstants.V11_ATTR_DISPLAY_FIELDS
+    attrDisplayStereoType    = XmlConstants.V11_ATTR_DISPLAY_STEREOTYPE
+
+    attrCardinalitySource      = XmlConstants.V11_ATTR_CARDINALITY_SOURCE
+    attrCardinalityDestination = XmlConstants.V11_ATTR_CARDINALITY_DESTINATION
+    attrBidirectional          = XmlConstants.V11_ATTR_BIDIRECTIONAL
+    attrSourceId               = XmlConstants.V11_ATTR_SOURCE_ID
+    attrDestinationId          = XmlConstants.V11_ATTR_DESTINATION_ID
+    attrSDMessageSourceId      = XmlConstants.V11_ATTR_SD_MESSAGE_SOURCE_ID
+    attrSDMessageDestinationId = XmlConstants.V11_ATTR_SD_MESSAGE_DESTINATION_ID
+    attrSourceTime             = XmlConstants.V11_ATTR_SOURCE_TIME
+    attrDestinationTime        = XmlConstants.V11_ATTR_DESTINATION_TIME
+
+    attrFileName = XmlConstants.V11_ATTR_FILENAME
+
+    def __init__(self):
+        super().__init__(linkAnchors=(XmlConstants.V11_ATTR_SOURCE_ANCHOR_X,      XmlConstants.V11_ATTR_SOURCE_ANCHOR_Y,
+                                      XmlConstants.V11_ATTR_DESTINATION_ANCHOR_X, XmlConstants.V11_ATTR_DESTINATION_ANCHOR_Y))
+
+    def fieldAttributes(self, fieldElement: XmlElement) -> FieldAttributes:
+        return fieldElement[XmlConstants.V11_ATTR_NAME], fieldElement[XmlConstants.V11_ATTR_TYPE], fieldElement[XmlConstants.V11_ATTR_DEFAULT_VALUE]
+
+    def methodReturnType(self, methodElement: XmlElement) -> str:
+        return methodElement[XmlConstants.V11_ATTR_RETURN_TYPE]
+
+
+_SCHEMAS: Dict[XmlVersion, XmlSchema] = {
+    XmlVersion.V10: V10XmlSchema(),
+    XmlVersion.V11: V11XmlSchema(),
+}
@@ -1,8 +1,27 @@
 
 from enum import Enum
 
+from untanglepyut.UnsupportedXmlVersionException import UnsupportedXmlVersionException
+
 
 class XmlVersion(Enum):
 
     V10 = '10'
     V11 = '11'
+
+    @classmethod
+    def fromProjectVersion(cls, version: str) -> 'XmlVersion':
+        """
+        Some early V10 files have an empty version
+
+        Args:
+            version:  The PyutProject version attribute
+
+        Returns:  The matching XML version
+        """
+        if version == '':
+            return XmlVersion.V10
+        try:
+            return XmlVersion(version)
+        except ValueError:
+            raise UnsupportedXmlVersionException(message=f'Unsupported PyutProject version: {version}')
@@ -3,6 +3,7 @@ from unittest import TestSuite
 from unittest import main as unitTestMain
 
 from tests.ProjectTestBase import ProjectTestBase
+from untanglepyut.PyutDocumentStream import PyutDocumentStream
 from untanglepyut.Types import ProjectInformation
 from untanglepyut.UnTangleProjectInformation import UnTangleProjectInformation
 from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
@@ -33,6 +34,23 @@ class TestUnTangleProjectInformation(ProjectTestBase):
     def testV11ProjectInformation(self):
         self._testProjectInformation(package=ProjectTestBase.V11_TEST_FILES_PACKAGE_NAME, fileName='EmptyDiagram.xml', expectedVersion='11')
 
+    def testProjectInformationFromParsedProject(self):
+
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V11_TEST_FILES_PACKAGE_NAME, fileName='EmptyDiagram.xml')
+        with open(fqFileName, 'rb') as xmlFile:
+            rawXml: bytes = xmlFile.read()
+
+        documentStream: PyutDocumentStream = PyutDocumentStream()
+        for _ in documentStream.documents(xmlChunks=[rawXml]):
+            pass
+
+        projectInformation: ProjectInformation = UnTangleProjectInformation.toProjectInformation(pyutProject=documentStream.pyutProject,
+                                                                                                fqFileName=fqFileName)
+
+        self.assertEqual(fqFileName, projectInformation.fileName, 'Mismatched project information file name')
+        self.assertEqual('11',       projectInformation.version,  'Mismatched XML version')
+        self.assertEqual('',         projectInformation.codePath, 'Mismatched code path')
+
     def _testProjectInformation(self, package: str, fileName: str, expectedVersion: str):
 
         fqFileName:                 str                         = ProjectTestBase.getFullyQualifiedResourceFileName(package=package, fileName=fileName)
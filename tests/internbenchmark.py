@@ -0,0 +1,132 @@
+
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from gc import collect
+
+from time import perf_counter
+
+from tracemalloc import Snapshot
+from tracemalloc import start
+from tracemalloc import stop
+from tracemalloc import take_snapshot
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutModifier import PyutModifier
+from pyutmodelv2.PyutType import PyutType
+
+from pyutmodelv2.enumerations.PyutDisplayMethods import PyutDisplayMethods
+from pyutmodelv2.enumerations.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
+from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+from untangle import parse
+
+from untanglepyut.InternTable import InternTable
+from untanglepyut.UnTanglePyut import UnTanglePyut
+from untanglepyut.XmlVersion import XmlVersion
+
+#
+# Converts a synthetic class diagram twice;  Once with the InternTable and once with a table that builds
+# every value anew, the way UnTanglePyut did before it had one.  Reports what the Pyut classes still hold
+# once the parse tree is gone and how many blocks that takes
+#
+CLASS_COUNT:  int = 2000
+MEMBER_COUNT: int = 10
+
+TYPE_NAMES:   List[str] = ['str', 'int', 'float', 'bool', 'List[str]', 'Dict[str, int]', 'Optional[str]']
+VISIBILITIES: List[str] = ['PUBLIC', 'PRIVATE', 'PROTECTED']
+
+
+class FreshValues(InternTable):
+    """
+    Every call builds a new value
+    """
+    def string(self, value: str) -> str:
+        return value
+
+    def pyutType(self, typeName: str) -> PyutType:
+        return PyutType(typeName)
+
+    def pyutModifier(self, modifierName: str) -> PyutModifier:
+        return PyutModifier(name=modifierName)
+
+    def visibility(self, visibilityStr: str) -> PyutVisibility:
+        return PyutVisibility.toEnum(visibilityStr)
+
+    def stereotype(self, stereotypeStr: str) -> PyutStereotype:
+        return PyutStereotype.toEnum(stereotypeStr)
+
+    def linkType(self, linkTypeStr: str) -> PyutLinkType:
+        return PyutLinkType.toEnum(linkTypeStr)
+
+    def displayParameters(self, displayStr: str) -> PyutDisplayParameters:
+        return PyutDisplayParameters(displayStr)
+
+    def displayMethods(self, displayStr: str) -> PyutDisplayMethods:
+        return PyutDisplayMethods.UNSPECIFIED if displayStr is None else PyutDisplayMethods(displayStr)
+
+
+def classDiagram() -> str:
+
+    xml: List[str] = ['<PyutDocument type="CLASS_DIAGRAM" title="Benchmark">']
+    for classNumber in range(CLASS_COUNT):
+        xml.append(f'<OglClass width="100" height="100" x="{classNumber}" y="{classNumber}">')
+        xml.append(f'<PyutClass id="{classNumber}" name="Class{classNumber}" stereotype="noStereotype" displayMethods="True" '
+                   f'displayParameters="Unspecified" displayConstructor="Unspecified" displayDunderMethods="Unspecified" '
+                   f'displayFields="True" displayStereotype="True" fileName="model.py" description="">')
+        for member in range(MEMBER_COUNT):
+            typeName:   str = TYPE_NAMES[member % len(TYPE_NAMES)]
+            visibility: str = VISIBILITIES[member % len(VISIBILITIES)]
+            xml.append(f'<PyutMethod name="method{member}" visibility="{visibility}" returnType="{typeName}">')
+            xml.append('<Modifier name="static" />')
+            xml.append(f'<PyutParameter name="value" type="{typeName}" defaultValue="" />')
+            xml.append('<SourceCode />')
+            xml.append('</PyutMethod>')
+            xml.append(f'<PyutField name="field{member}" visibility="{visibility}" type="{typeName}" defaultValue="" />')
+        xml.append('</PyutClass>')
+        xml.append('</OglClass>')
+    xml.append('</PyutDocument>')
+
+    return ''.join(xml)
+
+
+def convert(xmlString: str, internTable: InternTable) -> List[PyutClass]:
+
+    untanglePyut: UnTanglePyut = UnTanglePyut(xmlVersion=XmlVersion.V11, internTable=internTable)
+    pyutDocument = parse(xmlString).PyutDocument
+
+    return [untanglePyut.classToPyutClass(graphicClass=graphicClass) for graphicClass in pyutDocument.get_elements('OglClass')]
+
+
+def measure(xmlString: str, tableFactory: Callable[[], InternTable]) -> Tuple[int, int, float]:
+    """
+    Returns:  The bytes and blocks the Pyut classes hold and the conversion time
+    """
+    collect()
+    start()
+    startTime:   float           = perf_counter()
+    pyutClasses: List[PyutClass] = convert(xmlString=xmlString, internTable=tableFactory())
+    elapsed:     float           = perf_counter() - startTime
+    collect()
+
+    snapshot: Snapshot = take_snapshot()
+    stop()
+    del pyutClasses
+
+    statistics = snapshot.statistics('filename')
+
+    return sum(statistic.size for statistic in statistics), sum(statistic.count for statistic in statistics), elapsed
+
+
+xmlString: str = classDiagram()
+
+freshBytes,    freshBlocks,    freshTime    = measure(xmlString=xmlString, tableFactory=FreshValues)
+internedBytes, internedBlocks, internedTime = measure(xmlString=xmlString, tableFactory=InternTable)
+
+print(f'{CLASS_COUNT} classes with {MEMBER_COUNT} methods and fields each')
+print(f'Fresh values: {freshBytes / 1024 / 1024:7.2f} MiB in {freshBlocks:8} blocks  {freshTime:6.2f}s')
+print(f'Interned:     {internedBytes / 1024 / 1024:7.2f} MiB in {internedBlocks:8} blocks  {internedTime:6.2f}s')
+print(f'Saved:        {(freshBytes - internedBytes) / freshBytes:7.1%} of the bytes  {(freshBlocks - internedBlocks) / freshBlocks:.1%} of the blocks')
@@ -0,0 +1,117 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.GeometryQueries import DiagramBounds
+from untanglepyut.GeometryQueries import GeometryQueries
+from untanglepyut.GeometryTable import GeometryTable
+from untanglepyut.GeometryTable import ShapeKind
+
+from untanglepyut.ModelTypes import DocumentTitle
+from untanglepyut.ModelUnTangler import ModelUnTangler
+
+from tests.ProjectTestBase import ProjectTestBase
+
+#
+#   10 ---- 50                  200 ---- 260
+#   | 1  30-|-- 70              |  4      |
+#   |    |  | 2 |               200 ---- 260
+#   10 --|--50  |
+#        30 --- 70   80 - 90
+#                    | 3  |
+#                    80 - 90
+#
+RECTANGLES = [
+    (10,  10,  40, 40),
+    (30,  30,  40, 40),
+    (80,  80,  10, 10),
+    (200, 200, 60, 60),
+]
+
+
+class TestGeometryQueries(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        geometryTable: GeometryTable = GeometryTable.fromColumns(ids=[1, 2, 3, 4], kinds=[ShapeKind.CLASS] * 4, rectangles=RECTANGLES)
+
+        self._geometryQueries: GeometryQueries = GeometryQueries(geometryTable=geometryTable)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testBounds(self):
+        self.assertEqual(DiagramBounds(left=10, top=10, right=260, bottom=260), self._geometryQueries.bounds())
+
+    def testEmptyDiagram(self):
+        geometryQueries: GeometryQueries = GeometryQueries(geometryTable=GeometryTable.fromColumns(ids=[], kinds=[], rectangles=[]))
+
+        self.assertIsNone(geometryQueries.bounds(),                'No bounds for nothing')
+        self.assertIsNone(geometryQueries.nearestShape(x=0, y=0),  'Nothing is near')
+        self.assertEqual((0, 2), geometryQueries.overlappingShapes().shape, 'Still a table of pairs')
+
+    def testShapesInRectangle(self):
+        self.assertEqual([1, 2, 3], self._geometryQueries.shapesInRectangle(left=0, top=0, right=85, bottom=85).tolist(), 'Partly inside counts')
+        self.assertEqual([1],       self._geometryQueries.shapesInRectangle(left=0, top=0, right=60, bottom=60, contained=True).tolist(), 'Only fully inside')
+        self.assertEqual([],        self._geometryQueries.shapesInRectangle(left=100, top=0, right=190, bottom=190).tolist(), 'Empty viewport')
+
+    def testTouchingIsNotInside(self):
+        self.assertEqual([], self._geometryQueries.shapesInRectangle(left=260, top=260, right=300, bottom=300).tolist(), 'The right and bottom edges are exclusive')
+
+    def testOverlappingShapes(self):
+        self.assertEqual([[1, 2]], self._geometryQueries.overlappingShapes().tolist(), 'Only the first two overlap')
+
+    def testTouchingShapesDoNotOverlap(self):
+        geometryTable:   GeometryTable   = GeometryTable.fromColumns(ids=[1, 2], kinds=[ShapeKind.NOTE] * 2, rectangles=[(0, 0, 10, 10), (10, 0, 10, 10)])
+        geometryQueries: GeometryQueries = GeometryQueries(geometryTable=geometryTable)
+
+        self.assertEqual(0, len(geometryQueries.overlappingShapes()), 'Shared edges are not overlaps')
+
+    def testOverlapsMatchAllPairs(self):
+        rectangles = [((index * 37) % 500, (index * 91) % 500, 20 + index % 60, 20 + (index * 7) % 50) for index in range(300)]
+
+        geometryTable:   GeometryTable   = GeometryTable.fromColumns(ids=list(range(300)), kinds=[ShapeKind.CLASS] * 300, rectangles=rectangles)
+        geometryQueries: GeometryQueries = GeometryQueries(geometryTable=geometryTable)
+
+        expected = set()
+        for first, (x1, y1, w1, h1) in enumerate(rectangles):
+            for second in range(first + 1, len(rectangles)):
+                x2, y2, w2, h2 = rectangles[second]
+                if x1 < x2 + w2 and x2 < x1 + w1 and y1 < y2 + h2 and y2 < y1 + h1:
+                    expected.add((first, second))
+
+        actual = {tuple(sorted(pair)) for pair in geometryQueries.overlappingShapes().tolist()}
+
+        self.assertEqual(expected, actual, 'The sweep should find every overlapping pair and nothing else')
+
+    def testNearestShape(self):
+        self.assertEqual(3, self._geometryQueries.nearestShape(x=100, y=100), 'Closest edge wins')
+        self.assertEqual(2, self._geometryQueries.nearestShape(x=60,  y=60),  'Inside is distance zero')
+        self.assertEqual(1, self._geometryQueries.nearestShape(x=40,  y=40),  'Document order breaks ties')
+
+    def testFromModelDocument(self):
+        fqFileName:     str            = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='ATM-Model.xml')
+        modelUnTangler: ModelUnTangler = ModelUnTangler(geometryTable=True)
+
+        modelUnTangler.untangleFile(fqFileName=fqFileName)
+
+        geometryQueries: GeometryQueries = GeometryQueries.fromDocument(modelUnTangler.documents[DocumentTitle('Class Diagram')])
+
+        self.assertEqual(DiagramBounds(left=125, top=125, right=829, bottom=671), geometryQueries.bounds())
+        self.assertEqual(3, geometryQueries.nearestShape(x=0, y=0), 'Customer is top left')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestGeometryQueries))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
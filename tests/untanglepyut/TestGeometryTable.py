@@ -0,0 +1,122 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.GeometryTable import GeometryTable
+from untanglepyut.GeometryTable import ShapeKind
+
+from untanglepyut.ModelTypes import DocumentTitle
+from untanglepyut.ModelTypes import ModelDocument
+from untanglepyut.ModelUnTangler import ModelUnTangler
+
+from untanglepyut.UnTangler import UnTangler
+
+from untanglepyut.XmlBackend import XmlBackendType
+from untanglepyut.XmlVersion import XmlVersion
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestGeometryTable(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testNotBuiltByDefault(self):
+        fqFileName:     str            = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='ATM-Model.xml')
+        modelUnTangler: ModelUnTangler = ModelUnTangler()
+
+        modelUnTangler.untangleFile(fqFileName=fqFileName)
+
+        self.assertIsNone(modelUnTangler.documents[DocumentTitle('Class Diagram')].geometryTable, 'Only built on request')
+
+    def testClassGeometry(self):
+        geometryTable: GeometryTable = self._geometryTable(fileName='ATM-Model.xml', documentTitle='Class Diagram')
+
+        self.assertEqual(6, geometryTable.shapeCount, 'Incorrect number of shapes')
+        self.assertEqual([1, 2, 3, 4, 5, 6], geometryTable.ids.tolist(), 'Ids should be in document order')
+        self.assertTrue((geometryTable.kinds == ShapeKind.CLASS).all(), 'Only classes in this diagram')
+
+        self.assertEqual([400, 125, 148, 94], [geometryTable.x[0], geometryTable.y[0], geometryTable.width[0], geometryTable.height[0]], 'Bank is misplaced')
+        self.assertEqual([625, 300, 204, 106], [geometryTable.x[1], geometryTable.y[1], geometryTable.width[1], geometryTable.height[1]], 'ATM is misplaced')
+
+    def testLinkPaths(self):
+        geometryTable: GeometryTable = self._geometryTable(fileName='ATM-Model.xml', documentTitle='Class Diagram')
+
+        self.assertEqual(7, geometryTable.linkCount, 'Incorrect number of links')
+        self.assertEqual(geometryTable.linkCount + 1, len(geometryTable.linkPointOffsets), 'One offset per link plus the end')
+        self.assertEqual(len(geometryTable.linkPoints), geometryTable.linkPointOffsets[-1], 'The offsets should cover every point')
+
+        self.assertEqual(1, geometryTable.linkSourceIds[0],      'Incorrect source')
+        self.assertEqual(2, geometryTable.linkDestinationIds[0], 'Incorrect destination')
+        self.assertEqual([[547, 172], [722, 173], [723, 300]], geometryTable.linkPath(0).tolist(), 'Anchors and control point out of order')
+
+    def testUseCaseGeometry(self):
+        geometryTable: GeometryTable = self._geometryTable(fileName='UseCaseDiagram.xml', documentTitle='Use-Cases')
+
+        self.assertEqual([ShapeKind.ACTOR, ShapeKind.USE_CASE], geometryTable.kinds.tolist(), 'Incorrect kinds')
+        self.assertEqual([293, 575], geometryTable.x.tolist(), 'Incorrect x')
+        self.assertEqual(1, geometryTable.linkCount, 'Incorrect number of links')
+
+    def testBackendsAgree(self):
+        expected: GeometryTable = self._geometryTable(fileName='ATM-Model.xml', documentTitle='Class Diagram')
+        for backendType in XmlBackendType.availableBackends():
+            geometryTable: GeometryTable = self._geometryTable(fileName='ATM-Model.xml', documentTitle='Class Diagram', backendType=backendType)
+
+            self.assertEqual(expected.x.tolist(),          geometryTable.x.tolist(),          f'{backendType} differs')
+            self.assertEqual(expected.linkPoints.tolist(), geometryTable.linkPoints.tolist(), f'{backendType} differs')
+
+    def testUnTanglerAgrees(self):
+        for fileName, documentTitle in [('ATM-Model.xml', 'Class Diagram'), ('UseCaseDiagram.xml', 'Use-Cases')]:
+            expected: GeometryTable = self._geometryTable(fileName=fileName, documentTitle=documentTitle)
+
+            fqFileName: str       = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=fileName)
+            untangler:  UnTangler = UnTangler(xmlVersion=XmlVersion.V10, geometryTable=True)
+
+            untangler.untangleFile(fqFileName=fqFileName)
+
+            geometryTable: GeometryTable = untangler.documents[DocumentTitle(documentTitle)].geometryTable
+
+            self.assertEqual(expected.ids.tolist(),              geometryTable.ids.tolist(),              f'{fileName}: ids differ')
+            self.assertEqual(expected.kinds.tolist(),            geometryTable.kinds.tolist(),            f'{fileName}: kinds differ')
+            self.assertEqual(expected.x.tolist(),                geometryTable.x.tolist(),                f'{fileName}: x differs')
+            self.assertEqual(expected.height.tolist(),           geometryTable.height.tolist(),           f'{fileName}: height differs')
+            self.assertEqual(expected.linkSourceIds.tolist(),    geometryTable.linkSourceIds.tolist(),    f'{fileName}: link sources differ')
+            self.assertEqual(expected.linkPointOffsets.tolist(), geometryTable.linkPointOffsets.tolist(), f'{fileName}: link offsets differ')
+            self.assertEqual(expected.linkPoints.tolist(),       geometryTable.linkPoints.tolist(),       f'{fileName}: link points differ')
+
+    def testEmptyDiagram(self):
+        geometryTable: GeometryTable = self._geometryTable(fileName='EmptyDiagram.xml', documentTitle='EmptyDiagram')
+
+        self.assertEqual(0, geometryTable.shapeCount, 'Nothing to see here')
+        self.assertEqual(0, geometryTable.linkCount,  'Nothing to see here')
+        self.assertEqual((0, 2), geometryTable.linkPoints.shape, 'Still a table of points')
+
+    def _geometryTable(self, fileName: str, documentTitle: str, backendType: XmlBackendType = XmlBackendType.UNTANGLE) -> GeometryTable:
+
+        fqFileName:     str            = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=fileName)
+        modelUnTangler: ModelUnTangler = ModelUnTangler(backendType=backendType, geometryTable=True)
+
+        modelUnTangler.untangleFile(fqFileName=fqFileName)
+
+        modelDocument: ModelDocument = modelUnTangler.documents[DocumentTitle(documentTitle)]
+
+        return modelDocument.geometryTable
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestGeometryTable))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,110 @@
+
+from typing import List
+
+from pickle import dumps
+from pickle import loads
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untangle import Element
+
+from untanglepyut.GraphicRecords import GraphicInformation
+from untanglepyut.GraphicRecords import GraphicLinkAttributes
+from untanglepyut.GraphicRecords import LinkRecord
+from untanglepyut.GraphicRecords import LollipopRecord
+from untanglepyut.GraphicRecords import PointRecord
+from untanglepyut.GraphicRecords import PyutLinkRecord
+from untanglepyut.GraphicRecords import SDMessageRecord
+from untanglepyut.XmlSchema import XmlSchema
+from untanglepyut.XmlVersion import XmlVersion
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestGraphicRecords(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testV10LinkRecord(self):
+
+        graphicLink: Element = Element('GraphicLink', {'srcX': '1', 'srcY': '2', 'dstX': '3', 'dstY': '4', 'spline': 'False'})
+        graphicLink.add_child(Element('LabelCenter', {'x': '5', 'y': '6'}))
+        graphicLink.add_child(Element('ControlPoint', {'x': '7', 'y': '8'}))
+        graphicLink.add_child(Element('ControlPoint', {'x': '9', 'y': '10'}))
+        graphicLink.add_child(Element('Link', {'name': 'uses', 'type': 'ASSOCIATION', 'cardSrc': '1', 'cardDestination': '*',
+                                               'bidir': 'True', 'sourceId': '11', 'destId': '12'}))
+
+        linkRecord: LinkRecord = LinkRecord.fromGraphicLink(schema=XmlSchema.forVersion(XmlVersion.V10), graphicLink=graphicLink)
+
+        expectedPyutLinkRecord: PyutLinkRecord = PyutLinkRecord(sourceId=11, destinationId=12, linkType='ASSOCIATION', name='uses',
+                                                                cardinalitySource='1', cardinalityDestination='*', bidirectional=True)
+        self.assertEqual(expectedPyutLinkRecord, linkRecord.pyutLinkRecord, 'Mismatched model attributes')
+        self.assertEqual((1, 2, 3, 4), (linkRecord.srcX, linkRecord.srcY, linkRecord.dstX, linkRecord.dstY), 'Mismatched anchors')
+        self.assertEqual((PointRecord(x=7, y=8), PointRecord(x=9, y=10)), linkRecord.controlPoints, 'Control points out of order')
+        self.assertEqual(PointRecord(x=5, y=6), linkRecord.centerLabel, 'Mismatched center label')
+        self.assertIsNone(linkRecord.sourceLabel, 'A missing label is None')
+
+    def testGraphicLinkAttributesFromXmlVersion(self):
+
+        graphicLink: Element = Element('OglLink', {'sourceAnchorX': '1', 'sourceAnchorY': '2', 'destinationAnchorX': '3', 'destinationAnchorY': '4', 'spline': 'True'})
+
+        expected: GraphicLinkAttributes = GraphicLinkAttributes.fromGraphicLink(schema=XmlSchema.forVersion(XmlVersion.V11), graphicLink=graphicLink)
+        actual:   GraphicLinkAttributes = GraphicLinkAttributes.fromGraphicLink(xmlVersion=XmlVersion.V11, graphicLink=graphicLink)
+
+        self.assertEqual(expected, actual, 'The deprecated keyword should resolve to the same schema')
+        self.assertEqual((1, 2, 3, 4, True), (actual.srcX, actual.srcY, actual.dstX, actual.dstY, actual.spline), 'Mismatched attributes')
+
+    def testV11PyutLinkRecord(self):
+
+        linkElement: Element = Element('PyutLink', {'name': 'organizes', 'type': 'COMPOSITION', 'cardinalitySource': '1', 'cardinalityDestination': '*',
+                                                    'bidirectional': 'False', 'sourceId': '1', 'destinationId': '2'})
+
+        pyutLinkRecord: PyutLinkRecord = PyutLinkRecord.fromLinkElement(schema=XmlSchema.forVersion(XmlVersion.V11), linkElement=linkElement)
+
+        self.assertEqual((1, 2), (pyutLinkRecord.sourceId, pyutLinkRecord.destinationId), 'Mismatched ids')
+        self.assertEqual('COMPOSITION', pyutLinkRecord.linkType, 'Mismatched link type')
+
+    def testSDMessageRecord(self):
+
+        graphicSDMessage: Element = Element('GraphicSDMessage', {})
+        graphicSDMessage.add_child(Element('SDMessage', {'id': '3', 'message': 'doIt()', 'srcTime': '142', 'dstTime': '150', 'srcID': '1', 'dstID': '2'}))
+
+        sdMessageRecord: SDMessageRecord = SDMessageRecord.fromSDMessage(schema=XmlSchema.forVersion(XmlVersion.V10), sdMessageElement=graphicSDMessage)
+
+        self.assertEqual(SDMessageRecord(id=3, message='doIt()', sourceId=1, destinationId=2, sourceTime=142, destinationTime=150), sdMessageRecord)
+
+    def testRecordsAreCompact(self):
+
+        graphicInformation: GraphicInformation = GraphicInformation(x=1, y=2, width=3, height=4)
+
+        self.assertFalse(hasattr(graphicInformation, '__dict__'), 'Should use __slots__')
+        self.assertFalse(hasattr(PointRecord(x=1, y=2), '__dict__'), 'Should be tuple backed')
+
+    def testRecordsPickle(self):
+
+        records: List = [
+            GraphicInformation(x=1, y=2, width=3, height=4),
+            LollipopRecord(x=1, y=2, attachmentPoint='EAST'),
+            SDMessageRecord(id=3, message='doIt()', sourceId=1, destinationId=2, sourceTime=142, destinationTime=150),
+        ]
+        self.assertEqual(records, loads(dumps(records)), 'Records should survive a round trip')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestGraphicRecords))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,88 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutmodelv2.PyutType import PyutType
+
+from pyutmodelv2.enumerations.PyutDisplayMethods import PyutDisplayMethods
+from pyutmodelv2.enumerations.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodelv2.enumerations.PyutLinkType import PyutLinkType
+from pyutmodelv2.enumerations.PyutStereotype import PyutStereotype
+from pyutmodelv2.enumerations.PyutVisibility import PyutVisibility
+
+from untanglepyut.InternTable import InternTable
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestInternTable(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSharedPyutType(self):
+        internTable: InternTable = InternTable()
+
+        pyutType: PyutType = internTable.pyutType(''.join(['Li', 'st[str]']))
+
+        self.assertIs(pyutType, internTable.pyutType('List[str]'), 'Equal type names share one PyutType')
+        self.assertEqual(PyutType('List[str]'), pyutType, 'Still an ordinary PyutType')
+        self.assertEqual(1, len(internTable), 'Only one type kept')
+
+    def testSharedModifier(self):
+        internTable: InternTable = InternTable()
+
+        self.assertIs(internTable.pyutModifier('static'), internTable.pyutModifier(''.join(['sta', 'tic'])), 'Equal modifiers share one object')
+
+    def testInternedStrings(self):
+        internTable: InternTable = InternTable()
+
+        first:  str = internTable.string(''.join(['fileName', '.py']))
+        second: str = internTable.string(''.join(['file', 'Name.py']))
+
+        self.assertIs(first, second, 'Equal strings are one object')
+        self.assertIsNone(internTable.string(None), 'Missing attributes stay missing')     # type: ignore
+
+    def testEnumerations(self):
+        internTable: InternTable = InternTable()
+
+        self.assertEqual(PyutVisibility.PRIVATE,                 internTable.visibility('PRIVATE'),               'Visibility')
+        self.assertEqual(PyutVisibility.PRIVATE,                 internTable.visibility('PRIVATE'),               'Cached visibility')
+        self.assertEqual(PyutStereotype.NO_STEREOTYPE,           internTable.stereotype(None),                    'Stereotype')     # type: ignore
+        self.assertEqual(PyutLinkType.INHERITANCE,               internTable.linkType('INHERITANCE'),             'Link type')
+        self.assertEqual(PyutDisplayParameters.WITH_PARAMETERS,  internTable.displayParameters('DisplayParameters'), 'Display parameters')
+        self.assertEqual(PyutDisplayMethods.UNSPECIFIED,         internTable.displayMethods(None),                'Old files')       # type: ignore
+
+    def testRejectedValuesNotCached(self):
+        internTable: InternTable = InternTable()
+
+        for attempt in range(2):
+            with self.assertRaises(AssertionError, msg=f'Attempt {attempt} should still be rejected'):
+                internTable.visibility('friendly')
+
+    def testClear(self):
+        internTable: InternTable = InternTable()
+
+        pyutType: PyutType = internTable.pyutType('int')
+        internTable.clear()
+
+        self.assertEqual(0, len(internTable), 'Empty')
+        self.assertIsNot(pyutType, internTable.pyutType('int'), 'A new load gets new values')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestInternTable))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
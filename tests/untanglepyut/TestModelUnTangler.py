@@ -0,0 +1,157 @@
+
+from typing import Dict
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from subprocess import run
+from sys import executable
+
+from pyutmodelv2.PyutClass import PyutClass
+from pyutmodelv2.PyutSDInstance import PyutSDInstance
+
+from tests.ProjectTestBase import DIAGRAM_NAME_1
+from tests.ProjectTestBase import DIAGRAM_NAME_2
+from tests.ProjectTestBase import TEST_XML_FILENAME
+
+from untanglepyut.ModelTypes import DocumentTitle
+from untanglepyut.ModelTypes import ModelDocument
+from untanglepyut.ModelUnTangler import ModelUnTangler
+from untanglepyut.XmlVersion import XmlVersion
+
+from tests.ProjectTestBase import ProjectTestBase
+
+DUPLICATE_CLASS_NAMES_XML: str = """<?xml version="1.0" encoding="iso-8859-1"?>
+<PyutProject version="10" CodePath="">
+    <PyutDocument type="CLASS_DIAGRAM" title="Duplicates" scrollPositionX="0" scrollPositionY="0" pixelsPerUnitX="20" pixelsPerUnitY="20">
+        <GraphicClass width="100" height="50" x="0" y="0">
+            <Class id="1" name="Twin" filename="" description="" showMethods="True" showFields="True" showStereotype="True" displayParameters="Unspecified"/>
+        </GraphicClass>
+        <GraphicClass width="100" height="50" x="200" y="0">
+            <Class id="2" name="Single" filename="" description="" showMethods="True" showFields="True" showStereotype="True" displayParameters="Unspecified"/>
+        </GraphicClass>
+        <GraphicClass width="100" height="50" x="400" y="0">
+            <Class id="3" name="Twin" filename="" description="" showMethods="True" showFields="True" showStereotype="True" displayParameters="Unspecified"/>
+        </GraphicClass>
+    </PyutDocument>
+</PyutProject>
+"""
+
+
+class TestModelUnTangler(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testOglNeverImported(self):
+        script: str = (
+            'import sys\n'
+            'from untanglepyut.ModelUnTangler import ModelUnTangler\n'
+            "assert not [name for name in sys.modules if name.split('.')[0] in ('ogl', 'miniogl', 'wx')]\n"
+        )
+        completedProcess = run([executable, '-c', script], capture_output=True, text=True)
+
+        self.assertEqual(0, completedProcess.returncode, completedProcess.stderr)
+
+    def testCreateDocuments(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME)
+
+        self.assertEqual(2, len(modelUnTangler.documents), 'Incorrect number of documents created')
+        self.assertEqual(4, len(modelUnTangler.documents[DIAGRAM_NAME_1].pyutClasses), 'Incorrect number of classes created')
+        self.assertEqual(7, len(modelUnTangler.documents[DIAGRAM_NAME_2].pyutClasses), 'Incorrect number of classes created')
+        self.assertEqual('10', modelUnTangler.projectInformation.version)
+
+    def testDetectXmlVersion(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='MultiLineNote.xml')
+
+        self.assertEqual(XmlVersion.V10, modelUnTangler.xmlVersion, 'An empty version is V10')
+
+    def testInheritanceResolved(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='SimpleInheritance.xml')
+
+        modelDocument: ModelDocument        = modelUnTangler.documents[DocumentTitle('Simple')]
+        pyutClasses:   Dict[str, PyutClass] = {pyutClass.name: pyutClass for pyutClass in modelDocument.pyutClasses}
+
+        self.assertEqual(1, len(modelDocument.pyutLinks), 'Should have the inheritance link')
+        self.assertIs(pyutClasses['BaseClass'], pyutClasses['SubClass'].parents[0], 'Parent not resolved by id')
+
+    def testClassesByName(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='SimpleInheritance.xml')
+
+        modelDocument: ModelDocument = modelUnTangler.documents[DocumentTitle('Simple')]
+
+        self.assertEqual(['BaseClass', 'SubClass'], sorted(modelDocument.pyutClassesByName.keys()), 'Every class should be indexed')
+        self.assertIs(modelDocument.pyutClasses[0], modelDocument.pyutClassesByName[modelDocument.pyutClasses[0].name][0], 'Index the same objects')
+
+    def testDuplicateClassNames(self):
+        modelUnTangler: ModelUnTangler = ModelUnTangler()
+
+        modelUnTangler.untangleXml(xmlString=DUPLICATE_CLASS_NAMES_XML, fqFileName='DuplicateClassNames.xml')
+
+        modelDocument: ModelDocument = modelUnTangler.documents[DocumentTitle('Duplicates')]
+        duplicates:    List[int]     = [pyutClass.id for pyutClass in modelDocument.pyutClassesByName['Twin']]
+
+        self.assertEqual([1, 3], duplicates, 'Duplicates are kept in document order')
+        self.assertEqual(2, modelDocument.pyutClassesByName['Single'][0].id)
+
+    def testProjectSymbolTable(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME)
+
+        self.assertEqual([DIAGRAM_NAME_2], modelUnTangler.symbolTable.documentsContaining('Car'), 'Car is only in the second diagram')
+        for symbol in modelUnTangler.symbolTable.byName('Car'):
+            self.assertIn(symbol.symbol, modelUnTangler.documents[symbol.documentTitle].pyutClasses, 'The table holds the untangled objects')
+
+    def testSymbolTableReplacesDocuments(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME)
+        symbolCount:    int            = len(modelUnTangler.symbolTable)
+
+        modelUnTangler.untangleFile(fqFileName=ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME))
+
+        self.assertEqual(symbolCount, len(modelUnTangler.symbolTable), 'Re-untangled documents replace their symbols')
+
+    def testSequenceMessagesResolved(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='SequenceDiagram.xml')
+
+        modelDocument: ModelDocument = modelUnTangler.documents[DocumentTitle('Sequence Diagram')]
+
+        self.assertEqual(2, len(modelDocument.pyutSDInstances), 'Incorrect number of instances')
+        for pyutSDMessage in modelDocument.pyutSDMessages.values():
+            self.assertIsInstance(pyutSDMessage.source,      PyutSDInstance, 'Source not resolved')
+            self.assertIsInstance(pyutSDMessage.destination, PyutSDInstance, 'Destination not resolved')
+
+    def testUseCaseDiagram(self):
+        modelUnTangler: ModelUnTangler = self._untangle(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='UseCaseDiagram.xml')
+
+        modelDocument: ModelDocument = modelUnTangler.documents[DocumentTitle('Use-Cases')]
+
+        self.assertEqual(1, len(modelDocument.pyutActors),   'Incorrect number of actors')
+        self.assertEqual(1, len(modelDocument.pyutUseCases), 'Incorrect number of use cases')
+        self.assertEqual(1, len(modelDocument.pyutLinks),    'Incorrect number of links')
+
+    def _untangle(self, package: str, fileName: str) -> ModelUnTangler:
+
+        fqFileName:     str            = ProjectTestBase.getFullyQualifiedResourceFileName(package=package, fileName=fileName)
+        modelUnTangler: ModelUnTangler = ModelUnTangler()
+
+        modelUnTangler.untangleFile(fqFileName=fqFileName)
+
+        return modelUnTangler
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestModelUnTangler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
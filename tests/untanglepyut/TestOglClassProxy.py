@@ -0,0 +1,129 @@
+
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untangle import Element
+from untangle import parse
+
+from pyutmodelv2.PyutClass import PyutClass
+
+from ogl.OglClass import OglClass
+
+from untanglepyut.OglClassProxy import OglClassProxy
+
+from untanglepyut.Types import OglClassesByName
+from untanglepyut.Types import UntangledOglClasses
+
+from untanglepyut.XmlVersion import XmlVersion
+
+from untanglepyut.UnTangleOglClasses import UnTangleOglClasses
+
+from tests.ProjectTestBase import ProjectTestBase
+
+V10_TWO_CLASS_DOCUMENT: str = """
+<PyutDocument type="CLASS_DIAGRAM" title="UnitTest" scrollPositionX="100" scrollPositionY="100" pixelsPerUnitX="1" pixelsPerUnitY="1">
+    <GraphicClass width="120" height="140" x="175" y="100">
+        <Class id="1" name="ClassName0" filename="" description="" showMethods="True" showFields="True" showStereotype="True" displayParameters="Unspecified">
+            <Method name="OzzeeElGatoDiablo" visibility="PUBLIC">
+                <Return type="str"/>
+                <SourceCode>
+                    <Code>weLeft: bool = True</Code>
+                </SourceCode>
+            </Method>
+        </Class>
+    </GraphicClass>
+    <GraphicClass width="80" height="60" x="400" y="300">
+        <Class id="2" name="ClassName1" filename="" description="" showMethods="True" showFields="True" showStereotype="True" displayParameters="Unspecified">
+        </Class>
+    </GraphicClass>
+</PyutDocument>
+"""
+
+
+class TestOglClassProxy(ProjectTestBase):
+    """
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        root:          Element = parse(V10_TWO_CLASS_DOCUMENT)
+        classDocument: Element = root.PyutDocument
+
+        unTangleOglClasses: UnTangleOglClasses = UnTangleOglClasses(xmlVersion=XmlVersion.V10, deferred=True)
+
+        self._oglClasses:       UntangledOglClasses = unTangleOglClasses.unTangle(pyutDocument=classDocument)
+        self._oglClassesByName: OglClassesByName    = unTangleOglClasses.oglClassesByName
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testProxiesReturned(self):
+        self.assertEqual(2, len(self._oglClasses), 'One per class')
+        for oglClass in self._oglClasses:
+            self.assertIsInstance(oglClass, OglClassProxy, 'Deferred mode returns proxies')
+
+    def testNothingBuiltUntilUsed(self):
+        for oglClass in self._oglClasses:
+            proxy: OglClassProxy = cast(OglClassProxy, oglClass)
+            self.assertFalse(proxy.isMaterialized(), 'Untangling should not build the OglClass')
+
+    def testCheapAttributes(self):
+        proxy: OglClassProxy = cast(OglClassProxy, self._oglClasses[1])
+
+        self.assertEqual(2,           proxy.pyutId, 'Incorrect id')
+        self.assertEqual('ClassName1', proxy.name,  'Incorrect name')
+        self.assertEqual(400, proxy.graphicInformation.x,      'Incorrect x')
+        self.assertEqual(300, proxy.graphicInformation.y,      'Incorrect y')
+        self.assertEqual(80,  proxy.graphicInformation.width,  'Incorrect width')
+        self.assertEqual(60,  proxy.graphicInformation.height, 'Incorrect height')
+
+        self.assertTrue(proxy.inside(x=410, y=310),  'Point is on the class')
+        self.assertFalse(proxy.inside(x=10, y=310),  'Point is off the class')
+        self.assertFalse(proxy.isMaterialized(), 'Reading the cheap attributes should not build the OglClass')
+
+    def testNameIndexHoldsProxies(self):
+        self.assertIs(self._oglClasses[1], self._oglClassesByName['ClassName1'][0], 'Index the proxies themselves')
+        self.assertFalse(cast(OglClassProxy, self._oglClasses[1]).isMaterialized(), 'Indexing by name should not build the OglClass')
+
+    def testPyutClassWithoutOglClass(self):
+        proxy: OglClassProxy = cast(OglClassProxy, self._oglClasses[0])
+
+        pyutClass: PyutClass = proxy.pyutClass
+
+        self.assertEqual('ClassName0', pyutClass.name, 'Incorrect name')
+        self.assertEqual(1, len(pyutClass.methods), 'Method not untangled')
+        self.assertFalse(proxy.isMaterialized(), 'The model does not need the shape')
+
+    def testMaterializeOnFirstUse(self):
+        proxy: OglClassProxy = cast(OglClassProxy, self._oglClasses[0])
+
+        width, height = proxy.GetSize()
+
+        self.assertTrue(proxy.isMaterialized(), 'Shape behaviour should build the OglClass')
+        self.assertEqual(120, width,  'Incorrect width')
+        self.assertEqual(140, height, 'Incorrect height')
+
+        oglClass: OglClass = proxy.oglClass
+        self.assertIs(proxy.oglClass, oglClass,            'Only build once')
+        self.assertIs(proxy.pyutClass, oglClass.pyutObject, 'The shape should use the same model')
+        self.assertFalse(cast(OglClassProxy, self._oglClasses[1]).isMaterialized(), 'Only build what was used')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestOglClassProxy))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
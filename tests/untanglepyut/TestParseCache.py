@@ -0,0 +1,157 @@
+
+from typing import List
+
+from os import listdir
+from os import utime
+
+from os.path import join as osPathJoin
+
+from shutil import copyfile
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.ParseCache import ENTRY_SUFFIX
+from untanglepyut.ParseCache import ParseCache
+
+from untanglepyut.ProjectCache import CachedProject
+
+from untanglepyut.XmlBackend import XmlBackendType
+from untanglepyut.XmlBackend import XmlElement
+
+from tests.ProjectTestBase import ProjectTestBase
+from tests.ProjectTestBase import TEST_XML_FILENAME
+
+
+class TestParseCache(ProjectTestBase):
+    """
+    Each test works on a copy of the project so it can change the file underneath the cache
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._temporaryDirectory: TemporaryDirectory = TemporaryDirectory()
+
+        self._cacheDirectory: str = osPathJoin(self._temporaryDirectory.name, 'cache')
+        self._fqFileName:     str = osPathJoin(self._temporaryDirectory.name, TEST_XML_FILENAME)
+
+        copyfile(ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME), self._fqFileName)
+
+    def tearDown(self):
+        super().tearDown()
+        self._temporaryDirectory.cleanup()
+
+    def testColdProcessHit(self):
+        ParseCache(cacheDirectory=self._cacheDirectory).load(fqFileName=self._fqFileName)
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=self._cacheDirectory)
+        parseCache.load(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, parseCache.hits,   'A new cache on the same directory should find the entry')
+        self.assertEqual(0, parseCache.misses, 'No parse')
+
+    def testSameDocumentsAsTheParser(self):
+        cachedProject:  CachedProject     = ParseCache(cacheDirectory=self._cacheDirectory).load(fqFileName=self._fqFileName)
+        parsedDocuments: List[XmlElement] = self._parseDocuments()
+
+        self.assertEqual('10', cachedProject.pyutProject['version'], 'Project header')
+        self.assertEqual(len(parsedDocuments), len(cachedProject.pyutDocuments), 'Document count')
+        for cachedDocument, parsedDocument in zip(cachedProject.pyutDocuments, parsedDocuments):
+            self.assertEqual(parsedDocument['title'], cachedDocument['title'], 'Document order')
+            self._assertSameTree(parsedDocument, cachedDocument)
+
+    def testModifiedFileIsParsedAgain(self):
+        ParseCache(cacheDirectory=self._cacheDirectory).load(fqFileName=self._fqFileName)
+        utime(self._fqFileName, ns=(0, 1_000_000_000))
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=self._cacheDirectory)
+        parseCache.load(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, parseCache.misses, 'A different modification time is a different file')
+
+    def testVerifyContent(self):
+        ParseCache(cacheDirectory=self._cacheDirectory, verifyContent=True).load(fqFileName=self._fqFileName)
+        #
+        # Same size and modification time, different bytes
+        #
+        with open(self._fqFileName, 'rb') as xmlFile:
+            rawXml: bytes = xmlFile.read()
+        with open(self._fqFileName, 'wb') as xmlFile:
+            xmlFile.write(rawXml.replace(b'Diagram-1', b'Diagram-9'))
+        utime(self._fqFileName, ns=(0, 1_000_000_000))
+        ParseCache(cacheDirectory=self._cacheDirectory, verifyContent=True).load(fqFileName=self._fqFileName)
+        with open(self._fqFileName, 'wb') as xmlFile:
+            xmlFile.write(rawXml)
+        utime(self._fqFileName, ns=(0, 1_000_000_000))
+
+        parseCache:    ParseCache    = ParseCache(cacheDirectory=self._cacheDirectory, verifyContent=True)
+        cachedProject: CachedProject = parseCache.load(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, parseCache.misses, 'The content hash should catch the change')
+        self.assertEqual('Diagram-1', cachedProject.pyutDocuments[0]['title'], 'Should be the current content')
+
+    def testDamagedEntryIgnored(self):
+        ParseCache(cacheDirectory=self._cacheDirectory).load(fqFileName=self._fqFileName)
+        for entryName in self._entryNames():
+            with open(osPathJoin(self._cacheDirectory, entryName), 'wb') as entryFile:
+                entryFile.write(b'\x00 not marshal data')
+
+        parseCache: ParseCache = ParseCache(cacheDirectory=self._cacheDirectory)
+        parseCache.load(fqFileName=self._fqFileName)
+        parseCache.load(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, parseCache.misses, 'Parsed again and rewritten')
+        self.assertEqual(1, parseCache.hits,   'The rewritten entry is good')
+
+    def testEvictOldest(self):
+        secondFileName: str = osPathJoin(self._temporaryDirectory.name, 'Second.xml')
+        copyfile(self._fqFileName, secondFileName)
+
+        ParseCache(cacheDirectory=self._cacheDirectory).load(fqFileName=self._fqFileName)
+        utime(osPathJoin(self._cacheDirectory, self._entryNames()[0]), ns=(0, 0))
+
+        ParseCache(cacheDirectory=self._cacheDirectory, maxBytes=1).load(fqFileName=secondFileName)
+
+        self.assertEqual([], self._entryNames(), 'Nothing fits in a byte')
+
+    def testClear(self):
+        parseCache: ParseCache = ParseCache(cacheDirectory=self._cacheDirectory)
+
+        parseCache.load(fqFileName=self._fqFileName)
+        parseCache.clear()
+
+        self.assertEqual([], self._entryNames(), 'Every entry removed')
+
+    def _entryNames(self) -> List[str]:
+        return [entryName for entryName in listdir(self._cacheDirectory) if entryName.endswith(ENTRY_SUFFIX)]
+
+    def _parseDocuments(self) -> List[XmlElement]:
+        with open(self._fqFileName, 'rb') as xmlFile:
+            return list(XmlBackendType.UNTANGLE.createDocumentStream().documents(xmlChunks=[xmlFile.read()]))
+
+    def _assertSameTree(self, expected: XmlElement, actual: XmlElement):
+
+        self.assertEqual(expected.cdata, actual.cdata, 'Character data')
+
+        expectedChildren: List[XmlElement] = expected.get_elements()
+        actualChildren:   List[XmlElement] = actual.get_elements()
+        self.assertEqual(len(expectedChildren), len(actualChildren), 'Child count')
+        for expectedChild, actualChild in zip(expectedChildren, actualChildren):
+            self.assertEqual(expectedChild['id'], actualChild['id'], 'Attributes')
+            self._assertSameTree(expectedChild, actualChild)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestParseCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,131 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.PackedElement import PackedElement
+from untanglepyut.PackedElement import PackedNode
+
+from untanglepyut.ProjectCache import CacheKey
+from untanglepyut.ProjectCache import CachedProject
+from untanglepyut.ProjectCache import ProjectCache
+
+from tests.ProjectTestBase import ProjectTestBase
+from tests.ProjectTestBase import TEST_XML_FILENAME
+
+
+class TestProjectCache(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSameBytesSameKey(self):
+        self.assertEqual(self._key(b'<PyutProject/>'), self._key(b'<PyutProject/>'), 'The key only depends on the content')
+
+    def testKeyDependsOnEncoding(self):
+        declaredKey: CacheKey = ProjectCache.contentKey(rawBytes=b'<PyutProject/>')
+        utf8Key:     CacheKey = ProjectCache.contentKey(rawBytes=b'<PyutProject/>', encoding='utf-8')
+
+        self.assertNotEqual(declaredKey, utf8Key, 'An encoding override can change the tree')
+
+    def testPackedProject(self):
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME)
+        with open(fqFileName, 'rb') as xmlFile:
+            xmlBytes: bytes = xmlFile.read()
+
+        cachedProject: CachedProject = CachedProject.fromXml(xmlBytes=xmlBytes)
+
+        self.assertEqual('10', cachedProject.pyutProject['version'], 'Project header')
+        self.assertEqual(['Diagram-1', 'Diagram-2'], [pyutDocument['title'] for pyutDocument in cachedProject.pyutDocuments], 'Documents in file order')
+
+        packedSize: int = PackedElement.packedSize(cachedProject.projectNode) + sum(PackedElement.packedSize(documentNode) for documentNode in cachedProject.documentNodes)
+        self.assertEqual(packedSize, cachedProject.byteSize, 'Charged with what the packed nodes take')
+
+    def testPackedSizeCountsTheSubtree(self):
+        leafNode:   PackedNode = ('Field', {'name': 'x'}, '', ())
+        parentNode: PackedNode = ('PyutClass', {'name': 'Car'}, '', (leafNode, ))
+
+        self.assertGreater(PackedElement.packedSize(parentNode), PackedElement.packedSize(leafNode), 'Children are counted')
+
+    def testHitAndMiss(self):
+        projectCache: ProjectCache = ProjectCache()
+
+        self.assertIsNone(projectCache.get(self._key(b'a')), 'Nothing cached yet')
+
+        cachedProject: CachedProject = self._cachedProject(byteSize=10)
+        projectCache.put(self._key(b'a'), cachedProject)
+
+        self.assertIs(cachedProject, projectCache.get(self._key(b'a')), 'Should be the cached parse')
+        self.assertEqual(1, projectCache.hits,   'Hit count')
+        self.assertEqual(1, projectCache.misses, 'Miss count')
+
+    def testEvictLeastRecentlyUsed(self):
+        projectCache: ProjectCache = ProjectCache(maxEntries=2)
+
+        projectCache.put(self._key(b'a'), self._cachedProject(byteSize=1))
+        projectCache.put(self._key(b'b'), self._cachedProject(byteSize=1))
+        projectCache.get(self._key(b'a'))
+        projectCache.put(self._key(b'c'), self._cachedProject(byteSize=1))
+
+        self.assertEqual(2, len(projectCache), 'Entry budget')
+        self.assertIsNotNone(projectCache.get(self._key(b'a')), 'Recently used')
+        self.assertIsNone(projectCache.get(self._key(b'b')),    'Least recently used')
+
+    def testByteBudget(self):
+        projectCache: ProjectCache = ProjectCache(maxBytes=100)
+
+        projectCache.put(self._key(b'a'), self._cachedProject(byteSize=60))
+        projectCache.put(self._key(b'b'), self._cachedProject(byteSize=60))
+
+        self.assertEqual(1,  len(projectCache),      'Only one fits')
+        self.assertEqual(60, projectCache.byteSize, 'Evicted bytes are given back')
+        self.assertIsNotNone(projectCache.get(self._key(b'b')), 'The newest one stays')
+
+    def testTooBigForTheBudget(self):
+        projectCache: ProjectCache = ProjectCache(maxBytes=100)
+
+        projectCache.put(self._key(b'a'), self._cachedProject(byteSize=10))
+        projectCache.put(self._key(b'huge'), self._cachedProject(byteSize=101))
+
+        self.assertIsNone(projectCache.get(self._key(b'huge')), 'Never kept')
+        self.assertIsNotNone(projectCache.get(self._key(b'a')), 'Nothing evicted for it')
+
+    def testReplaceKeepsByteCount(self):
+        projectCache: ProjectCache = ProjectCache()
+
+        projectCache.put(self._key(b'a'), self._cachedProject(byteSize=10))
+        projectCache.put(self._key(b'a'), self._cachedProject(byteSize=30))
+
+        self.assertEqual(30, projectCache.byteSize, 'The old entry is no longer counted')
+
+    def testClear(self):
+        projectCache: ProjectCache = ProjectCache()
+
+        projectCache.put(self._key(b'a'), self._cachedProject(byteSize=10))
+        projectCache.clear()
+
+        self.assertEqual(0, len(projectCache),      'Empty')
+        self.assertEqual(0, projectCache.byteSize, 'No bytes')
+
+    def _key(self, rawBytes: bytes) -> CacheKey:
+        return ProjectCache.contentKey(rawBytes=rawBytes)
+
+    def _cachedProject(self, byteSize: int) -> CachedProject:
+        return CachedProject(projectNode=('PyutProject', {}, '', ()), documentNodes=[], byteSize=byteSize)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
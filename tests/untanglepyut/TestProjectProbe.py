@@ -0,0 +1,100 @@
+
+from typing import List
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.ProjectProbe import ProbedDocument
+from untanglepyut.ProjectProbe import ProbedProject
+from untanglepyut.ProjectProbe import ProjectProbe
+from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestProjectProbe(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+        self._projectProbe: ProjectProbe = ProjectProbe()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testBadFileName(self):
+        with self.assertRaises(UnsupportedFileTypeException):
+            self._projectProbe.probe(fqFileName='HokeyXmlFileName.opie')
+
+    def testNotAPyutProject(self):
+        with TemporaryDirectory() as temporaryDirectory:
+            fqFileName: str = osPath.join(temporaryDirectory, 'NotAProject.xml')
+            with open(fqFileName, 'w') as xmlFile:
+                xmlFile.write('<?xml version="1.0" ?><SomethingElse version="10"/>')
+
+            with self.assertRaises(UnsupportedFileTypeException):
+                self._projectProbe.probe(fqFileName=fqFileName)
+
+    def testV10Header(self):
+        self._testHeader(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='EmptyDiagram.xml', expectedVersion='10')
+
+    def testV11Header(self):
+        self._testHeader(package=ProjectTestBase.V11_TEST_FILES_PACKAGE_NAME, fileName='EmptyDiagram.xml', expectedVersion='11')
+
+    def testCompressedHeader(self):
+        self._testHeader(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='MultiDocumentProject.put', expectedVersion='10')
+
+    def testCodePath(self):
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                            fileName='ScaffoldDiagram.xml')
+
+        probedProject: ProbedProject = self._projectProbe.probe(fqFileName=fqFileName)
+
+        self.assertEqual('/Users/humberto.a.sanchez.ii/PycharmProjects/PyUt/src', probedProject.codePath, 'Mismatched code path')
+
+    def testCatalogue(self):
+        self._testCatalogue(fileName='MultiDocumentProject.xml')
+
+    def testCompressedCatalogue(self):
+        self._testCatalogue(fileName='MultiDocumentProject.put')
+
+    def _testHeader(self, package: str, fileName: str, expectedVersion: str):
+
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=package, fileName=fileName)
+
+        probedProject: ProbedProject = self._projectProbe.probe(fqFileName=fqFileName)
+
+        self.assertEqual(fqFileName,      probedProject.fileName, 'Mismatched file name')
+        self.assertEqual(expectedVersion, probedProject.version,  'Mismatched version')
+        self.assertIsNone(probedProject.documents, 'Documents are only listed when catalogued')
+
+    def _testCatalogue(self, fileName: str):
+
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=fileName)
+
+        probedProject: ProbedProject = self._projectProbe.probe(fqFileName=fqFileName, catalogue=True)
+
+        expectedDocuments: List[ProbedDocument] = [
+            ProbedDocument(documentTitle='Diagram-1', documentType='CLASS_DIAGRAM'),
+            ProbedDocument(documentTitle='Diagram-2', documentType='CLASS_DIAGRAM'),
+        ]
+        self.assertEqual('10',              probedProject.version,   'Mismatched version')
+        self.assertEqual(expectedDocuments, probedProject.documents, 'Mismatched catalogue')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestProjectProbe))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,115 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untangle import Element
+
+from untanglepyut.IndexedDocument import IndexedDocument
+from untanglepyut.PyutDocumentStream import PyutDocumentStream
+
+from tests.ProjectTestBase import DIAGRAM_NAME_1
+from tests.ProjectTestBase import DIAGRAM_NAME_2
+from tests.ProjectTestBase import TEST_XML_FILENAME
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestPyutDocumentStream(ProjectTestBase):
+    """
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName=TEST_XML_FILENAME)
+        with open(fqFileName, 'rb') as xmlFile:
+            self._rawXml: bytes = xmlFile.read()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testDocumentsInOrder(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream()
+        titles:         List[str]          = [pyutDocument['title'] for pyutDocument in documentStream.documents(xmlChunks=[self._rawXml])]
+
+        self.assertEqual([DIAGRAM_NAME_1, DIAGRAM_NAME_2], titles, 'Documents out of order or missing')
+
+    def testProjectAttributes(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream()
+        for _ in documentStream.documents(xmlChunks=[self._rawXml]):
+            pass
+
+        pyutProject: Element = documentStream.pyutProject
+        self.assertEqual('10', pyutProject['version'], 'Mismatched XML version')
+        self.assertEqual('',   pyutProject['CodePath'], 'Mismatched code path')
+
+    def testDocumentsDetachedFromProject(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream()
+        for _ in documentStream.documents(xmlChunks=[self._rawXml]):
+            self.assertEqual(0, len(documentStream.pyutProject.children), 'Project should never hold a document')
+
+    def testSmallChunks(self):
+
+        chunkSize: int         = 7
+        chunks:    List[bytes] = [self._rawXml[i:i + chunkSize] for i in range(0, len(self._rawXml), chunkSize)]
+
+        documentStream: PyutDocumentStream    = PyutDocumentStream()
+        pyutDocuments:  List[IndexedDocument] = list(documentStream.documents(xmlChunks=chunks))
+
+        self.assertEqual(2, len(pyutDocuments), 'Chunking should not change the result')
+
+        graphicClasses: List[Element] = pyutDocuments[1].get_elements('GraphicClass')
+        self.assertEqual(7, len(graphicClasses), 'Incorrect number of classes in the second document')
+
+    def testDocumentsIndexed(self):
+
+        documentStream: PyutDocumentStream    = PyutDocumentStream()
+        pyutDocuments:  List[IndexedDocument] = list(documentStream.documents(xmlChunks=[self._rawXml]))
+
+        for pyutDocument in pyutDocuments:
+            for tagName, elements in pyutDocument.tagIndex.items():
+                self.assertEqual(pyutDocument.pyutDocument.get_elements(tagName), elements, f'Index for {tagName} does not match a scan')
+
+        self.assertEqual(7, len(pyutDocuments[1].get_elements('GraphicClass')), 'Indexed lookup misses classes')
+
+    def testCatalogueNotIndexed(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream(skipDocumentContent=True)
+        for pyutDocument in documentStream.documents(xmlChunks=[self._rawXml]):
+            self.assertEqual(0, len(pyutDocument.tagIndex), 'Skipped content should not be indexed')
+
+    def testDocumentEnds(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream(skipDocumentContent=True)
+        for _ in documentStream.documents(xmlChunks=[self._rawXml]):
+            pass
+
+        for start, end in zip(documentStream.documentOffsets, documentStream.documentEnds):
+            self.assertTrue(self._rawXml[start:end].startswith(b'<PyutDocument'), 'Should start at the start tag')
+            self.assertTrue(self._rawXml[end:].startswith(b'</PyutDocument>'),   'Should end at the end tag')
+
+    def testNoPyutProject(self):
+
+        documentStream: PyutDocumentStream = PyutDocumentStream()
+        self.assertIsNone(documentStream.pyutProject, 'Should be uninitialized')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPyutDocumentStream))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
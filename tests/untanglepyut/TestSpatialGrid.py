@@ -0,0 +1,73 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.SpatialGrid import SpatialGrid
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestSpatialGrid(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._spatialGrid: SpatialGrid[str] = SpatialGrid[str](cellSize=100)
+
+        self._spatialGrid.insert('small',   x=10,  y=10,  width=50,  height=50)
+        self._spatialGrid.insert('wide',    x=0,   y=150, width=350, height=40)
+        self._spatialGrid.insert('faraway', x=900, y=900, width=50,  height=50)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testPointInOneItem(self):
+        self.assertIn('small', self._spatialGrid.candidates(x=20, y=20), 'Should find the item under the point')
+
+    def testOnlyNearbyCandidates(self):
+        candidates: List[str] = self._spatialGrid.candidates(x=20, y=20)
+
+        self.assertNotIn('faraway', candidates, 'Items in other cells are never looked at')
+        self.assertNotIn('wide',    candidates, 'Items in other cells are never looked at')
+
+    def testItemSpansCells(self):
+        for x in (5, 150, 349):
+            self.assertIn('wide', self._spatialGrid.candidates(x=x, y=170), f'Every cell under the box should hold it {x=}')
+
+    def testEdgesAreInclusive(self):
+        self.assertIn('wide', self._spatialGrid.candidates(x=350, y=190), 'A lollipop sits on the edge of its class')
+
+    def testEmptyCell(self):
+        self.assertEqual([], self._spatialGrid.candidates(x=500, y=500), 'Nothing there')
+
+    def testNegativeSize(self):
+        spatialGrid: SpatialGrid[str] = SpatialGrid[str](cellSize=100)
+
+        spatialGrid.insert('flipped', x=250, y=250, width=-200, height=-200)
+
+        self.assertIn('flipped', spatialGrid.candidates(x=60, y=60), 'The box should be normalized')
+
+    def testInsertionOrder(self):
+        spatialGrid: SpatialGrid[str] = SpatialGrid[str](cellSize=100)
+
+        spatialGrid.insert('first',  x=0, y=0, width=50, height=50)
+        spatialGrid.insert('second', x=0, y=0, width=50, height=50)
+
+        self.assertEqual(['first', 'second'], spatialGrid.candidates(x=10, y=10), 'Callers rely on insertion order for the first match')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpatialGrid))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
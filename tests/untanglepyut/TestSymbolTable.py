@@ -0,0 +1,72 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untanglepyut.ModelTypes import DocumentTitle
+
+from untanglepyut.SymbolTable import Symbol
+from untanglepyut.SymbolTable import SymbolTable
+
+from tests.ProjectTestBase import ProjectTestBase
+
+DIAGRAM_A: DocumentTitle = DocumentTitle('Diagram-A')
+DIAGRAM_B: DocumentTitle = DocumentTitle('Diagram-B')
+
+
+class TestSymbolTable(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+        self._symbolTable: SymbolTable[str] = SymbolTable()
+
+        self._symbolTable.add(DIAGRAM_A, pyutId=1, symbol='A.Foo', name='Foo')
+        self._symbolTable.add(DIAGRAM_A, pyutId=2, symbol='A.Note')
+        self._symbolTable.add(DIAGRAM_B, pyutId=1, symbol='B.Bar', name='Bar')
+        self._symbolTable.add(DIAGRAM_B, pyutId=7, symbol='B.Foo', name='Foo')
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testById(self):
+        self.assertEqual([Symbol(DIAGRAM_A, 'A.Foo'), Symbol(DIAGRAM_B, 'B.Bar')], self._symbolTable.byId(1), 'Entries in untangle order')
+        self.assertEqual([], self._symbolTable.byId(42), 'Unknown id')
+
+    def testByName(self):
+        self.assertEqual([Symbol(DIAGRAM_A, 'A.Foo'), Symbol(DIAGRAM_B, 'B.Foo')], self._symbolTable.byName('Foo'))
+        self.assertEqual([], self._symbolTable.byName('A.Note'), 'Unnamed objects are only filed by id')
+
+    def testDocumentsContaining(self):
+        self.assertEqual([DIAGRAM_A, DIAGRAM_B], self._symbolTable.documentsContaining('Foo'))
+        self.assertEqual([DIAGRAM_B],            self._symbolTable.documentsContaining('Bar'))
+
+    def testReusedIds(self):
+        self.assertEqual([1], list(self._symbolTable.reusedIds().keys()), 'Only id 1 is in both documents')
+
+    def testRemoveDocument(self):
+        self._symbolTable.removeDocument(DIAGRAM_A)
+
+        self.assertEqual([Symbol(DIAGRAM_B, 'B.Bar')], self._symbolTable.byId(1))
+        self.assertEqual([],  self._symbolTable.byId(2),  'The note went with its document')
+        self.assertEqual([DIAGRAM_B], self._symbolTable.documentsContaining('Foo'))
+        self.assertEqual(2, len(self._symbolTable))
+
+    def testRemoveUnknownDocument(self):
+        self._symbolTable.removeDocument(DocumentTitle('Never Seen'))
+
+        self.assertEqual(4, len(self._symbolTable), 'Nothing removed')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSymbolTable))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,101 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from os.path import join as osPathJoin
+
+from tempfile import TemporaryDirectory
+
+from zlib import compress
+from zlib import decompress
+
+from untanglepyut.UnTangleIO import UnTangleIO
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestUnTangleIO(ProjectTestBase):
+    """
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self._fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                                  fileName='MultiDocumentProject.put')
+        with open(self._fqFileName, 'rb') as compressedFile:
+            self._expectedXml: bytes = decompress(compressedFile.read())
+
+        self._saveChunkSize: int = UnTangleIO.CHUNK_SIZE
+
+    def tearDown(self):
+        super().tearDown()
+        UnTangleIO.CHUNK_SIZE = self._saveChunkSize
+
+    def testDecompressedChunks(self):
+
+        UnTangleIO.CHUNK_SIZE = 64
+
+        unTangleIO: UnTangleIO  = UnTangleIO()
+        xmlChunks:  List[bytes] = list(unTangleIO.decompressedChunks(fqFileName=self._fqFileName))
+
+        self.assertGreater(len(xmlChunks), 1, 'Should have streamed more than one chunk')
+        self.assertEqual(self._expectedXml, b''.join(xmlChunks), 'Chunks do not add up to the document')
+
+    def testDecompressedChunksBounded(self):
+
+        UnTangleIO.CHUNK_SIZE = 4096
+
+        expectedXml: bytes = b'<PyutProject>' + b' ' * (1024 * 1024) + b'</PyutProject>'
+
+        with TemporaryDirectory() as temporaryDirectory:
+            fqFileName: str = osPathJoin(temporaryDirectory, 'Spaces.put')
+            with open(fqFileName, 'wb') as compressedFile:
+                compressedFile.write(compress(expectedXml))
+
+            unTangleIO: UnTangleIO  = UnTangleIO()
+            xmlChunks:  List[bytes] = list(unTangleIO.decompressedChunks(fqFileName=fqFileName))
+
+        self.assertLessEqual(max(len(xmlChunk) for xmlChunk in xmlChunks), 4096, 'A small compressed chunk should not inflate past the chunk size')
+        self.assertEqual(expectedXml, b''.join(xmlChunks), 'Chunks do not add up to the document')
+
+    def testMappedXmlChunks(self):
+
+        UnTangleIO.CHUNK_SIZE = 64
+
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                            fileName='MultiDocumentProject.xml')
+        with open(fqFileName, 'rb') as xmlFile:
+            expectedXml: bytes = xmlFile.read()
+
+        unTangleIO: UnTangleIO  = UnTangleIO()
+        xmlChunks:  List[bytes] = [bytes(xmlChunk) for xmlChunk in unTangleIO.mappedXmlChunks(fqFileName=fqFileName)]
+
+        self.assertGreater(len(xmlChunks), 1, 'Should have mapped more than one chunk')
+        self.assertEqual(expectedXml, b''.join(xmlChunks), 'Chunks do not add up to the document')
+
+    def testDecompressFile(self):
+
+        unTangleIO: UnTangleIO = UnTangleIO()
+        xmlString:  str        = unTangleIO.decompressFile(fqFileName=self._fqFileName)
+
+        self.assertEqual(self._expectedXml.decode(), xmlString, 'Decompression mismatch')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestUnTangleIO))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -65,6 +65,50 @@ class TestUnTangler(ProjectTestBase):
         self.assertEqual(pyutInterface1.name, pyutInterface2.name, 'Names should match')
         self.assertEqual(pyutInterface1.id,   pyutInterface2.id,   'IDs should match')
 
+    def testDetectXmlVersion(self):
+
+        untangler: UnTangler = UnTangler()
+
+        for package, fileName, expectedVersion in [
+            (ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, 'MultiLinkDocument.put', XmlVersion.V10),
+            (ProjectTestBase.V11_TEST_FILES_PACKAGE_NAME, 'LollipopInterfaceMultiImplementor.xml', XmlVersion.V11),
+            (ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, 'MultiLineNote.xml', XmlVersion.V10),
+        ]:
+            fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=package, fileName=fileName)
+
+            untangler.untangleFile(fqFileName=fqFileName)
+            self.assertEqual(expectedVersion, untangler.xmlVersion, f'Wrong version detected for {fileName}')
+
+        self.assertEqual(3, len(untangler.documents), 'One untangler should handle every version')
+
+    def testDetectXmlVersionLazily(self):
+
+        fqFileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                         fileName='MultiDocumentProject.xml')
+        untangler: UnTangler = UnTangler(lazy=True)
+
+        untangler.untangleFile(fqFileName=fqFileName)
+
+        self.assertEqual(XmlVersion.V10, untangler.xmlVersion, 'Version should be detected before any document is untangled')
+        self.assertEqual(4, len(untangler.documents[DocumentTitle('Diagram-1')].oglClasses), 'Mismatched class count')
+
+    def testLazyDocumentsKeepTheirVersion(self):
+
+        v10FileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                          fileName='MultiDocumentProject.xml')
+        v11FileName: str = UnitTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V11_TEST_FILES_PACKAGE_NAME,
+                                                                          fileName='LollipopInterfaceMultiImplementor.xml')
+        untangler: UnTangler = UnTangler(lazy=True)
+
+        untangler.untangleFile(fqFileName=v10FileName)
+        v10Documents: Documents = untangler.documents
+
+        untangler.untangleFile(fqFileName=v11FileName)
+        self.assertEqual(XmlVersion.V11, untangler.xmlVersion, 'Should follow the last file')
+
+        self.assertEqual(4, len(v10Documents[DocumentTitle('Diagram-1')].oglClasses),   'Untangled with the V10 schema')
+        self.assertEqual(2, len(untangler.documents[DocumentTitle('SampleIFace')].oglLinks), 'Untangled with the V11 schema')
+
 
 def suite() -> TestSuite:
     import unittest
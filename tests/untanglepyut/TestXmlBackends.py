@@ -0,0 +1,248 @@
+
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import cast
+
+from importlib.resources import files
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from defusedxml.common import EntitiesForbidden
+
+from untangle import Element
+
+from untanglepyut.IndexedDocument import IndexedDocument
+
+from untanglepyut.Types import Document
+from untanglepyut.Types import Documents
+
+from untanglepyut.UnTangleIO import UnTangleIO
+from untanglepyut.UnTangler import UnTangler
+from untanglepyut.UnsupportedFileTypeException import UnsupportedFileTypeException
+
+from untanglepyut.XmlBackend import DocumentStream
+from untanglepyut.XmlBackend import XmlBackendType
+from untanglepyut.XmlBackend import XmlElement
+
+from untanglepyut.XmlVersion import XmlVersion
+
+from tests.ProjectTestBase import ProjectTestBase
+
+SUITE_PACKAGES: Dict[XmlVersion, str] = {
+    XmlVersion.V10: ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+    XmlVersion.V11: ProjectTestBase.V11_TEST_FILES_PACKAGE_NAME,
+}
+#
+# These parse but do not untangle;  They were written with displayParameters="Display", which
+# PyutDisplayParameters no longer accepts
+#
+UNLOADABLE_FILES: Set[str] = {'MultiDocumentProject.put', 'SingleClassDocumentV11.xml'}
+
+ENTITY_PROJECT: bytes = (
+    b'<?xml version="1.0" encoding="iso-8859-1"?>'
+    b'<!DOCTYPE PyutProject [<!ENTITY lol "lol">]>'
+    b'<PyutProject version="11" CodePath="">'
+    b'<PyutDocument type="CLASS_DIAGRAM" title="&lol;" scrollPositionX="0" scrollPositionY="0" pixelsPerUnitX="20" pixelsPerUnitY="20" />'
+    b'</PyutProject>'
+)
+
+
+class TestXmlBackends(ProjectTestBase):
+    """
+    The conformance suite;  Every available backend must hand the untanglers the same
+    elements as `untangle` does for every test resource
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        self._unTangleIO: UnTangleIO = UnTangleIO()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testUntangleAlwaysAvailable(self):
+        self.assertIn(XmlBackendType.UNTANGLE,     XmlBackendType.availableBackends(), 'untangle is a hard dependency')
+        self.assertIn(XmlBackendType.ELEMENT_TREE, XmlBackendType.availableBackends(), 'ElementTree is in the standard library')
+
+    def testFastestBackendAvailable(self):
+        self.assertIn(XmlBackendType.fastestBackend(), XmlBackendType.availableBackends(), 'Fastest backend must be usable')
+
+    def testElementsConform(self):
+
+        for xmlVersion, fqFileName in self._resourceFiles():
+            expectedDocuments: List[IndexedDocument] = self._parseDocuments(XmlBackendType.UNTANGLE, fqFileName=fqFileName)
+            for backendType in XmlBackendType.availableBackends():
+                with self.subTest(backend=backendType, fileName=fqFileName):
+                    actualDocuments: List[IndexedDocument] = self._parseDocuments(backendType, fqFileName=fqFileName)
+
+                    self.assertEqual(len(expectedDocuments), len(actualDocuments), 'Mismatched document count')
+                    for expected, actual in zip(expectedDocuments, actualDocuments):
+                        self._assertSameElement(expected=cast(Element, expected.pyutDocument), actual=actual)
+
+    def testTagIndexConforms(self):
+
+        for xmlVersion, fqFileName in self._resourceFiles():
+            for backendType in XmlBackendType.availableBackends():
+                with self.subTest(backend=backendType, fileName=fqFileName):
+                    for indexedDocument in self._parseDocuments(backendType, fqFileName=fqFileName):
+                        children: List[XmlElement] = indexedDocument.pyutDocument.get_elements()
+
+                        self.assertEqual(len(children), sum(len(elements) for elements in indexedDocument.tagIndex.values()), 'Every child must be indexed')
+                        for tagName, elements in indexedDocument.tagIndex.items():
+                            self.assertEqual(len(indexedDocument.pyutDocument.get_elements(tagName)), len(elements), f'Mismatched {tagName} count')
+                        self.assertEqual([], indexedDocument.get_elements('NoSuchTag'), 'Unknown tags have no elements')
+
+    def testProjectConforms(self):
+
+        for xmlVersion, fqFileName in self._resourceFiles():
+            expectedProject: XmlElement = self._parseProject(XmlBackendType.UNTANGLE, fqFileName=fqFileName)
+            for backendType in XmlBackendType.availableBackends():
+                with self.subTest(backend=backendType, fileName=fqFileName):
+                    actualProject: XmlElement = self._parseProject(backendType, fqFileName=fqFileName)
+
+                    self.assertEqual(expectedProject['version'],  actualProject['version'],  'Mismatched project version')
+                    self.assertEqual(expectedProject['CodePath'], actualProject['CodePath'], 'Mismatched code path')
+                    self.assertEqual(0, len(actualProject.get_elements()), 'Project should never hold a document')
+
+    def testUnTanglerConforms(self):
+
+        for xmlVersion, fqFileName in self._resourceFiles():
+            if self._isUnloadable(fqFileName=fqFileName):
+                continue
+            expectedDocuments: Documents = self._untangle(xmlVersion, XmlBackendType.UNTANGLE, fqFileName=fqFileName)
+            for backendType in XmlBackendType.availableBackends():
+                with self.subTest(backend=backendType, fileName=fqFileName):
+                    actualDocuments: Documents = self._untangle(xmlVersion, backendType, fqFileName=fqFileName)
+
+                    self.assertEqual(list(expectedDocuments.keys()), list(actualDocuments.keys()), 'Mismatched document titles')
+                    for documentTitle in expectedDocuments.keys():
+                        self._assertSameDocument(expected=expectedDocuments[documentTitle], actual=actualDocuments[documentTitle])
+
+    def testUnloadableFilesFail(self):
+
+        for xmlVersion, fqFileName in self._resourceFiles():
+            if self._isUnloadable(fqFileName=fqFileName) is False:
+                continue
+            for backendType in XmlBackendType.availableBackends():
+                with self.subTest(backend=backendType, fileName=fqFileName):
+                    with self.assertRaises(ValueError):
+                        self._untangle(xmlVersion, backendType, fqFileName=fqFileName)
+
+    def testEntityDeclarationsForbidden(self):
+
+        for backendType in XmlBackendType.availableBackends():
+            with self.subTest(backend=backendType):
+                documentStream: DocumentStream = backendType.createDocumentStream()
+                with self.assertRaises(EntitiesForbidden):
+                    list(documentStream.documents(xmlChunks=[ENTITY_PROJECT]))
+
+    def testNotAPyutProject(self):
+
+        for backendType in XmlBackendType.availableBackends():
+            with self.subTest(backend=backendType):
+                documentStream: DocumentStream = backendType.createDocumentStream()
+                with self.assertRaises(UnsupportedFileTypeException):
+                    list(documentStream.documents(xmlChunks=[b'<?xml version="1.0" ?><SomethingElse version="10"/>']))
+
+    def testEntityDeclarationsForbiddenAcrossChunks(self):
+
+        xmlChunks: List[bytes] = [ENTITY_PROJECT[start:start + 7] for start in range(0, len(ENTITY_PROJECT), 7)]
+        for backendType in XmlBackendType.availableBackends():
+            with self.subTest(backend=backendType):
+                documentStream: DocumentStream = backendType.createDocumentStream()
+                with self.assertRaises(EntitiesForbidden):
+                    list(documentStream.documents(xmlChunks=xmlChunks))
+
+    def _isUnloadable(self, fqFileName: str) -> bool:
+        return any(fqFileName.endswith(fileName) for fileName in UNLOADABLE_FILES)
+
+    def _resourceFiles(self) -> Iterator[Tuple[XmlVersion, str]]:
+
+        for xmlVersion, packageName in SUITE_PACKAGES.items():
+            for traversable in sorted(files(packageName).iterdir(), key=lambda t: t.name):
+                if traversable.name.endswith('.xml') or traversable.name.endswith('.put'):
+                    yield xmlVersion, str(traversable)
+
+    def _xmlChunks(self, fqFileName: str) -> Iterator[bytes]:
+
+        if fqFileName.endswith('.put'):
+            return self._unTangleIO.decompressedChunks(fqFileName=fqFileName)
+        else:
+            return self._unTangleIO.mappedXmlChunks(fqFileName=fqFileName)
+
+    def _parseDocuments(self, backendType: XmlBackendType, fqFileName: str) -> List[IndexedDocument]:
+
+        documentStream: DocumentStream = backendType.createDocumentStream()
+
+        return cast(List[IndexedDocument], list(documentStream.documents(xmlChunks=self._xmlChunks(fqFileName=fqFileName))))
+
+    def _parseProject(self, backendType: XmlBackendType, fqFileName: str) -> XmlElement:
+
+        documentStream: DocumentStream = backendType.createDocumentStream()
+        for _ in documentStream.documents(xmlChunks=self._xmlChunks(fqFileName=fqFileName)):
+            pass
+
+        return documentStream.pyutProject
+
+    def _untangle(self, xmlVersion: XmlVersion, backendType: XmlBackendType, fqFileName: str) -> Documents:
+
+        untangler: UnTangler = UnTangler(xmlVersion=xmlVersion, backendType=backendType)
+        untangler.untangleFile(fqFileName=fqFileName)
+
+        return untangler.documents
+
+    def _assertSameElement(self, expected: Element, actual: XmlElement):
+        """
+        Only uses the XmlElement protocol on the actual element;  The expected one is always
+        an `untangle` Element
+        """
+        for attributeName, attributeValue in expected._attributes.items():
+            self.assertEqual(attributeValue, actual[attributeName], f'Mismatched attribute {attributeName} on {expected._name}')
+        self.assertIsNone(actual['noSuchAttribute'], 'Missing attributes must be None')
+
+        self.assertEqual(expected.cdata, actual.cdata, f'Mismatched cdata on {expected._name}')
+
+        expectedChildren: List[Element]    = expected.get_elements()
+        actualChildren:   List[XmlElement] = actual.get_elements()
+        self.assertEqual(len(expectedChildren), len(actualChildren), f'Mismatched children on {expected._name}')
+
+        for expectedChild, actualChild in zip(expectedChildren, actualChildren):
+            self.assertEqual(len(expected.get_elements(expectedChild._name)), len(actual.get_elements(expectedChild._name)), 'Mismatched children by name')
+            self._assertSameElement(expected=expectedChild, actual=actualChild)
+
+    def _assertSameDocument(self, expected: Document, actual: Document):
+
+        self.assertEqual(expected.documentType,    actual.documentType,    'Mismatched document type')
+        self.assertEqual(expected.scrollPositionX, actual.scrollPositionX, 'Mismatched scroll position')
+        self.assertEqual(expected.pixelsPerUnitX,  actual.pixelsPerUnitX,  'Mismatched pixels per unit')
+
+        self.assertEqual([oglClass.pyutObject.name for oglClass in expected.oglClasses],
+                         [oglClass.pyutObject.name for oglClass in actual.oglClasses], 'Mismatched classes')
+        self.assertEqual(len(expected.oglLinks),       len(actual.oglLinks),       'Mismatched link count')
+        self.assertEqual(len(expected.oglNotes),       len(actual.oglNotes),       'Mismatched note count')
+        self.assertEqual(len(expected.oglTexts),       len(actual.oglTexts),       'Mismatched text count')
+        self.assertEqual(len(expected.oglActors),      len(actual.oglActors),      'Mismatched actor count')
+        self.assertEqual(len(expected.oglUseCases),    len(actual.oglUseCases),    'Mismatched use case count')
+        self.assertEqual(len(expected.oglSDInstances), len(actual.oglSDInstances), 'Mismatched instance count')
+        self.assertEqual(len(expected.oglSDMessages),  len(actual.oglSDMessages),  'Mismatched message count')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestXmlBackends))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,96 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from untangle import Element
+
+from untanglepyut.XmlSchema import XmlSchema
+from untanglepyut.XmlVersion import XmlVersion
+
+from tests.ProjectTestBase import ProjectTestBase
+
+
+class TestXmlSchema(ProjectTestBase):
+    """
+    """
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSchemaShared(self):
+        self.assertIs(XmlSchema.forVersion(XmlVersion.V10), XmlSchema.forVersion(XmlVersion.V10), 'There should only be one schema per version')
+        self.assertIs(XmlSchema.forVersion(XmlVersion.V11), XmlSchema.forVersion(XmlVersion.V11), 'There should only be one schema per version')
+
+    def testSchemaVersion(self):
+        for xmlVersion in XmlVersion:
+            self.assertEqual(xmlVersion, XmlSchema.forVersion(xmlVersion).xmlVersion, 'Wrong schema')
+
+    def testV10FieldAttributes(self):
+
+        fieldElement: Element = Element('Field', {'visibility': 'PRIVATE'})
+        fieldElement.add_child(Element('Param', {'name': 'counter', 'type': 'int'}))
+
+        schema: XmlSchema = XmlSchema.forVersion(XmlVersion.V10)
+
+        self.assertEqual(('counter', 'int', ''), schema.fieldAttributes(fieldElement), 'A missing default value should be empty')
+
+    def testV11FieldAttributes(self):
+
+        fieldElement: Element = Element('PyutField', {'name': 'counter', 'type': 'int', 'defaultValue': '0'})
+
+        schema: XmlSchema = XmlSchema.forVersion(XmlVersion.V11)
+
+        self.assertEqual(('counter', 'int', '0'), schema.fieldAttributes(fieldElement), 'Mismatched field attributes')
+
+    def testV10NoReturnType(self):
+
+        methodElement: Element = Element('Method', {'name': 'doIt'})
+
+        schema: XmlSchema = XmlSchema.forVersion(XmlVersion.V10)
+
+        self.assertIsNone(schema.methodReturnType(methodElement), 'V10 methods without a Return element have no return type')
+
+    def testV10ReturnType(self):
+
+        methodElement: Element = Element('Method', {'name': 'doIt'})
+        methodElement.add_child(Element('Return', {'type': 'str'}))
+
+        schema: XmlSchema = XmlSchema.forVersion(XmlVersion.V10)
+
+        self.assertEqual('str', schema.methodReturnType(methodElement), 'Mismatched return type')
+
+    def testV11ReturnType(self):
+
+        methodElement: Element = Element('PyutMethod', {'name': 'doIt', 'returnType': 'float'})
+
+        schema: XmlSchema = XmlSchema.forVersion(XmlVersion.V11)
+
+        self.assertEqual('float', schema.methodReturnType(methodElement), 'Mismatched return type')
+
+    def testLinkAnchors(self):
+
+        v10Link: Element = Element('GraphicLink', {'srcX': '1', 'srcY': '2', 'dstX': '3', 'dstY': '4'})
+        v11Link: Element = Element('OglLink', {'sourceAnchorX': '1', 'sourceAnchorY': '2', 'destinationAnchorX': '3', 'destinationAnchorY': '4'})
+
+        expected: List[str] = ['1', '2', '3', '4']
+
+        self.assertEqual(expected, list(XmlSchema.forVersion(XmlVersion.V10).linkAnchors(v10Link)), 'Mismatched V10 anchors')
+        self.assertEqual(expected, list(XmlSchema.forVersion(XmlVersion.V11).linkAnchors(v11Link)), 'Mismatched V11 anchors')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestXmlSchema))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
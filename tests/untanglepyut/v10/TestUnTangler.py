@@ -11,9 +11,13 @@ from importlib.resources import files
 
 from os import linesep as osLineSep
 
+from tempfile import TemporaryDirectory
+
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
+from unittest.mock import patch
+
 from miniogl.ControlPoint import ControlPoint
 
 from ogl.OglClass import OglClass
@@ -33,21 +37,34 @@ from tests.ProjectTestBase import DIAGRAM_NAME_1
 from tests.ProjectTestBase import DIAGRAM_NAME_2
 from tests.ProjectTestBase import TEST_XML_FILENAME
 
+from untanglepyut.ModelTypes import DocumentChanges
+
 from untanglepyut.Types import Document
 from untanglepyut.Types import DocumentTitle
+from untanglepyut.Types import Documents
+from untanglepyut.Types import OglSDInstances
+from untanglepyut.Types import ProjectOglObject
 from untanglepyut.Types import UntangledOglClasses
 from untanglepyut.Types import UntangledOglLinks
 from untanglepyut.Types import UntangledOglNotes
 from untanglepyut.Types import UntangledOglTexts
 
+from untanglepyut.XmlBackend import XmlBackendType
 from untanglepyut.XmlVersion import XmlVersion
 
+from untanglepyut.LazyDocuments import LazyDocuments
+from untanglepyut.OglClassProxy import OglClassProxy
+from untanglepyut.ParseCache import ParseCache
+from untanglepyut.ProjectCache import ProjectCache
+from untanglepyut.SymbolTable import SymbolTable
 from untanglepyut.UnTangler import UnTangler
+from untanglepyut.UnTanglePyut import UnTanglePyut
 
 from tests.ProjectTestBase import ProjectTestBase
 
-ATM_DIAGRAM_NAME:   DocumentTitle = DocumentTitle('Class Diagram')
-SIMPLE_DIAGRAM_NAME: DocumentTitle = DocumentTitle('Simple')
+ATM_DIAGRAM_NAME:      DocumentTitle = DocumentTitle('Class Diagram')
+SIMPLE_DIAGRAM_NAME:   DocumentTitle = DocumentTitle('Simple')
+SEQUENCE_DIAGRAM_NAME: DocumentTitle = DocumentTitle('Sequence Diagram')
 
 
 class TestUnTangler(ProjectTestBase):
@@ -93,6 +110,102 @@ class TestUnTangler(ProjectTestBase):
         untangler.untangleXml(xmlString=rawXml, fqFileName=self._fqFileName)
         self.assertEqual(2, len(untangler.documents), 'Incorrect number of documents created')
 
+    def testUntangleCompressedFile(self):
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                            fileName='MultiLinkDocument.put')
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        untangler.untangleFile(fqFileName=fqFileName)
+
+        self.assertEqual(1, len(untangler.documents), 'Incorrect number of documents created')
+        self.assertEqual(7, len(untangler.documents[DocumentTitle('MultiLink')].oglClasses), 'Incorrect number of classes created')
+        self.assertEqual(fqFileName, untangler.projectInformation.fileName)
+
+    def testLazyDocumentsCatalogued(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10, lazy=True)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        lazyDocuments: LazyDocuments = cast(LazyDocuments, untangler.documents)
+
+        self.assertEqual(2, len(lazyDocuments), 'Incorrect number of documents catalogued')
+        self.assertFalse(lazyDocuments.isUntangled(DIAGRAM_NAME_2), 'Should not untangle until asked')
+        self.assertEqual('CLASS_DIAGRAM', lazyDocuments.documentInformation(DIAGRAM_NAME_2).documentType, 'Catalogue is wrong')
+        self.assertEqual('10', untangler.projectInformation.version)
+
+    def testLazyDocumentUntangledOnDemand(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10, lazy=True)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        lazyDocuments: LazyDocuments = cast(LazyDocuments, untangler.documents)
+        document:      Document      = lazyDocuments[DIAGRAM_NAME_2]
+
+        self.assertEqual(7, len(document.oglClasses), 'Incorrect number of classes created')
+        self.assertTrue(lazyDocuments.isUntangled(DIAGRAM_NAME_2), 'Should be remembered')
+        self.assertFalse(lazyDocuments.isUntangled(DIAGRAM_NAME_1), 'Only untangle what was asked for')
+
+    def testLazyCompressedFile(self):
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                            fileName='MultiLinkDocument.put')
+        untangler: UnTangler = UnTangler(XmlVersion.V10, lazy=True)
+
+        untangler.untangleFile(fqFileName=fqFileName)
+
+        self.assertEqual(['MultiLink'], list(untangler.documents.keys()), 'The decompressed XML should be catalogued')
+        self.assertEqual(7, len(untangler.documents[DocumentTitle('MultiLink')].oglClasses), 'Incorrect number of classes created')
+
+    def testLazySymbolTablePerLoad(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10, lazy=True)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        firstDocuments:   Documents                     = untangler.documents
+        firstSymbolTable: SymbolTable[ProjectOglObject] = untangler.symbolTable
+
+        untangler.untangleFile(fqFileName=ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                                             fileName='MultiLinkDocument.put'))
+        self.assertEqual(7, len(firstDocuments[DIAGRAM_NAME_2].oglClasses), 'Earlier documents still untangle')
+
+        self.assertEqual([DIAGRAM_NAME_2], firstSymbolTable.documentsContaining('Car'),      'Filed in the table of its own load')
+        self.assertEqual([],               untangler.symbolTable.documentsContaining('Car'), 'Never filed in a later load')
+
+    def testIterDocuments(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        documentTitles: List[DocumentTitle] = []
+        for document in untangler.iterDocuments(fqFileName=self._fqFileName):
+            self.assertEqual('10', untangler.projectInformation.version, 'Project information should be valid while iterating')
+            documentTitles.append(document.documentTitle)
+
+        self.assertEqual([DIAGRAM_NAME_1, DIAGRAM_NAME_2], documentTitles, 'Documents should come in file order')
+        self.assertEqual(0, len(untangler.documents), 'Iterated documents are not kept')
+
+    def testIterDocumentsStopEarly(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        for document in untangler.iterDocuments(fqFileName=self._fqFileName):
+            self.assertEqual(4, len(document.oglClasses), 'The first document should be fully untangled')
+            break
+
+    def testDeferOglClasses(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10, deferOglClasses=True)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        document: Document = untangler.documents[DIAGRAM_NAME_1]
+        self.assertEqual(4, len(document.oglClasses), 'Incorrect number of classes created')
+
+        for oglLink in document.oglLinks:
+            for shape in (oglLink.sourceShape, oglLink.destinationShape):
+                self.assertNotIsInstance(shape, OglClassProxy, 'Links hold the real shapes')
+
+        linkedClasses: List[OglClass] = [oglLink.sourceShape for oglLink in document.oglLinks] + [oglLink.destinationShape for oglLink in document.oglLinks]
+        for oglClass in document.oglClasses:
+            proxy: OglClassProxy = cast(OglClassProxy, oglClass)
+            if proxy.isMaterialized() is True:
+                self.assertIn(proxy.oglClass, linkedClasses, 'Only linked classes are built while untangling')
+
     def testControlPointsGenerated(self):
         fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME, fileName='ATM-Model.xml')
         untangler: UnTangler = UnTangler(XmlVersion.V10)
@@ -156,6 +269,132 @@ class TestUnTangler(ProjectTestBase):
             possibleNames: List[str] = ['File', 'Folder', 'Car', 'Wheel', 'Interface', 'Implementor', 'LollipopImplementor']
             self.assertIn(pyutClass.name, possibleNames, "I don't see that name")
 
+    def testClassesByName(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        document: Document = untangler.documents[DIAGRAM_NAME_2]
+        for oglClass in document.oglClasses:
+            pyutClass: PyutClass = oglClass.pyutObject
+            self.assertIs(oglClass, document.oglClassesByName[pyutClass.name][0], 'Name index should hold the same shapes')
+
+        self.assertEqual(len(document.oglClasses), sum(len(oglClasses) for oglClasses in document.oglClassesByName.values()), 'Every class indexed once')
+
+    def testProjectSymbolTable(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        self.assertEqual([DIAGRAM_NAME_2], untangler.symbolTable.documentsContaining('Car'), 'Car is only in the second diagram')
+        for symbol in untangler.symbolTable.byName('Car'):
+            self.assertIn(symbol.symbol, untangler.documents[symbol.documentTitle].oglClasses, 'The table holds the untangled shapes')
+
+    def testSequenceDiagramSymbolTable(self):
+        fqFileName: str = ProjectTestBase.getFullyQualifiedResourceFileName(package=ProjectTestBase.V10_TEST_FILES_PACKAGE_NAME,
+                                                                            fileName='SequenceDiagram.xml')
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        untangler.untangleFile(fqFileName=fqFileName)
+
+        oglSDInstances: OglSDInstances = untangler.documents[SEQUENCE_DIAGRAM_NAME].oglSDInstances
+        for instanceName in ['Instance1', 'Instance2']:
+            self.assertEqual([SEQUENCE_DIAGRAM_NAME], untangler.symbolTable.documentsContaining(instanceName), f'{instanceName} is filed by its instance name')
+            for symbol in untangler.symbolTable.byName(instanceName):
+                self.assertIn(symbol.symbol, oglSDInstances.values(), 'The table holds the untangled instances')
+
+    def testProjectCache(self):
+        projectCache: ProjectCache = ProjectCache()
+
+        firstUnTangler:  UnTangler = UnTangler(XmlVersion.V10, projectCache=projectCache)
+        secondUnTangler: UnTangler = UnTangler(XmlVersion.V10, projectCache=projectCache)
+
+        firstUnTangler.untangleFile(fqFileName=self._fqFileName)
+        secondUnTangler.untangleFile(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, projectCache.hits, 'The second untangle should reuse the parse')
+        self.assertEqual(list(firstUnTangler.documents.keys()), list(secondUnTangler.documents.keys()), 'Same documents')
+
+        firstClasses:  UntangledOglClasses = firstUnTangler.documents[DIAGRAM_NAME_1].oglClasses
+        secondClasses: UntangledOglClasses = secondUnTangler.documents[DIAGRAM_NAME_1].oglClasses
+        self.assertEqual(len(firstClasses), len(secondClasses), 'Same classes')
+        self.assertIsNot(firstClasses[0], secondClasses[0], 'Ogl objects are never shared')
+
+    def testProjectCacheSharedAcrossBackends(self):
+        projectCache: ProjectCache = ProjectCache()
+
+        UnTangler(XmlVersion.V10, projectCache=projectCache, backendType=XmlBackendType.UNTANGLE).untangleFile(fqFileName=self._fqFileName)
+        untangler: UnTangler = UnTangler(XmlVersion.V10, projectCache=projectCache, backendType=XmlBackendType.ELEMENT_TREE)
+
+        untangler.untangleFile(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, projectCache.hits, 'The packed form does not depend on the backend')
+        self.assertEqual(4, len(untangler.documents[DIAGRAM_NAME_1].oglClasses), 'Same classes')
+
+    def testParseCache(self):
+        with TemporaryDirectory() as cacheDirectory:
+            UnTangler(XmlVersion.V10, parseCache=ParseCache(cacheDirectory=cacheDirectory)).untangleFile(fqFileName=self._fqFileName)
+
+            parseCache: ParseCache = ParseCache(cacheDirectory=cacheDirectory)
+            untangler:  UnTangler  = UnTangler(XmlVersion.V10, parseCache=parseCache)
+
+            untangler.untangleFile(fqFileName=self._fqFileName)
+
+        self.assertEqual(1, parseCache.hits, 'A cold untangler should load the parse from disk')
+        self.assertEqual([DIAGRAM_NAME_1, DIAGRAM_NAME_2], list(untangler.documents.keys()), 'Same documents')
+        self.assertEqual(4, len(untangler.documents[DIAGRAM_NAME_1].oglClasses), 'Same classes')
+
+    def testComponentsReused(self):
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        with patch.object(UnTanglePyut, '__init__', autospec=True, side_effect=UnTanglePyut.__init__) as constructor:
+            untangler.untangleFile(fqFileName=self._fqFileName)
+            firstClasses: UntangledOglClasses = untangler.documents[DIAGRAM_NAME_1].oglClasses
+
+            untangler.untangleFile(fqFileName=self._fqFileName)
+            secondClasses: UntangledOglClasses = untangler.documents[DIAGRAM_NAME_1].oglClasses
+
+        self.assertEqual(0, constructor.call_count, 'Every document of every load should use the untangler built with the UnTangler')
+        self.assertEqual(len(firstClasses), len(secondClasses), 'Same classes')
+        self.assertIsNot(firstClasses[0], secondClasses[0],                    'Ogl objects are never shared')
+        self.assertIsNot(firstClasses[0].pyutObject, secondClasses[0].pyutObject, 'Nor are Pyut objects')
+
+    def testUntangleIncrementally(self):
+        with open(self._fqFileName) as xmlFile:
+            xmlString: str = xmlFile.read()
+
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+
+        firstChanges: DocumentChanges = untangler.untangleXmlIncrementally(xmlString=xmlString, fqFileName=self._fqFileName)
+        self.assertEqual([DIAGRAM_NAME_1, DIAGRAM_NAME_2], firstChanges.added, 'The first load adds every document')
+
+        diagram1: Document = untangler.documents[DIAGRAM_NAME_1]
+        diagram2: Document = untangler.documents[DIAGRAM_NAME_2]
+
+        editedXml:    str             = xmlString.replace('name="Car"', 'name="Truck"')
+        editChanges:  DocumentChanges = untangler.untangleXmlIncrementally(xmlString=editedXml, fqFileName=self._fqFileName)
+
+        self.assertEqual([DIAGRAM_NAME_1], editChanges.unchanged, 'Diagram-1 was not edited')
+        self.assertEqual([DIAGRAM_NAME_2], editChanges.rebuilt,   'Car is in Diagram-2')
+        self.assertIs(diagram1, untangler.documents[DIAGRAM_NAME_1],    'Unchanged documents are carried over')
+        self.assertIsNot(diagram2, untangler.documents[DIAGRAM_NAME_2], 'Edited documents are new')
+        self.assertEqual([DIAGRAM_NAME_2], untangler.symbolTable.documentsContaining('Truck'), 'The symbol table follows the edit')
+        self.assertEqual([],               untangler.symbolTable.documentsContaining('Car'),   'The symbol table follows the edit')
+
+    def testUntangleIncrementallyRemoves(self):
+        with open(self._fqFileName) as xmlFile:
+            xmlString: str = xmlFile.read()
+
+        untangler: UnTangler = UnTangler(XmlVersion.V10)
+        untangler.untangleXmlIncrementally(xmlString=xmlString, fqFileName=self._fqFileName)
+
+        renamedXml:      str             = xmlString.replace(f'title="{DIAGRAM_NAME_2}"', 'title="Renamed"')
+        documentChanges: DocumentChanges = untangler.untangleXmlIncrementally(xmlString=renamedXml, fqFileName=self._fqFileName)
+
+        self.assertEqual([DocumentTitle('Renamed')], documentChanges.added,   'A renamed document is new')
+        self.assertEqual([DIAGRAM_NAME_2],           documentChanges.removed, 'Its old title is gone')
+        self.assertNotIn(DIAGRAM_NAME_2, untangler.documents, 'Removed')
+
     def testPyuMethodsCreated(self):
 
         oglClasses: UntangledOglClasses = self._getOglClassesFromDocument(DIAGRAM_NAME_2)
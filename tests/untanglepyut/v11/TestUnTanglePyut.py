@@ -208,6 +208,19 @@ class TestUnTanglePyut(ProjectTestBase):
         self._checkParameters(methodDictionary)
         self._checkFields(pyutClass=pyutClass)
 
+    def testSharedReturnTypes(self):
+        root:     Element = parse(V11_PYUT_CLASS)
+        oglClass: Element = root.OglClass
+
+        untanglepyut: UnTanglePyut = UnTanglePyut(xmlVersion=XmlVersion.V11)
+
+        firstClass:  PyutClass = untanglepyut.classToPyutClass(graphicClass=oglClass)
+        secondClass: PyutClass = untanglepyut.classToPyutClass(graphicClass=oglClass)
+
+        self.assertIsNot(firstClass.methods[0], secondClass.methods[0], 'Methods are never shared')
+        self.assertIs(firstClass.methods[0].returnType, secondClass.methods[0].returnType, 'Equal return types are one PyutType')
+        self.assertIs(firstClass.methods[3].returnType, firstClass.methods[4].returnType,  'Within a class too')
+
     def testPyutLinks(self):
         destinationPyutClass: PyutClass = self._getPyutClass(rawXml=V11_DESTINATION_PYUT_CLASS)
         sourcePyutClass:      PyutClass = self._getPyutClass(rawXml=V11_SOURCE_PYUT_CLASS)
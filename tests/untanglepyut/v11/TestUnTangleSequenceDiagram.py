@@ -7,9 +7,13 @@ from untangle import parse
 
 from tests.ProjectTestBase import ProjectTestBase
 
+from ogl.OglActor import OglActor
+
 from ogl.sd.OglSDInstance import OglSDInstance
 from ogl.sd.OglSDMessage import OglSDMessage
 
+from untanglepyut.LinkableObjectRegistry import LinkableObjectRegistry
+
 from untanglepyut.Types import OglSDInstances
 
 from untanglepyut.Types import OglSDMessages
@@ -101,6 +105,21 @@ class TestUnTangleSequenceDiagram(ProjectTestBase):
         self.assertEqual(1, len(oglActors), 'Oops not enough Uml Actors')
         self.assertEqual(1, len(oglLinks), 'Oops not enough association links')
 
+    def testShapesRegisteredAsCreated(self):
+
+        root:                    Element = parse(V11_SEQUENCE_DIAGRAM_WITH_ACTOR_LINKS)
+        sequenceDiagramDocument: Element = root.PyutDocument
+
+        linkableObjectRegistry:  LinkableObjectRegistry  = LinkableObjectRegistry()
+        unTangleSequenceDiagram: UnTangleSequenceDiagram = UnTangleSequenceDiagram(xmlVersion=XmlVersion.V11)
+
+        unTangleSequenceDiagram.unTangle(pyutDocument=sequenceDiagramDocument, linkableObjectRegistry=linkableObjectRegistry)
+
+        self.assertEqual(3, len(linkableObjectRegistry), 'One actor and two instances;  Messages are not shapes')
+        self.assertIsInstance(linkableObjectRegistry[3], OglActor, 'The actor shares id 3 with a message')
+        self.assertIs(unTangleSequenceDiagram.oglSDInstances[1], linkableObjectRegistry.oglSDInstances[1], 'The same instance the messages and links use')
+        self.assertNotIn(1, linkableObjectRegistry.linkableOglObjects, 'Instances are kept apart from the linkable shapes')
+
     def testOglSdMessage(self):
         unTangleSequenceDiagram: UnTangleSequenceDiagram = self._untangleSequenceDiagramDocument()
 